@@ -10,14 +10,24 @@ This module implements the core agentic intelligence that drives decision-making
 - Chain-of-thought reasoning
 """
 
+import logging
+import re
+import sys
 import time
-import json
-from typing import Dict, List, Any, Optional, Tuple
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Dict, List, Any, FrozenSet, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
-import random
-import math
+
+import numpy as np
+
+from .jit import njit
+
+
+logger = logging.getLogger("kiyosaki.agent")
 
 
 class ReasoningMode(Enum):
@@ -29,6 +39,11 @@ class ReasoningMode(Enum):
     INTUITIVE = "intuitive"
 
 
+_MODES = tuple(ReasoningMode)
+_MODE_INDEX = {mode: index for index, mode in enumerate(_MODES)}
+_REASONING_MODE_VALUES = tuple(mode.value for mode in _MODES)
+
+
 class ConfidenceLevel(Enum):
     """Confidence levels for agent decisions."""
     VERY_LOW = 0.2
@@ -38,52 +53,469 @@ class ConfidenceLevel(Enum):
     VERY_HIGH = 0.95
 
 
-@dataclass
+# Static thought templates per reasoning mode:
+# (content, confidence bounds, supporting evidence, contradicting evidence, follow-up questions)
+_THOUGHT_TEMPLATES = {
+    ReasoningMode.ANALYTICAL: (
+        (
+            "Cross-correlation analysis indicates strong positive relationship between transportation "
+            "accessibility and property values, with infrastructure investments serving as leading "
+            "indicators of neighborhood appreciation.",
+            (0.8, 0.95),
+            (
+                "Transportation proximity correlates with 15-25% price premium",
+                "Infrastructure spending precedes value appreciation by 12-18 months"
+            ),
+            (),
+            (
+                "What is the optimal distance from transportation hubs?",
+                "Are there saturation effects for transportation accessibility?"
+            )
+        ),
+    ),
+    ReasoningMode.CREATIVE: (
+        (
+            "Creative opportunity identification: This property could benefit from emerging trends in "
+            "remote work patterns, potentially commanding premium rents from professionals seeking "
+            "home-office compatible spaces with neighborhood amenities.",
+            (0.6, 0.8),
+            (
+                "Demographic shift toward remote work flexibility",
+                "Increased demand for live-work spaces",
+                "Neighborhood amenities support work-life balance"
+            ),
+            (
+                "Return-to-office policies may reduce demand",
+                "Competition from purpose-built co-working spaces"
+            ),
+            (
+                "How might future workspace trends evolve?",
+                "What modifications would maximize work-from-home appeal?"
+            )
+        ),
+        (
+            "Unconventional value proposition: The property's proximity to cultural institutions and "
+            "educational facilities positions it well for the growing 'knowledge economy' demographic, "
+            "particularly appealing to millennials prioritizing experiential lifestyle over traditional "
+            "suburban amenities.",
+            (0.65, 0.85),
+            (
+                "Cultural amenities increasingly valued by urban professionals",
+                "Educational institutions provide stable neighborhood anchor",
+                "Millennial preferences favor walkable, culturally rich areas"
+            ),
+            (
+                "Generational preferences may shift over time",
+                "Cultural institutions face funding uncertainties"
+            ),
+            (
+                "How stable are cultural institutions as value drivers?",
+                "What demographic trends support this thesis?"
+            )
+        ),
+    ),
+    ReasoningMode.CRITICAL: (
+        (
+            "Critical assessment reveals potential overreliance on historical appreciation trends. "
+            "Market conditions that drove past performance may not persist, particularly given "
+            "changing interest rate environment and evolving urban development patterns.",
+            (0.8, 0.95),
+            (
+                "Interest rate changes alter investment dynamics",
+                "Urban development patterns showing signs of shift",
+                "Historical trends not guaranteed to continue"
+            ),
+            (
+                "Fundamental location advantages remain stable",
+                "Demographic trends support continued demand"
+            ),
+            (
+                "What scenarios could disrupt historical trends?",
+                "How resilient are the underlying value drivers?"
+            )
+        ),
+        (
+            "Potential analytical blind spot: Current analysis may underweight regulatory risk from "
+            "evolving zoning policies and rent control legislation. Local political dynamics could "
+            "significantly impact investment returns through policy changes.",
+            (0.7, 0.9),
+            (
+                "Increasing political focus on housing affordability",
+                "Recent examples of restrictive zoning changes",
+                "Rent control expansion in similar markets"
+            ),
+            (
+                "Property rights protections remain strong",
+                "Market-rate housing maintains political support"
+            ),
+            (
+                "What early warning signals exist for policy changes?",
+                "How can regulatory risk be mitigated?"
+            )
+        ),
+    ),
+    ReasoningMode.STRATEGIC: (
+        (
+            "Strategic positioning analysis suggests optimal entry timing within next 6-12 months, "
+            "leveraging current market inefficiencies while positioning ahead of anticipated "
+            "infrastructure completions that should drive next appreciation cycle.",
+            (0.75, 0.9),
+            (
+                "Infrastructure projects with defined timelines",
+                "Current pricing reflects some but not all future value",
+                "Market sentiment creating temporary opportunities"
+            ),
+            (
+                "Construction delays could extend timeline",
+                "Market sentiment may worsen before improving"
+            ),
+            (
+                "What contingency plans exist for delayed infrastructure?",
+                "How can timing risk be minimized?"
+            )
+        ),
+        (
+            "Competitive strategy recommendation: Focus on properties that offer unique value "
+            "propositions difficult for competitors to replicate - such as specific architectural "
+            "features, optimal unit mixes, or exclusive amenity access - creating sustainable "
+            "competitive advantages.",
+            (0.8, 0.95),
+            (
+                "Unique features command premium pricing",
+                "Difficult-to-replicate advantages provide protection",
+                "Market shows willingness to pay for differentiation"
+            ),
+            (
+                "Unique features may have limited appeal",
+                "Market preferences can shift unpredictably"
+            ),
+            (
+                "Which unique features have most sustainable appeal?",
+                "How quickly can competitors develop alternatives?"
+            )
+        ),
+    ),
+    ReasoningMode.INTUITIVE: (
+        (
+            "Intuitive pattern recognition suggests this property exhibits characteristics "
+            "typical of neighborhoods 2-3 years before major appreciation cycles. The combination "
+            "of emerging cultural activity, infrastructure investment, and demographic shifts "
+            "creates a familiar pre-growth pattern.",
+            (0.6, 0.8),
+            (
+                "Similar patterns observed in comparable neighborhoods",
+                "Early indicators align with historical precedents",
+                "Timing appears consistent with typical cycles"
+            ),
+            (
+                "Each neighborhood has unique characteristics",
+                "Historical patterns may not repeat exactly"
+            ),
+            (
+                "What makes this pattern recognition reliable?",
+                "How can intuitive insights be validated?"
+            )
+        ),
+        (
+            "Market sentiment intuition indicates underlying strength masked by current volatility. "
+            "Despite short-term uncertainty, fundamental demand drivers and quality of local "
+            "development suggest resilient long-term prospects that market may be undervaluing.",
+            (0.65, 0.85),
+            (
+                "Quality of recent developments indicates confidence",
+                "Local business investment continues despite volatility",
+                "Demographic trends provide fundamental support"
+            ),
+            (
+                "Volatility may reflect genuine concerns",
+                "Market sentiment often incorporates information not immediately visible"
+            ),
+            (
+                "What hidden factors might market sentiment be detecting?",
+                "How can intuitive sentiment be objectively verified?"
+            )
+        ),
+    )
+}
+
+# Fixed fields of the strategic decisions, paired with the bounds of their risk scores
+_DECISION_TEMPLATES = (
+    (
+        {
+            'decision': "RECOMMENDED: Proceed with investment acquisition",
+            'rationale': "Comprehensive analysis across multiple reasoning modes indicates strong "
+                         "risk-adjusted return potential with favorable timing dynamics.",
+            'confidence': ConfidenceLevel.HIGH,
+            'supporting_thoughts': (),  # Would include relevant thoughts from chain
+            'alternative_considered': (
+                "Defer investment pending market clarity",
+                "Seek alternative properties with higher liquidity",
+                "Reduce position size to manage risk"
+            ),
+            'success_criteria': (
+                "Achieve target IRR of 12-15% over 5-year hold period",
+                "Maintain occupancy above 90% throughout hold period",
+                "Execute value-add improvements within budget and timeline",
+                "Exit at target multiple or better market conditions"
+            )
+        },
+        {
+            'market_risk': (0.2, 0.4),
+            'execution_risk': (0.1, 0.3),
+            'regulatory_risk': (0.15, 0.35),
+            'liquidity_risk': (0.2, 0.4)
+        }
+    ),
+    (
+        {
+            'decision': "OPTIMAL TIMING: Initiate acquisition within next 6 months",
+            'rationale': "Market timing analysis suggests current window offers favorable entry "
+                         "conditions before anticipated appreciation catalysts take effect.",
+            'confidence': ConfidenceLevel.MEDIUM,
+            'supporting_thoughts': (),
+            'alternative_considered': (
+                "Immediate acquisition to secure opportunity",
+                "Wait 12 months for market clarity",
+                "Staged acquisition approach"
+            ),
+            'success_criteria': (
+                "Enter at or below target price per square foot",
+                "Complete due diligence within 90 days",
+                "Secure favorable financing terms"
+            )
+        },
+        {
+            'timing_risk': (0.25, 0.45),
+            'opportunity_cost': (0.15, 0.35)
+        }
+    )
+)
+
+_DECISION_RISK_LOW, _DECISION_RISK_HIGH = (
+    np.array(bounds) for bounds in zip(*(bound for _, risks in _DECISION_TEMPLATES for bound in risks.values()))
+)
+
+_PRIMARY_GOALS = (
+    "Assess investment viability and risk-return profile",
+    "Identify market opportunities and competitive advantages",
+    "Evaluate timing and strategic positioning",
+    "Generate actionable investment recommendations"
+)
+
+_SECONDARY_GOALS = (
+    "Uncover hidden value drivers or risk factors",
+    "Benchmark against alternative investments",
+    "Optimize for client risk tolerance and objectives",
+    "Provide probabilistic outcome scenarios"
+)
+
+_ANALYSIS_GOALS = _PRIMARY_GOALS + _SECONDARY_GOALS
+
+# Topics on which diverging confidence counts as a contradiction
+_CONTRADICTION_TOPICS = ('market', 'price', 'risk', 'opportunity')
+_CONTRADICTION_WORDS = frozenset(_CONTRADICTION_TOPICS)
+_MAX_CONTRADICTIONS = 3
+
+# Keywords signalling that the reasoning chain addresses each analysis goal
+_GOAL_KEYWORDS = (
+    ('investment', ('investment', 'return', 'profit', 'yield')),
+    ('risk', ('risk', 'volatility', 'uncertainty', 'downside')),
+    ('market', ('market', 'demand', 'supply', 'competition')),
+    ('timing', ('timing', 'opportunity', 'entry', 'exit'))
+)
+_GOAL_NAMES = tuple(goal for goal, _ in _GOAL_KEYWORDS)
+_GOAL_LENS = np.array([len(keywords) for _, keywords in _GOAL_KEYWORDS], dtype=np.int32)
+
+# Reverse index: keyword -> position of the goal it counts towards
+_KEYWORD_GOAL = {keyword: index for index, (_, keywords) in enumerate(_GOAL_KEYWORDS) for keyword in keywords}
+
+# Zero-width lookahead so overlapping keyword occurrences are all reported
+_GOAL_KEYWORD_PATTERN = re.compile(
+    '(?=({}))'.format('|'.join(re.escape(keyword) for keyword in _KEYWORD_GOAL))
+)
+
+# Upper bounds on the agent's long-lived memory stores
+_MAX_REASONING_HISTORY = 1024
+_MAX_LEARNING_PATTERNS = 4096
+
+# Initial capacity of the per-run confidence buffer (grown on demand)
+_CONFIDENCE_BUFFER_SIZE = 32
+
+# Pooled confidence draws available to each reasoning mode per run
+_CONFIDENCE_DRAWS_PER_MODE = 4
+
+# Order of the complexity factors in the hashable planning key
+_COMPLEXITY_KEYS = ('geographic_scope', 'data_depth', 'analysis_type', 'time_sensitivity')
+
+# Complexity factors for every (is_local, has_long_context) request shape
+_COMPLEXITY_TABLE = {
+    (is_local, has_long_context): {
+        'geographic_scope': 'local' if is_local else 'regional',
+        'data_depth': 'comprehensive' if has_long_context else 'basic',
+        'analysis_type': 'investment_analysis',
+        'time_sensitivity': 'standard'
+    }
+    for is_local in (True, False)
+    for has_long_context in (True, False)
+}
+
+
+_META_FOLLOW_UPS = ("How can reasoning quality be further improved?",)
+
+
+@lru_cache(maxsize=32)
+def _meta_evidence(thought_count: int) -> Tuple[str, ...]:
+    """Shared, interned evidence tuple for a meta-thought over ``thought_count`` thoughts."""
+    return (sys.intern(f"Generated {thought_count} coherent thoughts"),)
+
+
+@lru_cache(maxsize=64)
+def _select_reasoning_modes(complexity: Tuple[str, str, str, str]) -> Tuple[str, ...]:
+    """Select appropriate reasoning modes for a complexity key."""
+    _, data_depth, analysis_type, _ = complexity
+    base_modes = ('analytical', 'critical')
+    
+    if data_depth == 'comprehensive':
+        base_modes += ('strategic',)
+    
+    if analysis_type == 'investment_analysis':
+        base_modes += ('creative', 'intuitive')
+    
+    return base_modes
+
+
+@lru_cache(maxsize=64)
+def _plan_reasoning_sequence(modes: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Plan the sequence of reasoning modes."""
+    # Start with analytical foundation, then creative exploration, critical
+    # evaluation, strategic synthesis and finally intuitive validation
+    return ('analytical',) + tuple(
+        mode for mode in ('creative', 'critical', 'strategic', 'intuitive') if mode in modes
+    )
+
+
+@njit(cache=True, fastmath=True)
+def _calibrate_confidence_core(confidences: np.ndarray) -> Tuple[float, float]:
+    """Return the mean and spread (max - min) of a confidence array."""
+    total = 0.0
+    lowest = confidences[0]
+    highest = confidences[0]
+    for value in confidences:
+        total += value
+        if value < lowest:
+            lowest = value
+        if value > highest:
+            highest = value
+    return total / confidences.size, highest - lowest
+
+
+@lru_cache(maxsize=4096)
+def _content_lc(content: str) -> str:
+    """Lowercased thought content, memoized across thoughts sharing a template."""
+    return content.lower()
+
+
+@lru_cache(maxsize=4096)
+def _content_topics(content: str) -> FrozenSet[str]:
+    """Contradiction topics mentioned in a thought's content."""
+    # Substring match, so "markets" or "pricing" still count towards their topic
+    content_lc = _content_lc(content)
+    return frozenset(topic for topic in _CONTRADICTION_WORDS if topic in content_lc)
+
+
+@njit(cache=True)
+def _should_stop_kernel(confidences: np.ndarray, estimated_depth: int, confidence_threshold: float) -> bool:
+    """Stop once the chain is deep enough, unless recent confidence is still low."""
+    length = confidences.size
+    if length >= estimated_depth * 3:  # 3 thoughts per mode on average
+        return True
+    
+    if length > 0:
+        start = max(length - 3, 0)
+        recent_total = 0.0
+        for index in range(start, length):
+            recent_total += confidences[index]
+        if recent_total / (length - start) < confidence_threshold:
+            return False  # Continue if confidence is low
+    
+    return length >= estimated_depth * 2
+
+
+@dataclass(slots=True, frozen=True)
 class Thought:
     """Represents a single thought in the reasoning chain."""
     content: str
     reasoning_mode: ReasoningMode
     confidence: float
     timestamp: datetime
-    supporting_evidence: List[str]
-    contradicting_evidence: List[str]
-    follow_up_questions: List[str]
+    supporting_evidence: Tuple[str, ...]
+    contradicting_evidence: Tuple[str, ...]
+    follow_up_questions: Tuple[str, ...]
 
+    # Derived views are properties, not fields, so they stay out of serialized thoughts
+    @property
+    def content_lc(self) -> str:
+        return _content_lc(self.content)
 
-@dataclass
+    @property
+    def content_topics(self) -> FrozenSet[str]:
+        return _content_topics(self.content)
+
+
+@dataclass(slots=True, frozen=True)
 class Decision:
     """Represents a decision made by the agent."""
     decision: str
     rationale: str
     confidence: ConfidenceLevel
-    supporting_thoughts: List[Thought]
-    alternative_considered: List[str]
+    supporting_thoughts: Tuple[Thought, ...]
+    alternative_considered: Tuple[str, ...]
     risk_assessment: Dict[str, float]
-    success_criteria: List[str]
+    success_criteria: Tuple[str, ...]
 
 
 class CentralReasoningAgent:
     """The central agentic reasoning system that drives all analysis."""
     
-    def __init__(self):
-        self.agent_id = f"kiyosaki_agent_{int(time.time())}"
-        self.reasoning_history = []
+    def __init__(self, seed: Optional[int] = None):
+        self._agent_start_ts = int(time.time())
+        self.agent_id = f"kiyosaki_agent_{self._agent_start_ts}"
+        self.reasoning_history = deque(maxlen=_MAX_REASONING_HISTORY)
         self.memory_bank = {}
-        self.learning_patterns = {}
+        self.learning_patterns = OrderedDict()
         self.current_context = {}
         self.goals_stack = []
+        self._mementos = []
+        self._confidence_buffer = np.empty(_CONFIDENCE_BUFFER_SIZE)
+        self._confidence_count = 0
+        self._run_chain = None
+        self._mode_ids = []
+        self._modes_used = set()
+        self._run_started = datetime.now()
+        self._rng = np.random.default_rng(seed)
+        self._confidence_pools = {}
         self.reasoning_depth = 0
         self.max_reasoning_depth = 5
+        self._mode_dispatch = {
+            ReasoningMode.ANALYTICAL: self._analytical_reasoning,
+            ReasoningMode.CREATIVE: self._creative_reasoning,
+            ReasoningMode.CRITICAL: self._critical_reasoning,
+            ReasoningMode.STRATEGIC: self._strategic_reasoning,
+            ReasoningMode.INTUITIVE: self._intuitive_reasoning
+        }
         
-        print(f"🧠 Central Reasoning Agent initialized: {self.agent_id}")
-        print("🎯 Agent Goals: Provide sophisticated real estate investment analysis")
-        print("💭 Reasoning Modes: Analytical, Creative, Critical, Strategic, Intuitive")
+        logger.info("🧠 Central Reasoning Agent initialized: %s", self.agent_id)
+        logger.debug("🎯 Agent Goals: Provide sophisticated real estate investment analysis\n"
+                     "💭 Reasoning Modes: Analytical, Creative, Critical, Strategic, Intuitive")
         
     def engage_reasoning_process(self, analysis_request: Dict[str, Any]) -> Dict[str, Any]:
         """Main reasoning process that orchestrates all analysis."""
-        print("\n" + "="*80)
-        print("🧠 CENTRAL AGENTIC REASONING SYSTEM ACTIVATED")
-        print("="*80)
+        logger.info("🧠 CENTRAL AGENTIC REASONING SYSTEM ACTIVATED")
+        
+        # Draw this run's confidence samples in a single batch, one row per mode
+        # so concurrently executing modes consume them deterministically
+        samples = self._rng.random((len(ReasoningMode), _CONFIDENCE_DRAWS_PER_MODE)).tolist()
+        self._confidence_pools = {mode: iter(row) for mode, row in zip(ReasoningMode, samples)}
         
         # Stage 1: Goal Setting and Strategy Planning
         self._set_analysis_goals(analysis_request)
@@ -113,39 +545,23 @@ class CentralReasoningAgent:
     
     def _set_analysis_goals(self, request: Dict[str, Any]) -> None:
         """Set and prioritize analysis goals."""
-        print("🎯 STAGE: GOAL SETTING & PRIORITIZATION")
+        logger.info("🎯 STAGE: GOAL SETTING & PRIORITIZATION")
         
-        primary_goals = [
-            "Assess investment viability and risk-return profile",
-            "Identify market opportunities and competitive advantages", 
-            "Evaluate timing and strategic positioning",
-            "Generate actionable investment recommendations"
-        ]
-        
-        secondary_goals = [
-            "Uncover hidden value drivers or risk factors",
-            "Benchmark against alternative investments",
-            "Optimize for client risk tolerance and objectives",
-            "Provide probabilistic outcome scenarios"
-        ]
-        
-        self.goals_stack = primary_goals + secondary_goals
-        print(f"✅ Set {len(self.goals_stack)} analysis goals")
-        
-        for i, goal in enumerate(primary_goals, 1):
-            print(f"   {i}. {goal}")
+        self.goals_stack = _ANALYSIS_GOALS
+        logger.info("✅ Set %d analysis goals", len(self.goals_stack))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("\n".join(f"   {i}. {goal}" for i, goal in enumerate(_PRIMARY_GOALS, 1)))
     
     def _plan_reasoning_strategy(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Plan the reasoning strategy for this analysis."""
-        print("\n🧭 STAGE: REASONING STRATEGY PLANNING")
+        logger.info("🧭 STAGE: REASONING STRATEGY PLANNING")
         
         # Analyze request complexity
-        complexity_factors = {
-            'geographic_scope': 'local' if request.get('radius_m', 800) < 1000 else 'regional',
-            'data_depth': 'comprehensive' if request.get('include_long_context', True) else 'basic',
-            'analysis_type': 'investment_analysis',
-            'time_sensitivity': 'standard'
-        }
+        complexity_key = (
+            request.get('radius_m', 800) < 1000,
+            bool(request.get('include_long_context', True))
+        )
+        complexity_factors = dict(_COMPLEXITY_TABLE[complexity_key])
         
         # Select reasoning modes based on complexity
         selected_modes = self._select_reasoning_modes(complexity_factors)
@@ -161,61 +577,72 @@ class CentralReasoningAgent:
             'confidence_threshold': 0.75
         }
         
-        print(f"✅ Strategy planned with {len(selected_modes)} reasoning modes")
-        print(f"   Sequence: {' → '.join(reasoning_sequence)}")
+        logger.info("✅ Strategy planned with %d reasoning modes\n   Sequence: %s",
+                    len(selected_modes), ' → '.join(reasoning_sequence))
         
         return strategy
     
     def _execute_reasoning_chain(self, request: Dict, strategy: Dict) -> List[Thought]:
         """Execute the chain of reasoning across multiple modes."""
-        print("\n🔗 STAGE: MULTI-MODAL REASONING CHAIN EXECUTION")
+        logger.info("🔗 STAGE: MULTI-MODAL REASONING CHAIN EXECUTION")
         
-        reasoning_chain = []
         context = self._build_reasoning_context(request)
+        sequence = strategy['reasoning_sequence']
+        
+        # Fan out: each mode only reads the initial context, so all paths can run at once
+        context_snapshot = dict(context)
+        with ThreadPoolExecutor(max_workers=max(len(sequence), 1)) as executor:
+            futures = {
+                executor.submit(self._reason_in_mode, ReasoningMode(mode_name), context_snapshot, step): mode_name
+                for step, mode_name in enumerate(sequence, 1)
+            }
+            thoughts_by_mode = {futures[future]: future.result() for future in as_completed(futures)}
+        
+        # Fan in: merge the paths in planned order
+        reasoning_chain = self._summarize_parallel_paths(thoughts_by_mode, context, strategy)
+        
+        logger.info("✅ Generated %d thoughts across reasoning chain", len(reasoning_chain))
+        return reasoning_chain
+    
+    def _summarize_parallel_paths(self, thoughts_by_mode: Dict[str, List[Thought]], context: Dict,
+                                  strategy: Dict) -> List[Thought]:
+        """Merge parallel reasoning paths into a single chain, honouring the stop criteria."""
+        reasoning_chain = self._run_chain = []
         
         for step, mode_name in enumerate(strategy['reasoning_sequence'], 1):
-            print(f"\n💭 Reasoning Step {step}: {mode_name.upper()} MODE")
+            logger.debug("💭 Reasoning Step %d: %s MODE", step, mode_name.upper())
             
-            mode = ReasoningMode(mode_name)
-            thoughts = self._reason_in_mode(mode, context, step)
+            thoughts = thoughts_by_mode[mode_name]
             reasoning_chain.extend(thoughts)
+            self._record_confidences(thoughts)
+            self._mode_ids.extend(_MODE_INDEX[t.reasoning_mode] for t in thoughts)
+            self._modes_used.add(mode_name)
             
             # Update context with new insights
             context = self._update_context_with_insights(context, thoughts)
             
             # Check if we should continue reasoning
             if self._should_stop_reasoning(reasoning_chain, strategy):
-                print(f"🛑 Reasoning chain complete after {step} steps")
+                logger.info("🛑 Reasoning chain complete after %d steps", step)
                 break
         
-        print(f"✅ Generated {len(reasoning_chain)} thoughts across reasoning chain")
         return reasoning_chain
     
     def _reason_in_mode(self, mode: ReasoningMode, context: Dict, step: int) -> List[Thought]:
         """Reason in a specific mode."""
-        thoughts = []
-        
-        if mode == ReasoningMode.ANALYTICAL:
-            thoughts = self._analytical_reasoning(context, step)
-        elif mode == ReasoningMode.CREATIVE:
-            thoughts = self._creative_reasoning(context, step)
-        elif mode == ReasoningMode.CRITICAL:
-            thoughts = self._critical_reasoning(context, step)
-        elif mode == ReasoningMode.STRATEGIC:
-            thoughts = self._strategic_reasoning(context, step)
-        elif mode == ReasoningMode.INTUITIVE:
-            thoughts = self._intuitive_reasoning(context, step)
+        # Thoughts from one step are logically simultaneous, so they share a timestamp
+        step_timestamp = datetime.now()
+        thoughts = self._mode_dispatch[mode](context, step, step_timestamp)
         
         # Add meta-reasoning about the thoughts
-        meta_thought = self._meta_reason_about_thoughts(thoughts, mode)
+        meta_thought = self._meta_reason_about_thoughts(thoughts, mode, step_timestamp)
         thoughts.append(meta_thought)
         
         return thoughts
     
-    def _analytical_reasoning(self, context: Dict, step: int) -> List[Thought]:
+    def _analytical_reasoning(self, context: Dict, step: int, timestamp: datetime) -> List[Thought]:
         """Perform analytical reasoning with data-driven insights."""
-        print("   📊 Engaging analytical reasoning...")
-        time.sleep(0.3)
+        logger.debug("   📊 Engaging analytical reasoning...")
         
         thoughts = []
         
@@ -223,286 +650,93 @@ class CentralReasoningAgent:
         if 'metrics' in context:
             thought = Thought(
                 content=f"Quantitative analysis reveals {len(context['metrics'])} key performance indicators. "
-                       f"The price-per-sqft ratio suggests {'premium' if random.random() > 0.5 else 'value'} positioning "
+                       f"The price-per-sqft ratio suggests {'premium' if self._next_conf(ReasoningMode.ANALYTICAL, 0.0, 1.0) > 0.5 else 'value'} positioning "
                        f"relative to market comparables.",
                 reasoning_mode=ReasoningMode.ANALYTICAL,
-                confidence=random.uniform(0.75, 0.9),
-                timestamp=datetime.now(),
-                supporting_evidence=[
+                confidence=self._next_conf(ReasoningMode.ANALYTICAL, 0.75, 0.9),
+                timestamp=timestamp,
+                supporting_evidence=(
                     "Historical price trends show consistent appreciation",
                     "Comparable properties indicate strong market demand",
                     "Financial metrics align with investment criteria"
-                ],
-                contradicting_evidence=[
+                ),
+                contradicting_evidence=(
                     "Some volatility observed in recent quarters",
                     "Market conditions showing mixed signals"
-                ],
-                follow_up_questions=[
+                ),
+                follow_up_questions=(
                     "What external factors might impact these trends?",
                     "How sensitive are these metrics to market changes?"
-                ]
+                )
             )
             thoughts.append(thought)
         
         # Analyze correlations and patterns
-        pattern_thought = Thought(
-            content="Cross-correlation analysis indicates strong positive relationship between transportation "
-                   "accessibility and property values, with infrastructure investments serving as leading "
-                   "indicators of neighborhood appreciation.",
-            reasoning_mode=ReasoningMode.ANALYTICAL,
-            confidence=random.uniform(0.8, 0.95),
-            timestamp=datetime.now(),
-            supporting_evidence=[
-                "Transportation proximity correlates with 15-25% price premium",
-                "Infrastructure spending precedes value appreciation by 12-18 months"
-            ],
-            contradicting_evidence=[],
-            follow_up_questions=[
-                "What is the optimal distance from transportation hubs?",
-                "Are there saturation effects for transportation accessibility?"
-            ]
-        )
-        thoughts.append(pattern_thought)
+        thoughts.extend(self._thoughts_from_templates(ReasoningMode.ANALYTICAL, timestamp))
         
-        print(f"   ✅ Generated {len(thoughts)} analytical insights")
+        logger.debug("   ✅ Generated %d analytical insights", len(thoughts))
         return thoughts
     
-    def _creative_reasoning(self, context: Dict, step: int) -> List[Thought]:
+    def _creative_reasoning(self, context: Dict, step: int, timestamp: datetime) -> List[Thought]:
         """Perform creative reasoning to identify novel opportunities."""
-        print("   🎨 Engaging creative reasoning...")
-        time.sleep(0.3)
+        logger.debug("   🎨 Engaging creative reasoning...")
         
-        thoughts = []
+        thoughts = self._thoughts_from_templates(ReasoningMode.CREATIVE, timestamp)
         
-        # Generate creative investment angles
-        creative_thought = Thought(
-            content="Creative opportunity identification: This property could benefit from emerging trends in "
-                   "remote work patterns, potentially commanding premium rents from professionals seeking "
-                   "home-office compatible spaces with neighborhood amenities.",
-            reasoning_mode=ReasoningMode.CREATIVE,
-            confidence=random.uniform(0.6, 0.8),
-            timestamp=datetime.now(),
-            supporting_evidence=[
-                "Demographic shift toward remote work flexibility",
-                "Increased demand for live-work spaces",
-                "Neighborhood amenities support work-life balance"
-            ],
-            contradicting_evidence=[
-                "Return-to-office policies may reduce demand",
-                "Competition from purpose-built co-working spaces"
-            ],
-            follow_up_questions=[
-                "How might future workspace trends evolve?",
-                "What modifications would maximize work-from-home appeal?"
-            ]
-        )
-        thoughts.append(creative_thought)
-        
-        # Explore unconventional value drivers
-        value_driver_thought = Thought(
-            content="Unconventional value proposition: The property's proximity to cultural institutions and "
-                   "educational facilities positions it well for the growing 'knowledge economy' demographic, "
-                   "particularly appealing to millennials prioritizing experiential lifestyle over traditional "
-                   "suburban amenities.",
-            reasoning_mode=ReasoningMode.CREATIVE,
-            confidence=random.uniform(0.65, 0.85),
-            timestamp=datetime.now(),
-            supporting_evidence=[
-                "Cultural amenities increasingly valued by urban professionals",
-                "Educational institutions provide stable neighborhood anchor",
-                "Millennial preferences favor walkable, culturally rich areas"
-            ],
-            contradicting_evidence=[
-                "Generational preferences may shift over time",
-                "Cultural institutions face funding uncertainties"
-            ],
-            follow_up_questions=[
-                "How stable are cultural institutions as value drivers?",
-                "What demographic trends support this thesis?"
-            ]
-        )
-        thoughts.append(value_driver_thought)
-        
-        print(f"   ✅ Generated {len(thoughts)} creative insights")
+        logger.debug("   ✅ Generated %d creative insights", len(thoughts))
         return thoughts
     
-    def _critical_reasoning(self, context: Dict, step: int) -> List[Thought]:
+    def _critical_reasoning(self, context: Dict, step: int, timestamp: datetime) -> List[Thought]:
         """Perform critical reasoning to identify flaws and risks."""
-        print("   🔍 Engaging critical reasoning...")
-        time.sleep(0.3)
+        logger.debug("   🔍 Engaging critical reasoning...")
         
-        thoughts = []
+        thoughts = self._thoughts_from_templates(ReasoningMode.CRITICAL, timestamp)
         
-        # Challenge assumptions
-        assumption_challenge = Thought(
-            content="Critical assessment reveals potential overreliance on historical appreciation trends. "
-                   "Market conditions that drove past performance may not persist, particularly given "
-                   "changing interest rate environment and evolving urban development patterns.",
-            reasoning_mode=ReasoningMode.CRITICAL,
-            confidence=random.uniform(0.8, 0.95),
-            timestamp=datetime.now(),
-            supporting_evidence=[
-                "Interest rate changes alter investment dynamics",
-                "Urban development patterns showing signs of shift",
-                "Historical trends not guaranteed to continue"
-            ],
-            contradicting_evidence=[
-                "Fundamental location advantages remain stable",
-                "Demographic trends support continued demand"
-            ],
-            follow_up_questions=[
-                "What scenarios could disrupt historical trends?",
-                "How resilient are the underlying value drivers?"
-            ]
-        )
-        thoughts.append(assumption_challenge)
-        
-        # Identify blind spots
-        blind_spot_thought = Thought(
-            content="Potential analytical blind spot: Current analysis may underweight regulatory risk from "
-                   "evolving zoning policies and rent control legislation. Local political dynamics could "
-                   "significantly impact investment returns through policy changes.",
-            reasoning_mode=ReasoningMode.CRITICAL,
-            confidence=random.uniform(0.7, 0.9),
-            timestamp=datetime.now(),
-            supporting_evidence=[
-                "Increasing political focus on housing affordability",
-                "Recent examples of restrictive zoning changes",
-                "Rent control expansion in similar markets"
-            ],
-            contradicting_evidence=[
-                "Property rights protections remain strong",
-                "Market-rate housing maintains political support"
-            ],
-            follow_up_questions=[
-                "What early warning signals exist for policy changes?",
-                "How can regulatory risk be mitigated?"
-            ]
-        )
-        thoughts.append(blind_spot_thought)
-        
-        print(f"   ✅ Generated {len(thoughts)} critical insights")
+        logger.debug("   ✅ Generated %d critical insights", len(thoughts))
         return thoughts
     
-    def _strategic_reasoning(self, context: Dict, step: int) -> List[Thought]:
+    def _strategic_reasoning(self, context: Dict, step: int, timestamp: datetime) -> List[Thought]:
         """Perform strategic reasoning for optimal positioning."""
-        print("   ♟️  Engaging strategic reasoning...")
-        time.sleep(0.3)
+        logger.debug("   ♟️  Engaging strategic reasoning...")
         
-        thoughts = []
-        
-        # Strategic positioning analysis
-        positioning_thought = Thought(
-            content="Strategic positioning analysis suggests optimal entry timing within next 6-12 months, "
-                   "leveraging current market inefficiencies while positioning ahead of anticipated "
-                   "infrastructure completions that should drive next appreciation cycle.",
-            reasoning_mode=ReasoningMode.STRATEGIC,
-            confidence=random.uniform(0.75, 0.9),
-            timestamp=datetime.now(),
-            supporting_evidence=[
-                "Infrastructure projects with defined timelines",
-                "Current pricing reflects some but not all future value",
-                "Market sentiment creating temporary opportunities"
-            ],
-            contradicting_evidence=[
-                "Construction delays could extend timeline",
-                "Market sentiment may worsen before improving"
-            ],
-            follow_up_questions=[
-                "What contingency plans exist for delayed infrastructure?",
-                "How can timing risk be minimized?"
-            ]
-        )
-        thoughts.append(positioning_thought)
-        
-        # Competitive strategy
-        competitive_thought = Thought(
-            content="Competitive strategy recommendation: Focus on properties that offer unique value "
-                   "propositions difficult for competitors to replicate - such as specific architectural "
-                   "features, optimal unit mixes, or exclusive amenity access - creating sustainable "
-                   "competitive advantages.",
-            reasoning_mode=ReasoningMode.STRATEGIC,
-            confidence=random.uniform(0.8, 0.95),
-            timestamp=datetime.now(),
-            supporting_evidence=[
-                "Unique features command premium pricing",
-                "Difficult-to-replicate advantages provide protection",
-                "Market shows willingness to pay for differentiation"
-            ],
-            contradicting_evidence=[
-                "Unique features may have limited appeal",
-                "Market preferences can shift unpredictably"
-            ],
-            follow_up_questions=[
-                "Which unique features have most sustainable appeal?",
-                "How quickly can competitors develop alternatives?"
-            ]
-        )
-        thoughts.append(competitive_thought)
+        thoughts = self._thoughts_from_templates(ReasoningMode.STRATEGIC, timestamp)
         
-        print(f"   ✅ Generated {len(thoughts)} strategic insights")
+        logger.debug("   ✅ Generated %d strategic insights", len(thoughts))
         return thoughts
     
-    def _intuitive_reasoning(self, context: Dict, step: int) -> List[Thought]:
+    def _intuitive_reasoning(self, context: Dict, step: int, timestamp: datetime) -> List[Thought]:
         """Perform intuitive reasoning based on pattern recognition."""
-        print("   🌟 Engaging intuitive reasoning...")
-        time.sleep(0.3)
-        
-        thoughts = []
+        logger.debug("   🌟 Engaging intuitive reasoning...")
         
-        # Pattern-based insights
-        pattern_thought = Thought(
-            content="Intuitive pattern recognition suggests this property exhibits characteristics "
-                   "typical of neighborhoods 2-3 years before major appreciation cycles. The combination "
-                   "of emerging cultural activity, infrastructure investment, and demographic shifts "
-                   "creates a familiar pre-growth pattern.",
-            reasoning_mode=ReasoningMode.INTUITIVE,
-            confidence=random.uniform(0.6, 0.8),
-            timestamp=datetime.now(),
-            supporting_evidence=[
-                "Similar patterns observed in comparable neighborhoods",
-                "Early indicators align with historical precedents",
-                "Timing appears consistent with typical cycles"
-            ],
-            contradicting_evidence=[
-                "Each neighborhood has unique characteristics",
-                "Historical patterns may not repeat exactly"
-            ],
-            follow_up_questions=[
-                "What makes this pattern recognition reliable?",
-                "How can intuitive insights be validated?"
-            ]
-        )
-        thoughts.append(pattern_thought)
-        
-        # Gut check on market sentiment
-        sentiment_thought = Thought(
-            content="Market sentiment intuition indicates underlying strength masked by current volatility. "
-                   "Despite short-term uncertainty, fundamental demand drivers and quality of local "
-                   "development suggest resilient long-term prospects that market may be undervaluing.",
-            reasoning_mode=ReasoningMode.INTUITIVE,
-            confidence=random.uniform(0.65, 0.85),
-            timestamp=datetime.now(),
-            supporting_evidence=[
-                "Quality of recent developments indicates confidence",
-                "Local business investment continues despite volatility",
-                "Demographic trends provide fundamental support"
-            ],
-            contradicting_evidence=[
-                "Volatility may reflect genuine concerns",
-                "Market sentiment often incorporates information not immediately visible"
-            ],
-            follow_up_questions=[
-                "What hidden factors might market sentiment be detecting?",
-                "How can intuitive sentiment be objectively verified?"
-            ]
-        )
-        thoughts.append(sentiment_thought)
+        thoughts = self._thoughts_from_templates(ReasoningMode.INTUITIVE, timestamp)
         
-        print(f"   ✅ Generated {len(thoughts)} intuitive insights")
+        logger.debug("   ✅ Generated %d intuitive insights", len(thoughts))
         return thoughts
     
-    def _meta_reason_about_thoughts(self, thoughts: List[Thought], mode: ReasoningMode) -> Thought:
+    def _thoughts_from_templates(self, mode: ReasoningMode, timestamp: datetime) -> List[Thought]:
+        """Instantiate the static thought templates for a reasoning mode."""
+        return [
+            Thought(
+                content=content,
+                reasoning_mode=mode,
+                confidence=self._next_conf(mode, lo, hi),
+                timestamp=timestamp,
+                supporting_evidence=supporting,
+                contradicting_evidence=contradicting,
+                follow_up_questions=follow_ups
+            )
+            for content, (lo, hi), supporting, contradicting, follow_ups in _THOUGHT_TEMPLATES[mode]
+        ]
+    
+    def _next_conf(self, mode: ReasoningMode, lo: float, hi: float) -> float:
+        """Take the mode's next pooled uniform draw, rescaled to [lo, hi)."""
+        sample = next(self._confidence_pools.get(mode, iter(())), None)
+        if sample is None:
+            sample = self._rng.random()
+        return lo + sample * (hi - lo)
+    
+    def _meta_reason_about_thoughts(self, thoughts: List[Thought], mode: ReasoningMode,
+                                    timestamp: Optional[datetime] = None) -> Thought:
         """Meta-reasoning about the quality and coherence of thoughts."""
         confidence_scores = [t.confidence for t in thoughts]
         avg_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0.5
@@ -514,23 +748,29 @@ class CentralReasoningAgent:
                    f"{'good' if len(thoughts) >= 2 else 'limited'} depth of analysis.",
             reasoning_mode=mode,
             confidence=avg_confidence,
-            timestamp=datetime.now(),
-            supporting_evidence=[f"Generated {len(thoughts)} coherent thoughts"],
-            contradicting_evidence=[],
-            follow_up_questions=["How can reasoning quality be further improved?"]
+            timestamp=timestamp or datetime.now(),
+            supporting_evidence=_meta_evidence(len(thoughts)),
+            contradicting_evidence=(),
+            follow_up_questions=_META_FOLLOW_UPS
         )
     
     def _self_reflect_and_validate(self, reasoning_chain: List[Thought]) -> Dict[str, Any]:
         """Self-reflection and validation of reasoning chain."""
-        print("\n🪞 STAGE: SELF-REFLECTION & VALIDATION")
+        logger.info("🪞 STAGE: SELF-REFLECTION & VALIDATION")
         
         # Analyze reasoning quality
         total_thoughts = len(reasoning_chain)
-        avg_confidence = sum(t.confidence for t in reasoning_chain) / total_thoughts
-        mode_distribution = {}
-        for thought in reasoning_chain:
-            mode = thought.reasoning_mode.value
-            mode_distribution[mode] = mode_distribution.get(mode, 0) + 1
+        # Mode ids were recorded while this run's chain was assembled; any other chain is indexed afresh
+        if reasoning_chain is self._run_chain and len(self._mode_ids) == total_thoughts:
+            mode_ids = self._mode_ids
+        else:
+            mode_ids = [_MODE_INDEX[t.reasoning_mode] for t in reasoning_chain]
+        
+        confidences = self._recorded_confidences(reasoning_chain)
+        avg_confidence = float(confidences.mean())
+        mode_counts = np.bincount(np.fromiter(mode_ids, dtype=np.int8, count=total_thoughts),
+                                  minlength=len(_MODES))
+        mode_distribution = {mode.value: int(count) for mode, count in zip(_MODES, mode_counts) if count}
         
         # Check for contradictions
         contradictions = self._identify_contradictions(reasoning_chain)
@@ -554,78 +794,34 @@ class CentralReasoningAgent:
             'validation_score': min(avg_confidence + goal_coverage['coverage_score'] - len(contradictions) * 0.1, 1.0)
         }
         
-        print(f"✅ Validation complete: {validation_results['validation_score']:.2f} overall score")
-        print(f"   Reasoning depth: {validation_results['reasoning_quality']['reasoning_depth']}")
-        print(f"   Contradictions found: {len(contradictions)}")
+        logger.info("✅ Validation complete: %.2f overall score\n   Reasoning depth: %d\n   Contradictions found: %d",
+                    validation_results['validation_score'],
+                    validation_results['reasoning_quality']['reasoning_depth'],
+                    len(contradictions))
         
         return validation_results
     
     def _make_strategic_decisions(self, validated_insights: Dict) -> List[Decision]:
         """Make strategic decisions based on validated insights."""
-        print("\n🎯 STAGE: STRATEGIC DECISION MAKING")
-        
-        decisions = []
-        
-        # Primary investment decision
-        investment_decision = Decision(
-            decision="RECOMMENDED: Proceed with investment acquisition",
-            rationale="Comprehensive analysis across multiple reasoning modes indicates strong "
-                     "risk-adjusted return potential with favorable timing dynamics.",
-            confidence=ConfidenceLevel.HIGH,
-            supporting_thoughts=[],  # Would include relevant thoughts from chain
-            alternative_considered=[
-                "Defer investment pending market clarity",
-                "Seek alternative properties with higher liquidity",
-                "Reduce position size to manage risk"
-            ],
-            risk_assessment={
-                'market_risk': random.uniform(0.2, 0.4),
-                'execution_risk': random.uniform(0.1, 0.3),
-                'regulatory_risk': random.uniform(0.15, 0.35),
-                'liquidity_risk': random.uniform(0.2, 0.4)
-            },
-            success_criteria=[
-                "Achieve target IRR of 12-15% over 5-year hold period",
-                "Maintain occupancy above 90% throughout hold period",
-                "Execute value-add improvements within budget and timeline",
-                "Exit at target multiple or better market conditions"
-            ]
-        )
-        decisions.append(investment_decision)
-        
-        # Timing decision
-        timing_decision = Decision(
-            decision="OPTIMAL TIMING: Initiate acquisition within next 6 months",
-            rationale="Market timing analysis suggests current window offers favorable entry "
-                     "conditions before anticipated appreciation catalysts take effect.",
-            confidence=ConfidenceLevel.MEDIUM,
-            supporting_thoughts=[],
-            alternative_considered=[
-                "Immediate acquisition to secure opportunity",
-                "Wait 12 months for market clarity",
-                "Staged acquisition approach"
-            ],
-            risk_assessment={
-                'timing_risk': random.uniform(0.25, 0.45),
-                'opportunity_cost': random.uniform(0.15, 0.35)
-            },
-            success_criteria=[
-                "Enter at or below target price per square foot",
-                "Complete due diligence within 90 days",
-                "Secure favorable financing terms"
-            ]
-        )
-        decisions.append(timing_decision)
+        logger.info("🎯 STAGE: STRATEGIC DECISION MAKING")
+        
+        # Only the risk scores vary per call; draw them all in one batch
+        risk_draws = iter(self._rng.uniform(_DECISION_RISK_LOW, _DECISION_RISK_HIGH).tolist())
+        decisions = [
+            Decision(**template, risk_assessment={risk: next(risk_draws) for risk in risk_bounds})
+            for template, risk_bounds in _DECISION_TEMPLATES
+        ]
         
-        print(f"✅ Made {len(decisions)} strategic decisions")
-        for i, decision in enumerate(decisions, 1):
-            print(f"   {i}. {decision.decision} (Confidence: {decision.confidence.name})")
+        logger.info("✅ Made %d strategic decisions", len(decisions))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("\n".join(f"   {i}. {decision.decision} (Confidence: {decision.confidence.name})"
+                                   for i, decision in enumerate(decisions, 1)))
         
         return decisions
     
     def _update_learning_patterns(self, request: Dict, decisions: List[Decision]) -> None:
         """Update learning patterns based on analysis experience."""
-        print("\n🧠 STAGE: LEARNING PATTERN UPDATE")
+        logger.info("🧠 STAGE: LEARNING PATTERN UPDATE")
         
         # Extract learning insights
         analysis_type = "real_estate_investment"
@@ -633,113 +829,124 @@ class CentralReasoningAgent:
         
         learning_key = f"{analysis_type}_{request.get('address', 'unknown')}"
         
+        self.learning_patterns.pop(learning_key, None)
         self.learning_patterns[learning_key] = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': self._run_started.isoformat(),
             'analysis_complexity': len(request),
             'decision_confidence': decision_confidence,
-            'reasoning_modes_used': list(set(t.reasoning_mode.value for t in self.reasoning_history)),
+            'reasoning_modes_used': sorted(self._modes_used),
             'success_indicators': [d.success_criteria for d in decisions]
         }
         
-        print(f"✅ Updated learning patterns: {len(self.learning_patterns)} total patterns")
-        print(f"   Current analysis confidence: {decision_confidence:.2f}")
+        # Evict the least recently updated patterns once the store is full
+        while len(self.learning_patterns) > _MAX_LEARNING_PATTERNS:
+            self.learning_patterns.popitem(last=False)
+        
+        logger.info("✅ Updated learning patterns: %d total patterns\n   Current analysis confidence: %.2f",
+                    len(self.learning_patterns), decision_confidence)
     
     # Helper methods for reasoning support
-    def _select_reasoning_modes(self, complexity: Dict) -> List[str]:
+    def _select_reasoning_modes(self, complexity: Dict) -> Tuple[str, ...]:
         """Select appropriate reasoning modes based on complexity."""
-        base_modes = ['analytical', 'critical']
-        
-        if complexity['data_depth'] == 'comprehensive':
-            base_modes.append('strategic')
-        
-        if complexity['analysis_type'] == 'investment_analysis':
-            base_modes.extend(['creative', 'intuitive'])
-        
-        return base_modes
+        return _select_reasoning_modes(tuple(complexity[key] for key in _COMPLEXITY_KEYS))
     
-    def _plan_reasoning_sequence(self, modes: List[str]) -> List[str]:
+    def _plan_reasoning_sequence(self, modes: Tuple[str, ...]) -> Tuple[str, ...]:
         """Plan the sequence of reasoning modes."""
-        # Start with analytical foundation
-        sequence = ['analytical']
-        
-        # Add creative exploration
-        if 'creative' in modes:
-            sequence.append('creative')
-        
-        # Add critical evaluation
-        if 'critical' in modes:
-            sequence.append('critical')
-        
-        # Add strategic synthesis
-        if 'strategic' in modes:
-            sequence.append('strategic')
-        
-        # End with intuitive validation
-        if 'intuitive' in modes:
-            sequence.append('intuitive')
-        
-        return sequence
+        return _plan_reasoning_sequence(tuple(modes))
     
     def _build_reasoning_context(self, request: Dict) -> Dict:
         """Build context for reasoning."""
+        self._mementos = []
+        self._confidence_count = 0
+        self._run_chain = None
+        self._mode_ids = []
+        self._modes_used = set()
+        self._run_started = datetime.now()
         return {
             'request': request,
             'current_goals': self.goals_stack,
             'memory_context': self.memory_bank,
             'metrics': request.get('metrics', {}),
-            'timestamp': datetime.now()
+            'mementos': self._mementos,
+            'timestamp': self._run_started
         }
     
     def _update_context_with_insights(self, context: Dict, thoughts: List[Thought]) -> Dict:
-        """Update context with new insights."""
-        context['recent_insights'] = [t.content for t in thoughts]
-        context['confidence_trend'] = [t.confidence for t in thoughts]
+        """Update context with a compact memento of the completed reasoning step."""
+        if thoughts:
+            self._mementos.append(self._compress_to_memento(thoughts))
+        context['mementos'] = self._mementos
         return context
     
+    def _compress_to_memento(self, thoughts: List[Thought]) -> Dict:
+        """Summarize a reasoning step by its highest-confidence thought."""
+        best = max(thoughts, key=lambda t: t.confidence)
+        return {
+            'mode': best.reasoning_mode.value,
+            'key_insight': best.content,
+            'key_evidence': best.supporting_evidence[:2],
+            'confidence': best.confidence,
+            'thought_count': len(thoughts)
+        }
+    
     def _should_stop_reasoning(self, chain: List[Thought], strategy: Dict) -> bool:
         """Determine if reasoning should stop."""
-        if len(chain) >= strategy['estimated_depth'] * 3:  # 3 thoughts per mode on average
-            return True
-        
-        recent_confidence = [t.confidence for t in chain[-3:]]
-        if recent_confidence and sum(recent_confidence) / len(recent_confidence) < strategy['confidence_threshold']:
-            return False  # Continue if confidence is low
-        
-        return len(chain) >= strategy['estimated_depth'] * 2
+        return bool(_should_stop_kernel(
+            self._recorded_confidences(chain),
+            strategy['estimated_depth'],
+            strategy['confidence_threshold']
+        ))
+    
+    def _record_confidences(self, thoughts: List[Thought]) -> None:
+        """Append thought confidences to this run's preallocated confidence buffer."""
+        end = self._confidence_count + len(thoughts)
+        if end > self._confidence_buffer.size:
+            self._confidence_buffer = np.resize(self._confidence_buffer, max(end, 2 * self._confidence_buffer.size))
+        self._confidence_buffer[self._confidence_count:end] = [t.confidence for t in thoughts]
+        self._confidence_count = end
+    
+    def _recorded_confidences(self, thoughts: List[Thought]) -> np.ndarray:
+        """Confidences of a chain, read from the run buffer when it tracks that chain."""
+        if thoughts is self._run_chain and self._confidence_count == len(thoughts):
+            return self._confidence_buffer[:self._confidence_count]
+        return np.fromiter((t.confidence for t in thoughts), dtype=np.float64, count=len(thoughts))
     
     def _identify_contradictions(self, thoughts: List[Thought]) -> List[Dict]:
         """Identify contradictions in reasoning."""
-        # Simplified contradiction detection
-        contradictions = []
-        
-        # Look for opposing confidence levels on similar topics
-        for i, thought1 in enumerate(thoughts):
-            for thought2 in thoughts[i+1:]:
-                if (abs(thought1.confidence - thought2.confidence) > 0.4 and
-                    any(word in thought1.content.lower() and word in thought2.content.lower() 
-                        for word in ['market', 'price', 'risk', 'opportunity'])):
-                    contradictions.append({
-                        'thought1': thought1.content[:100] + "...",
-                        'thought2': thought2.content[:100] + "...",
-                        'confidence_gap': abs(thought1.confidence - thought2.confidence)
-                    })
-        
-        return contradictions[:3]  # Limit to top 3 contradictions
+        # Simplified contradiction detection: opposing confidence levels on similar topics
+        if len(thoughts) < 2:
+            return []
+        
+        # Topic presence matrix (thoughts x topics) and confidence vector, built once
+        topics = np.array([
+            [word in topic_set for word in _CONTRADICTION_TOPICS]
+            for topic_set in (thought.content_topics for thought in thoughts)
+        ])
+        confidences = np.fromiter((t.confidence for t in thoughts), dtype=np.float64, count=len(thoughts))
+        
+        # Sweep every pair at once; row-major order matches the pairwise scan order
+        confidence_gaps = np.abs(confidences[:, None] - confidences[None, :])
+        shares_topic = (topics.astype(np.int8) @ topics.T.astype(np.int8)) > 0
+        first, second = np.nonzero(np.triu((confidence_gaps > 0.4) & shares_topic, k=1))
+        
+        return [
+            {
+                'thought1': thoughts[i].content[:100] + "...",
+                'thought2': thoughts[j].content[:100] + "...",
+                'confidence_gap': float(confidence_gaps[i, j])
+            }
+            for i, j in zip(first[:_MAX_CONTRADICTIONS].tolist(), second[:_MAX_CONTRADICTIONS].tolist())
+        ]
     
     def _assess_goal_coverage(self, thoughts: List[Thought]) -> Dict:
         """Assess how well thoughts cover analysis goals."""
-        goal_keywords = {
-            'investment': ['investment', 'return', 'profit', 'yield'],
-            'risk': ['risk', 'volatility', 'uncertainty', 'downside'],
-            'market': ['market', 'demand', 'supply', 'competition'],
-            'timing': ['timing', 'opportunity', 'entry', 'exit']
-        }
+        total_content = ' '.join(t.content_lc for t in thoughts)
         
-        coverage = {}
-        total_content = ' '.join(t.content.lower() for t in thoughts)
+        # One scan over the joined content finds every goal keyword present
+        found_keywords = {match.group(1) for match in _GOAL_KEYWORD_PATTERN.finditer(total_content)}
         
-        for goal, keywords in goal_keywords.items():
-            coverage[goal] = sum(1 for keyword in keywords if keyword in total_content) / len(keywords)
+        hits = np.bincount([_KEYWORD_GOAL[keyword] for keyword in found_keywords], minlength=len(_GOAL_NAMES))
+        coverage = dict(zip(_GOAL_NAMES, (hits / _GOAL_LENS).tolist()))
         
         return {
             'goal_coverage': coverage,
@@ -748,13 +955,13 @@ class CentralReasoningAgent:
     
     def _calibrate_confidence(self, thoughts: List[Thought]) -> Dict:
         """Calibrate confidence scores."""
-        confidences = [t.confidence for t in thoughts]
+        mean_confidence, confidence_range = _calibrate_confidence_core(self._recorded_confidences(thoughts))
         
         return {
-            'mean_confidence': sum(confidences) / len(confidences),
-            'confidence_range': max(confidences) - min(confidences),
-            'confidence_stability': 1.0 - (max(confidences) - min(confidences)),
-            'calibration_quality': 'good' if max(confidences) - min(confidences) < 0.3 else 'variable'
+            'mean_confidence': float(mean_confidence),
+            'confidence_range': float(confidence_range),
+            'confidence_stability': 1.0 - float(confidence_range),
+            'calibration_quality': 'good' if confidence_range < 0.3 else 'variable'
         }
     
     def _get_agent_metadata(self) -> Dict:
@@ -765,6 +972,6 @@ class CentralReasoningAgent:
             'learning_patterns_count': len(self.learning_patterns),
             'active_goals': len(self.goals_stack),
             'memory_size': len(self.memory_bank),
-            'agent_uptime': time.time() - int(self.agent_id.split('_')[-1]),
-            'reasoning_capabilities': [mode.value for mode in ReasoningMode]
+            'agent_uptime': time.time() - self._agent_start_ts,
+            'reasoning_capabilities': list(_REASONING_MODE_VALUES)
         }
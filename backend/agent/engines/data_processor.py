@@ -1,17 +1,87 @@
 
 import numpy as np
+from numpy.lib.recfunctions import structured_to_unstructured
 import pandas as pd
-from typing import Dict, List, Any, Tuple, Optional
-import time
+from typing import Dict, List, Any, Tuple, Optional, Callable
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-import json
 import hashlib
 
+from .sampling import choice as _choice, randint as _randint, uniform as _uniform
+
+
+# Per-source ingestion statistics, stored column-wise, with their sampling ranges
+_INGESTION_DTYPE = np.dtype([
+    ('records_ingested', np.int32),
+    ('ingestion_time', np.float64),
+    ('success_rate', np.float64),
+    ('data_freshness', np.float64),
+    ('source_reliability', np.float64)
+])
+
+_INGESTION_BOUNDS = {
+    'records_ingested': (100, 5000),
+    'ingestion_time': (0.1, 2.0),
+    'success_rate': (0.95, 1.0),
+    'data_freshness': (0.8, 1.0),
+    'source_reliability': (0.85, 0.98)
+}
+
+# Fixed vocabularies shared by every report
+_IMPUTATION_METHODS = ('KNN imputation', 'Regression imputation', 'Forward fill')
+_QUALITY_TRENDS = ('Improving', 'Stable', 'Declining')
+_OUTLIER_METHODS = ('Z-score', 'IQR')
+_TRANSPORT_MODES = ('Walking', 'Cycling', 'Public Transit', 'Driving')
+_TREND_DIRECTIONS = ('Increasing', 'Decreasing', 'Stable')
+_PEAK_MONTHS = ('May', 'June', 'September', 'October')
+_CYCLE_POSITIONS = ('Peak', 'Trough', 'Rising', 'Falling')
+_SOURCE_SYSTEMS = ('NYC Open Data', 'MLS', 'Census Bureau', 'DOB', 'DOF')
+_TRANSFORMATION_STEPS = ('Extraction', 'Validation', 'Cleansing', 'Enrichment', 'Aggregation')
+_DETECTION_OUTCOMES = (True, False)
+
+# Top-level features per enrichment category: geospatial 2 + demographic 4 + economic 4 + market 4
+_ENRICHMENT_FEATURE_COUNT = 14
+
+# Improvement suggestions sampled into each processing report
+_DATA_RECOMMENDATIONS = (
+    "Implement real-time data quality monitoring",
+    "Enhance spatial data accuracy with GPS validation",
+    "Expand temporal coverage for trend analysis",
+    "Integrate additional external data sources",
+    "Implement automated anomaly detection",
+    "Enhance data freshness monitoring",
+    "Improve cross-source data reconciliation"
+)
+
+
+def _ingestion_stats_view(sources: Tuple[Tuple[str, str], ...], stats: np.ndarray) -> Dict[str, Dict[str, Any]]:
+    """Expand the columnar ingestion statistics into the nested per-source report."""
+    columns = {field: stats[field].tolist() for field in stats.dtype.names}
+    view = {}
+    for index, (source_type, source) in enumerate(sources):
+        view.setdefault(source_type, {})[source] = {field: values[index] for field, values in columns.items()}
+    return view
+
+
+def _outlier_flags(X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Flag values that fail either the 3-sigma Z-score or the 1.5 x IQR fence, column by column."""
+    mu = X.mean(axis=0)
+    sd = X.std(axis=0)
+    q1, q3 = np.percentile(X, [25.0, 75.0], axis=0)
+    fence = 1.5 * (q3 - q1)
+    mask = ((sd > 0.0) & (np.abs(X - mu) > 3.0 * sd)) | (X < q1 - fence) | (X > q3 + fence)
+    return mask.sum(axis=0), mask
+
 
 class DataProcessingEngine:
     """Advanced data processing and enrichment system."""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        self._rng = np.random.default_rng(seed)
+        self._branch_state = threading.local()
+        self._run_timestamp = datetime.now().isoformat()
+        
         self.processing_stages = [
             'data_ingestion', 'validation', 'cleansing', 'enrichment',
             'spatial_analysis', 'temporal_analysis', 'quality_assessment'
@@ -23,6 +93,10 @@ class DataProcessingEngine:
             'external': ['economic_indicators', 'market_trends', 'weather', 'social_sentiment']
         }
         
+        self._ingestion_sources = tuple(
+            (source_type, source) for source_type, sources in self.data_sources.items() for source in sources
+        )
+        
         self.quality_thresholds = {
             'completeness': 0.85,
             'accuracy': 0.90,
@@ -34,55 +108,63 @@ class DataProcessingEngine:
     def process_comprehensive_dataset(self, lat: float, lon: float, radius_m: int) -> Dict[str, Any]:
         """Process and enrich comprehensive dataset for analysis."""
         print("🔄 Initializing Advanced Data Processing Pipeline...")
-        time.sleep(0.4)
         
         processing_results = {}
         
-        # Stage 1: Data Ingestion
-        print("📥 Stage 1/7: Multi-Source Data Ingestion")
-        ingestion_results = self._perform_data_ingestion(lat, lon, radius_m)
-        processing_results['ingestion'] = ingestion_results
-        time.sleep(0.5)
-        
-        # Stage 2: Data Validation
-        print("✅ Stage 2/7: Data Validation & Schema Verification")
-        validation_results = self._perform_data_validation(ingestion_results)
-        processing_results['validation'] = validation_results
-        time.sleep(0.4)
+        # One wall-clock read per run, shared by every stage that stamps its output
+        self._run_timestamp = datetime.now().isoformat()
         
-        # Stage 3: Data Cleansing
-        print("🧹 Stage 3/7: Data Cleansing & Normalization")
-        cleansing_results = self._perform_data_cleansing(validation_results)
-        processing_results['cleansing'] = cleansing_results
-        time.sleep(0.5)
-        
-        # Stage 4: Data Enrichment
-        print("💎 Stage 4/7: Data Enrichment & Feature Engineering")
-        enrichment_results = self._perform_data_enrichment(cleansing_results, lat, lon)
-        processing_results['enrichment'] = enrichment_results
-        time.sleep(0.6)
-        
-        # Stage 5: Spatial Analysis
-        print("🗺️  Stage 5/7: Advanced Spatial Analysis")
-        spatial_results = self._perform_spatial_analysis(lat, lon, radius_m)
-        processing_results['spatial'] = spatial_results
-        time.sleep(0.5)
-        
-        # Stage 6: Temporal Analysis
-        print("⏰ Stage 6/7: Temporal Pattern Analysis")
-        temporal_results = self._perform_temporal_analysis()
-        processing_results['temporal'] = temporal_results
-        time.sleep(0.4)
+        # Spatial and temporal analysis depend only on the request, so they run
+        # alongside the ingestion -> validation -> cleansing -> enrichment chain
+        spatial_rng, temporal_rng = self._rng.spawn(2)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            spatial_future = executor.submit(
+                self._run_branch, spatial_rng, self._perform_spatial_analysis, lat, lon, radius_m
+            )
+            temporal_future = executor.submit(
+                self._run_branch, temporal_rng, self._perform_temporal_analysis
+            )
+            
+            # Stage 1: Data Ingestion
+            print("📥 Stage 1/7: Multi-Source Data Ingestion")
+            ingestion_results = self._perform_data_ingestion(lat, lon, radius_m)
+            processing_results['ingestion'] = ingestion_results
+            
+            # Stage 2: Data Validation
+            print("✅ Stage 2/7: Data Validation & Schema Verification")
+            validation_results = self._perform_data_validation(ingestion_results)
+            processing_results['validation'] = validation_results
+            
+            # Stage 3: Data Cleansing
+            print("🧹 Stage 3/7: Data Cleansing & Normalization")
+            cleansing_results = self._perform_data_cleansing(validation_results)
+            processing_results['cleansing'] = cleansing_results
+            
+            # Stage 4: Data Enrichment
+            print("💎 Stage 4/7: Data Enrichment & Feature Engineering")
+            enrichment_results = self._perform_data_enrichment(cleansing_results, lat, lon)
+            processing_results['enrichment'] = enrichment_results
+            
+            # Stage 5: Spatial Analysis
+            print("🗺️  Stage 5/7: Advanced Spatial Analysis")
+            processing_results['spatial'] = spatial_future.result()
+            
+            # Stage 6: Temporal Analysis
+            print("⏰ Stage 6/7: Temporal Pattern Analysis")
+            processing_results['temporal'] = temporal_future.result()
         
         # Stage 7: Quality Assessment
         print("🎯 Stage 7/7: Data Quality Assessment & Scoring")
         quality_results = self._perform_quality_assessment(processing_results)
         processing_results['quality'] = quality_results
-        time.sleep(0.3)
         
         # Generate processing summary
         processing_summary = self._generate_processing_summary(processing_results)
         
+        ingestion_results['ingestion_stats'] = _ingestion_stats_view(
+            self._ingestion_sources, ingestion_results['ingestion_stats']
+        )
+        
         return {
             'processing_results': processing_results,
             'processing_summary': processing_summary,
@@ -93,52 +175,47 @@ class DataProcessingEngine:
     
     def _perform_data_ingestion(self, lat: float, lon: float, radius_m: int) -> Dict[str, Any]:
         """Perform multi-source data ingestion."""
-        ingestion_stats = {}
+        source_count = len(self._ingestion_sources)
         
-        for source_type, sources in self.data_sources.items():
-            ingestion_stats[source_type] = {}
-            for source in sources:
-                ingestion_stats[source_type][source] = {
-                    'records_ingested': np.random.randint(100, 5000),
-                    'ingestion_time': np.random.uniform(0.1, 2.0),
-                    'success_rate': np.random.uniform(0.95, 1.0),
-                    'data_freshness': np.random.uniform(0.8, 1.0),
-                    'source_reliability': np.random.uniform(0.85, 0.98)
-                }
+        # One draw per field across all sources, stored column-wise
+        u = self._sample((len(_INGESTION_BOUNDS), source_count))
+        stats = np.empty(source_count, dtype=_INGESTION_DTYPE)
+        for row, (field, (low, high)) in enumerate(_INGESTION_BOUNDS.items()):
+            stats[field] = low + (high - low) * u[row]
         
+        # Stays columnar for the validation stages; expanded into the nested
+        # per-source report when the pipeline returns
         return {
-            'total_sources': sum(len(sources) for sources in self.data_sources.values()),
-            'total_records': sum(
-                sum(stats['records_ingested'] for stats in source_stats.values())
-                for source_stats in ingestion_stats.values()
-            ),
-            'ingestion_stats': ingestion_stats,
+            'total_sources': source_count,
+            'total_records': int(stats['records_ingested'].sum()),
+            'ingestion_stats': stats,
             'geographic_coverage': self._calculate_geographic_coverage(lat, lon, radius_m),
             'temporal_coverage': self._calculate_temporal_coverage(),
-            'ingestion_timestamp': datetime.now().isoformat()
+            'ingestion_timestamp': self._run_timestamp
         }
     
     def _perform_data_validation(self, ingestion_data: Dict) -> Dict[str, Any]:
         """Perform comprehensive data validation."""
+        u = self._draw(10)
         validation_results = {
             'schema_validation': {
-                'passed_checks': np.random.randint(85, 100),
-                'failed_checks': np.random.randint(0, 15),
-                'validation_score': np.random.uniform(0.85, 0.98)
+                'passed_checks': _randint(u[0], 85, 100),
+                'failed_checks': _randint(u[1], 0, 15),
+                'validation_score': _uniform(u[2], 0.85, 0.98)
             },
             'business_rules_validation': {
-                'rules_checked': np.random.randint(50, 100),
-                'violations_found': np.random.randint(0, 10),
-                'compliance_rate': np.random.uniform(0.90, 0.99)
+                'rules_checked': _randint(u[3], 50, 100),
+                'violations_found': _randint(u[4], 0, 10),
+                'compliance_rate': _uniform(u[5], 0.90, 0.99)
             },
             'data_integrity_checks': {
-                'referential_integrity': np.random.uniform(0.92, 0.99),
-                'constraint_violations': np.random.randint(0, 5),
-                'duplicate_records': np.random.randint(0, 50),
-                'orphaned_records': np.random.randint(0, 20)
+                'referential_integrity': _uniform(u[6], 0.92, 0.99),
+                'constraint_violations': _randint(u[7], 0, 5),
+                'duplicate_records': _randint(u[8], 0, 50),
+                'orphaned_records': _randint(u[9], 0, 20)
             },
             'statistical_validation': {
-                'outlier_detection': self._perform_outlier_detection(),
+                'outlier_detection': self._perform_outlier_detection(ingestion_data),
                 'distribution_analysis': self._analyze_data_distributions(),
                 'correlation_checks': self._perform_correlation_checks()
             }
@@ -148,112 +225,119 @@ class DataProcessingEngine:
     
     def _perform_data_cleansing(self, validation_data: Dict) -> Dict[str, Any]:
         """Perform advanced data cleansing operations."""
+        u = self._draw(13)
         cleansing_operations = {
             'missing_value_treatment': {
                 'strategy': 'Advanced imputation',
-                'missing_percentage': np.random.uniform(0.02, 0.15),
-                'imputation_accuracy': np.random.uniform(0.85, 0.95),
-                'methods_used': ['KNN imputation', 'Regression imputation', 'Forward fill']
+                'missing_percentage': _uniform(u[0], 0.02, 0.15),
+                'imputation_accuracy': _uniform(u[1], 0.85, 0.95),
+                'methods_used': _IMPUTATION_METHODS
             },
             'outlier_treatment': {
-                'outliers_detected': np.random.randint(5, 50),
+                'outliers_detected': _randint(u[2], 5, 50),
                 'treatment_method': 'Winsorization and capping',
-                'outliers_retained': np.random.randint(2, 20),
-                'outliers_adjusted': np.random.randint(3, 30)
+                'outliers_retained': _randint(u[3], 2, 20),
+                'outliers_adjusted': _randint(u[4], 3, 30)
             },
             'standardization': {
-                'fields_standardized': np.random.randint(20, 60),
-                'format_consistency': np.random.uniform(0.95, 0.99),
+                'fields_standardized': _randint(u[5], 20, 60),
+                'format_consistency': _uniform(u[6], 0.95, 0.99),
                 'encoding_standardization': 'UTF-8 applied universally',
                 'date_format_standardization': 'ISO 8601 format'
             },
             'deduplication': {
-                'potential_duplicates': np.random.randint(10, 100),
-                'confirmed_duplicates': np.random.randint(5, 50),
-                'merge_operations': np.random.randint(2, 25),
-                'fuzzy_matching_accuracy': np.random.uniform(0.88, 0.96)
+                'potential_duplicates': _randint(u[7], 10, 100),
+                'confirmed_duplicates': _randint(u[8], 5, 50),
+                'merge_operations': _randint(u[9], 2, 25),
+                'fuzzy_matching_accuracy': _uniform(u[10], 0.88, 0.96)
             }
         }
         
         return {
             'cleansing_operations': cleansing_operations,
             'data_quality_improvement': self._calculate_quality_improvement(),
-            'processing_efficiency': np.random.uniform(0.85, 0.95),
-            'cleansing_confidence': np.random.uniform(0.90, 0.98)
+            'processing_efficiency': _uniform(u[11], 0.85, 0.95),
+            'cleansing_confidence': _uniform(u[12], 0.90, 0.98)
         }
     
     def _perform_data_enrichment(self, cleansed_data: Dict, lat: float, lon: float) -> Dict[str, Any]:
         """Perform sophisticated data enrichment."""
-        enrichment_features = {
+        u = self._draw(2)
+        
+        return {
+            'enrichment_features': self._build_enrichment_features(lat, lon),
+            'feature_count': _ENRICHMENT_FEATURE_COUNT,
+            'enrichment_quality': _uniform(u[0], 0.88, 0.96),
+            'coverage_completeness': _uniform(u[1], 0.85, 0.95)
+        }
+    
+    def _build_enrichment_features(self, lat: float, lon: float) -> Dict[str, Any]:
+        """Generate the nested enrichment feature tree."""
+        u = self._draw(20)
+        return {
             'geospatial_enrichment': {
                 'reverse_geocoding': {
-                    'address_standardization': np.random.uniform(0.95, 0.99),
-                    'postal_code_validation': np.random.uniform(0.98, 1.0),
+                    'address_standardization': _uniform(u[0], 0.95, 0.99),
+                    'postal_code_validation': _uniform(u[1], 0.98, 1.0),
                     'coordinate_precision': 'Sub-meter accuracy'
                 },
                 'proximity_features': {
-                    'nearest_subway': f"{np.random.uniform(0.1, 0.8):.1f} miles",
-                    'walkability_score': np.random.randint(60, 95),
-                    'amenity_density': np.random.uniform(0.3, 0.9),
-                    'noise_level_estimate': f"{np.random.randint(45, 70)} dB"
+                    'nearest_subway': f"{_uniform(u[2], 0.1, 0.8):.1f} miles",
+                    'walkability_score': _randint(u[3], 60, 95),
+                    'amenity_density': _uniform(u[4], 0.3, 0.9),
+                    'noise_level_estimate': f"{_randint(u[5], 45, 70)} dB"
                 }
             },
             'demographic_enrichment': {
-                'population_density': np.random.randint(10000, 50000),
-                'median_income': np.random.randint(50000, 150000),
+                'population_density': _randint(u[6], 10000, 50000),
+                'median_income': _randint(u[7], 50000, 150000),
                 'age_distribution': {
-                    'under_35': np.random.uniform(0.25, 0.45),
-                    '35_to_65': np.random.uniform(0.35, 0.55),
-                    'over_65': np.random.uniform(0.15, 0.25)
+                    'under_35': _uniform(u[8], 0.25, 0.45),
+                    '35_to_65': _uniform(u[9], 0.35, 0.55),
+                    'over_65': _uniform(u[10], 0.15, 0.25)
                 },
                 'education_level': {
-                    'college_graduates': np.random.uniform(0.6, 0.9),
-                    'advanced_degrees': np.random.uniform(0.3, 0.6)
+                    'college_graduates': _uniform(u[11], 0.6, 0.9),
+                    'advanced_degrees': _uniform(u[12], 0.3, 0.6)
                 }
             },
             'economic_enrichment': {
-                'employment_rate': np.random.uniform(0.92, 0.98),
-                'job_growth_rate': np.random.uniform(0.02, 0.08),
-                'business_density': np.random.randint(50, 200),
-                'economic_diversity_index': np.random.uniform(0.6, 0.9)
+                'employment_rate': _uniform(u[13], 0.92, 0.98),
+                'job_growth_rate': _uniform(u[14], 0.02, 0.08),
+                'business_density': _randint(u[15], 50, 200),
+                'economic_diversity_index': _uniform(u[16], 0.6, 0.9)
             },
             'market_enrichment': {
                 'price_per_sqft_trends': self._generate_price_trends(),
-                'rental_yield_estimates': np.random.uniform(0.03, 0.08),
-                'market_velocity': np.random.uniform(0.4, 0.9),
-                'investment_activity': np.random.uniform(0.3, 0.8)
+                'rental_yield_estimates': _uniform(u[17], 0.03, 0.08),
+                'market_velocity': _uniform(u[18], 0.4, 0.9),
+                'investment_activity': _uniform(u[19], 0.3, 0.8)
             }
         }
-        
-        return {
-            'enrichment_features': enrichment_features,
-            'feature_count': self._count_enriched_features(enrichment_features),
-            'enrichment_quality': np.random.uniform(0.88, 0.96),
-            'coverage_completeness': np.random.uniform(0.85, 0.95)
-        }
     
     def _perform_spatial_analysis(self, lat: float, lon: float, radius_m: int) -> Dict[str, Any]:
         """Perform advanced spatial analysis."""
+        u = self._draw(6)
         spatial_metrics = {
             'spatial_clustering': {
                 'cluster_analysis': self._perform_cluster_analysis(),
                 'hotspot_detection': self._detect_spatial_hotspots(),
-                'spatial_autocorrelation': np.random.uniform(0.3, 0.8)
+                'spatial_autocorrelation': _uniform(u[0], 0.3, 0.8)
             },
             'accessibility_analysis': {
                 'isochrone_analysis': self._perform_isochrone_analysis(),
                 'multi_modal_accessibility': self._calculate_multimodal_access(),
-                'service_area_coverage': np.random.uniform(0.7, 0.95)
+                'service_area_coverage': _uniform(u[1], 0.7, 0.95)
             },
             'land_use_analysis': {
                 'land_use_mix': self._analyze_land_use_mix(),
-                'zoning_compatibility': np.random.uniform(0.6, 0.9),
-                'development_intensity': np.random.uniform(0.4, 0.8)
+                'zoning_compatibility': _uniform(u[2], 0.6, 0.9),
+                'development_intensity': _uniform(u[3], 0.4, 0.8)
             },
             'network_analysis': {
-                'connectivity_index': np.random.uniform(0.5, 0.9),
+                'connectivity_index': _uniform(u[4], 0.5, 0.9),
                 'centrality_measures': self._calculate_centrality_measures(),
-                'network_efficiency': np.random.uniform(0.6, 0.85)
+                'network_efficiency': _uniform(u[5], 0.6, 0.85)
             }
         }
         
@@ -261,28 +345,29 @@ class DataProcessingEngine:
     
     def _perform_temporal_analysis(self) -> Dict[str, Any]:
         """Perform comprehensive temporal analysis."""
+        u = self._draw(8)
         temporal_patterns = {
             'trend_analysis': {
                 'linear_trends': self._detect_linear_trends(),
                 'seasonal_patterns': self._detect_seasonal_patterns(),
                 'cyclical_components': self._detect_cyclical_patterns(),
-                'trend_strength': np.random.uniform(0.4, 0.8)
+                'trend_strength': _uniform(u[0], 0.4, 0.8)
             },
             'change_point_detection': {
-                'structural_breaks': np.random.randint(1, 5),
-                'change_point_confidence': np.random.uniform(0.7, 0.95),
+                'structural_breaks': _randint(u[1], 1, 5),
+                'change_point_confidence': _uniform(u[2], 0.7, 0.95),
                 'regime_changes': self._detect_regime_changes()
             },
             'forecasting_metrics': {
                 'forecast_horizon': '24 months',
                 'prediction_intervals': self._generate_prediction_intervals(),
-                'forecast_accuracy': np.random.uniform(0.75, 0.90),
-                'model_stability': np.random.uniform(0.80, 0.95)
+                'forecast_accuracy': _uniform(u[3], 0.75, 0.90),
+                'model_stability': _uniform(u[4], 0.80, 0.95)
             },
             'volatility_analysis': {
-                'price_volatility': np.random.uniform(0.1, 0.3),
-                'volume_volatility': np.random.uniform(0.15, 0.4),
-                'volatility_clustering': np.random.uniform(0.3, 0.7)
+                'price_volatility': _uniform(u[5], 0.1, 0.3),
+                'volume_volatility': _uniform(u[6], 0.15, 0.4),
+                'volatility_clustering': _uniform(u[7], 0.3, 0.7)
             }
         }
         
@@ -290,198 +375,244 @@ class DataProcessingEngine:
     
     def _perform_quality_assessment(self, processing_results: Dict) -> Dict[str, Any]:
         """Perform comprehensive data quality assessment."""
-        quality_dimensions = {}
+        thresholds = np.fromiter(self.quality_thresholds.values(), dtype=np.float64, count=len(self.quality_thresholds))
+        u = self._sample(thresholds.size + 1)
         
-        for dimension, threshold in self.quality_thresholds.items():
-            score = np.random.uniform(threshold - 0.05, min(threshold + 0.10, 1.0))
-            quality_dimensions[dimension] = {
+        # Score every dimension in one vectorized pass
+        low = thresholds - 0.05
+        scores = low + (np.minimum(thresholds + 0.10, 1.0) - low) * u[:-1]
+        passes = scores >= thresholds
+        improvement = np.maximum(0.0, thresholds + 0.05 - scores)
+        
+        quality_dimensions = {
+            dimension: {
                 'score': score,
                 'threshold': threshold,
-                'status': 'Pass' if score >= threshold else 'Fail',
-                'improvement_potential': max(0, threshold + 0.05 - score)
+                'status': 'Pass' if passed else 'Fail',
+                'improvement_potential': potential
             }
+            for dimension, threshold, score, passed, potential in zip(
+                self.quality_thresholds, self.quality_thresholds.values(),
+                scores.tolist(), passes.tolist(), improvement.tolist()
+            )
+        }
         
-        overall_quality = np.mean([dim['score'] for dim in quality_dimensions.values()])
+        overall_quality = float(scores.mean())
         
         return {
             'quality_dimensions': quality_dimensions,
             'overall_quality_score': overall_quality,
             'quality_grade': self._calculate_quality_grade(overall_quality),
-            'quality_trend': np.random.choice(['Improving', 'Stable', 'Declining']),
+            'quality_trend': _choice(u[-1], _QUALITY_TRENDS),
             'quality_recommendations': self._generate_quality_recommendations(quality_dimensions)
         }
     
     def _generate_processing_summary(self, results: Dict) -> Dict[str, Any]:
         """Generate comprehensive processing summary."""
+        stage_count = len(self.processing_stages)
+        samples = self._sample(stage_count + 8)
+        u = samples[stage_count:].tolist()
         return {
-            'total_processing_time': sum(np.random.uniform(0.3, 0.8) for _ in range(7)),
+            'total_processing_time': float((0.3 + 0.5 * samples[:stage_count]).sum()),
             'records_processed': results['ingestion']['total_records'],
-            'processing_efficiency': np.random.uniform(0.85, 0.95),
-            'success_rate': np.random.uniform(0.95, 0.99),
+            'processing_efficiency': _uniform(u[0], 0.85, 0.95),
+            'success_rate': _uniform(u[1], 0.95, 0.99),
             'data_coverage': {
-                'geographic': np.random.uniform(0.90, 0.99),
-                'temporal': np.random.uniform(0.85, 0.95),
-                'thematic': np.random.uniform(0.88, 0.96)
+                'geographic': _uniform(u[2], 0.90, 0.99),
+                'temporal': _uniform(u[3], 0.85, 0.95),
+                'thematic': _uniform(u[4], 0.88, 0.96)
             },
             'enhancement_metrics': {
-                'data_richness_increase': f"{np.random.uniform(150, 300):.0f}%",
-                'accuracy_improvement': f"{np.random.uniform(15, 35):.1f}%",
-                'completeness_improvement': f"{np.random.uniform(20, 40):.1f}%"
+                'data_richness_increase': f"{_uniform(u[5], 150, 300):.0f}%",
+                'accuracy_improvement': f"{_uniform(u[6], 15, 35):.1f}%",
+                'completeness_improvement': f"{_uniform(u[7], 20, 40):.1f}%"
             }
         }
     
+    def _draw(self, n: int) -> List[float]:
+        """Draw ``n`` unit-interval samples in a single vectorized call."""
+        rng = getattr(self._branch_state, 'rng', self._rng)
+        return rng.random(n).tolist()
+    
+    def _sample(self, shape: Tuple[int, ...]) -> np.ndarray:
+        """Draw a unit-interval sample array of the given shape."""
+        rng = getattr(self._branch_state, 'rng', self._rng)
+        return rng.random(shape)
+    
+    def _run_branch(self, rng: np.random.Generator, stage: Callable[..., Dict[str, Any]], *args) -> Dict[str, Any]:
+        """Run an independent pipeline stage with its own generator on the current thread."""
+        self._branch_state.rng = rng
+        try:
+            return stage(*args)
+        finally:
+            del self._branch_state.rng
+    
     # Helper methods for generating realistic analysis results
     def _calculate_geographic_coverage(self, lat: float, lon: float, radius_m: int) -> Dict[str, Any]:
+        u = self._draw(2)
         return {
             'coverage_radius': f"{radius_m/1000:.1f} km",
             'area_covered': f"{np.pi * (radius_m/1000)**2:.2f} sq km",
-            'data_point_density': f"{np.random.randint(50, 200)} points/sq km",
-            'coverage_completeness': np.random.uniform(0.85, 0.98)
+            'data_point_density': f"{_randint(u[0], 50, 200)} points/sq km",
+            'coverage_completeness': _uniform(u[1], 0.85, 0.98)
         }
     
     def _calculate_temporal_coverage(self) -> Dict[str, Any]:
+        u = self._draw(3)
         return {
-            'historical_depth': f"{np.random.randint(5, 15)} years",
+            'historical_depth': f"{_randint(u[0], 5, 15)} years",
             'data_frequency': 'Daily to Monthly',
-            'temporal_completeness': np.random.uniform(0.80, 0.95),
-            'real_time_coverage': np.random.uniform(0.70, 0.90)
+            'temporal_completeness': _uniform(u[1], 0.80, 0.95),
+            'real_time_coverage': _uniform(u[2], 0.70, 0.90)
         }
     
-    def _perform_outlier_detection(self) -> Dict[str, Any]:
+    def _perform_outlier_detection(self, ingestion_data: Dict) -> Dict[str, Any]:
+        counts, mask = _outlier_flags(structured_to_unstructured(ingestion_data['ingestion_stats'], dtype=np.float64))
+        flagged_rows = mask.any(axis=1)
+        u = self._draw(1)
         return {
-            'outliers_detected': np.random.randint(10, 100),
-            'outlier_percentage': np.random.uniform(0.01, 0.05),
-            'detection_methods': ['Z-score', 'IQR', 'Isolation Forest'],
-            'false_positive_rate': np.random.uniform(0.02, 0.08)
+            'outliers_detected': int(flagged_rows.sum()),
+            'outlier_percentage': float(flagged_rows.mean()),
+            'outliers_by_field': dict(zip(_INGESTION_DTYPE.names, counts.tolist())),
+            'detection_methods': _OUTLIER_METHODS,
+            'false_positive_rate': _uniform(u[0], 0.02, 0.08)
         }
     
     def _analyze_data_distributions(self) -> Dict[str, Any]:
+        u = self._draw(4)
         return {
-            'normal_distributions': np.random.randint(15, 30),
-            'skewed_distributions': np.random.randint(5, 15),
-            'distribution_tests_passed': np.random.uniform(0.80, 0.95),
-            'normality_score': np.random.uniform(0.70, 0.90)
+            'normal_distributions': _randint(u[0], 15, 30),
+            'skewed_distributions': _randint(u[1], 5, 15),
+            'distribution_tests_passed': _uniform(u[2], 0.80, 0.95),
+            'normality_score': _uniform(u[3], 0.70, 0.90)
         }
     
     def _perform_correlation_checks(self) -> Dict[str, Any]:
+        u = self._draw(3)
         return {
-            'high_correlations': np.random.randint(5, 20),
+            'high_correlations': _randint(u[0], 5, 20),
             'correlation_threshold': 0.8,
-            'multicollinearity_detected': np.random.choice([True, False]),
-            'correlation_matrix_rank': np.random.randint(80, 95)
+            'multicollinearity_detected': _choice(u[1], _DETECTION_OUTCOMES),
+            'correlation_matrix_rank': _randint(u[2], 80, 95)
         }
     
     def _calculate_quality_improvement(self) -> Dict[str, float]:
+        u = self._draw(4)
         return {
-            'completeness_improvement': np.random.uniform(0.10, 0.25),
-            'accuracy_improvement': np.random.uniform(0.05, 0.20),
-            'consistency_improvement': np.random.uniform(0.08, 0.18),
-            'overall_improvement': np.random.uniform(0.12, 0.22)
+            'completeness_improvement': _uniform(u[0], 0.10, 0.25),
+            'accuracy_improvement': _uniform(u[1], 0.05, 0.20),
+            'consistency_improvement': _uniform(u[2], 0.08, 0.18),
+            'overall_improvement': _uniform(u[3], 0.12, 0.22)
         }
     
-    def _count_enriched_features(self, features: Dict) -> int:
-        count = 0
-        for category in features.values():
-            if isinstance(category, dict):
-                count += len(category)
-        return count
-    
     def _generate_price_trends(self) -> Dict[str, float]:
+        u = self._draw(4)
         return {
-            '1_year_trend': np.random.uniform(0.02, 0.12),
-            '3_year_trend': np.random.uniform(0.15, 0.35),
-            '5_year_trend': np.random.uniform(0.25, 0.60),
-            'trend_volatility': np.random.uniform(0.05, 0.20)
+            '1_year_trend': _uniform(u[0], 0.02, 0.12),
+            '3_year_trend': _uniform(u[1], 0.15, 0.35),
+            '5_year_trend': _uniform(u[2], 0.25, 0.60),
+            'trend_volatility': _uniform(u[3], 0.05, 0.20)
         }
     
     def _perform_cluster_analysis(self) -> Dict[str, Any]:
+        u = self._draw(4)
         return {
-            'clusters_identified': np.random.randint(3, 8),
-            'cluster_quality': np.random.uniform(0.70, 0.90),
-            'silhouette_score': np.random.uniform(0.60, 0.85),
-            'cluster_stability': np.random.uniform(0.75, 0.95)
+            'clusters_identified': _randint(u[0], 3, 8),
+            'cluster_quality': _uniform(u[1], 0.70, 0.90),
+            'silhouette_score': _uniform(u[2], 0.60, 0.85),
+            'cluster_stability': _uniform(u[3], 0.75, 0.95)
         }
     
     def _detect_spatial_hotspots(self) -> Dict[str, Any]:
+        u = self._draw(4)
         return {
-            'hotspots_detected': np.random.randint(2, 10),
-            'hotspot_intensity': np.random.uniform(0.60, 0.90),
-            'statistical_significance': np.random.uniform(0.95, 0.99),
-            'hotspot_persistence': np.random.uniform(0.70, 0.90)
+            'hotspots_detected': _randint(u[0], 2, 10),
+            'hotspot_intensity': _uniform(u[1], 0.60, 0.90),
+            'statistical_significance': _uniform(u[2], 0.95, 0.99),
+            'hotspot_persistence': _uniform(u[3], 0.70, 0.90)
         }
     
     def _perform_isochrone_analysis(self) -> Dict[str, Any]:
+        u = self._draw(3)
         return {
-            'transport_modes': ['Walking', 'Cycling', 'Public Transit', 'Driving'],
-            'isochrone_coverage': np.random.uniform(0.75, 0.95),
-            'accessibility_score': np.random.uniform(0.60, 0.90),
-            'multi_modal_integration': np.random.uniform(0.70, 0.85)
+            'transport_modes': _TRANSPORT_MODES,
+            'isochrone_coverage': _uniform(u[0], 0.75, 0.95),
+            'accessibility_score': _uniform(u[1], 0.60, 0.90),
+            'multi_modal_integration': _uniform(u[2], 0.70, 0.85)
         }
     
     def _calculate_multimodal_access(self) -> Dict[str, float]:
+        u = self._draw(4)
         return {
-            'walking_accessibility': np.random.uniform(0.60, 0.90),
-            'cycling_accessibility': np.random.uniform(0.50, 0.80),
-            'transit_accessibility': np.random.uniform(0.70, 0.95),
-            'driving_accessibility': np.random.uniform(0.80, 0.95)
+            'walking_accessibility': _uniform(u[0], 0.60, 0.90),
+            'cycling_accessibility': _uniform(u[1], 0.50, 0.80),
+            'transit_accessibility': _uniform(u[2], 0.70, 0.95),
+            'driving_accessibility': _uniform(u[3], 0.80, 0.95)
         }
     
     def _analyze_land_use_mix(self) -> Dict[str, float]:
+        u = self._draw(4)
         return {
-            'residential_percentage': np.random.uniform(0.40, 0.70),
-            'commercial_percentage': np.random.uniform(0.15, 0.35),
-            'mixed_use_percentage': np.random.uniform(0.10, 0.25),
-            'diversity_index': np.random.uniform(0.60, 0.85)
+            'residential_percentage': _uniform(u[0], 0.40, 0.70),
+            'commercial_percentage': _uniform(u[1], 0.15, 0.35),
+            'mixed_use_percentage': _uniform(u[2], 0.10, 0.25),
+            'diversity_index': _uniform(u[3], 0.60, 0.85)
         }
     
     def _calculate_centrality_measures(self) -> Dict[str, float]:
+        u = self._draw(4)
         return {
-            'betweenness_centrality': np.random.uniform(0.30, 0.80),
-            'closeness_centrality': np.random.uniform(0.40, 0.85),
-            'eigenvector_centrality': np.random.uniform(0.25, 0.75),
-            'degree_centrality': np.random.uniform(0.35, 0.80)
+            'betweenness_centrality': _uniform(u[0], 0.30, 0.80),
+            'closeness_centrality': _uniform(u[1], 0.40, 0.85),
+            'eigenvector_centrality': _uniform(u[2], 0.25, 0.75),
+            'degree_centrality': _uniform(u[3], 0.35, 0.80)
         }
     
     def _detect_linear_trends(self) -> Dict[str, Any]:
+        u = self._draw(4)
         return {
-            'trend_strength': np.random.uniform(0.40, 0.80),
-            'trend_direction': np.random.choice(['Increasing', 'Decreasing', 'Stable']),
-            'trend_significance': np.random.uniform(0.85, 0.99),
-            'r_squared': np.random.uniform(0.60, 0.90)
+            'trend_strength': _uniform(u[0], 0.40, 0.80),
+            'trend_direction': _choice(u[1], _TREND_DIRECTIONS),
+            'trend_significance': _uniform(u[2], 0.85, 0.99),
+            'r_squared': _uniform(u[3], 0.60, 0.90)
         }
     
     def _detect_seasonal_patterns(self) -> Dict[str, Any]:
+        u = self._draw(3)
         return {
-            'seasonal_strength': np.random.uniform(0.30, 0.70),
-            'peak_months': ['May', 'June', 'September', 'October'],
-            'seasonal_amplitude': np.random.uniform(0.10, 0.25),
-            'pattern_consistency': np.random.uniform(0.75, 0.95)
+            'seasonal_strength': _uniform(u[0], 0.30, 0.70),
+            'peak_months': _PEAK_MONTHS,
+            'seasonal_amplitude': _uniform(u[1], 0.10, 0.25),
+            'pattern_consistency': _uniform(u[2], 0.75, 0.95)
         }
     
     def _detect_cyclical_patterns(self) -> Dict[str, Any]:
+        u = self._draw(4)
         return {
-            'cycle_length': f"{np.random.randint(3, 8)} years",
-            'cycle_amplitude': np.random.uniform(0.15, 0.35),
-            'cycle_regularity': np.random.uniform(0.60, 0.85),
-            'current_cycle_position': np.random.choice(['Peak', 'Trough', 'Rising', 'Falling'])
+            'cycle_length': f"{_randint(u[0], 3, 8)} years",
+            'cycle_amplitude': _uniform(u[1], 0.15, 0.35),
+            'cycle_regularity': _uniform(u[2], 0.60, 0.85),
+            'current_cycle_position': _choice(u[3], _CYCLE_POSITIONS)
         }
     
     def _detect_regime_changes(self) -> List[Dict[str, Any]]:
-        regime_count = np.random.randint(1, 4)
+        regime_count = _randint(self._draw(1)[0], 1, 4)
+        u = self._draw(2 * regime_count)
         regimes = []
         for i in range(regime_count):
             regimes.append({
-                'regime_start': f"{2020 + i}-{np.random.randint(1, 13):02d}",
+                'regime_start': f"{2020 + i}-{_randint(u[2 * i], 1, 13):02d}",
                 'regime_characteristics': f"Regime {i+1}",
-                'confidence': np.random.uniform(0.70, 0.95)
+                'confidence': _uniform(u[2 * i + 1], 0.70, 0.95)
             })
         return regimes
     
     def _generate_prediction_intervals(self) -> Dict[str, float]:
+        u = self._draw(3)
         return {
-            '50%_confidence': np.random.uniform(0.05, 0.15),
-            '80%_confidence': np.random.uniform(0.10, 0.25),
-            '95%_confidence': np.random.uniform(0.15, 0.35)
+            '50%_confidence': _uniform(u[0], 0.05, 0.15),
+            '80%_confidence': _uniform(u[1], 0.10, 0.25),
+            '95%_confidence': _uniform(u[2], 0.15, 0.35)
         }
     
     def _calculate_quality_grade(self, score: float) -> str:
@@ -510,8 +641,8 @@ class DataProcessingEngine:
     def _generate_data_lineage(self) -> Dict[str, Any]:
         """Generate data lineage information."""
         return {
-            'source_systems': ['NYC Open Data', 'MLS', 'Census Bureau', 'DOB', 'DOF'],
-            'transformation_steps': ['Extraction', 'Validation', 'Cleansing', 'Enrichment', 'Aggregation'],
+            'source_systems': _SOURCE_SYSTEMS,
+            'transformation_steps': _TRANSFORMATION_STEPS,
             'data_governance': {
                 'privacy_compliance': 'GDPR/CCPA Compliant',
                 'retention_policy': '7 years',
@@ -519,29 +650,23 @@ class DataProcessingEngine:
                 'audit_trail': 'Complete transaction log'
             },
             'refresh_frequency': 'Daily',
-            'last_updated': datetime.now().isoformat()
+            'last_updated': self._run_timestamp
         }
     
     def _calculate_overall_quality_metrics(self, quality_data: Dict) -> Dict[str, Any]:
         """Calculate overall quality metrics."""
+        u = self._draw(5)
         return {
-            'data_trust_score': np.random.uniform(0.85, 0.95),
-            'fitness_for_purpose': np.random.uniform(0.88, 0.96),
-            'business_value_score': np.random.uniform(0.80, 0.92),
-            'operational_efficiency': np.random.uniform(0.83, 0.94),
-            'compliance_score': np.random.uniform(0.90, 0.98)
+            'data_trust_score': _uniform(u[0], 0.85, 0.95),
+            'fitness_for_purpose': _uniform(u[1], 0.88, 0.96),
+            'business_value_score': _uniform(u[2], 0.80, 0.92),
+            'operational_efficiency': _uniform(u[3], 0.83, 0.94),
+            'compliance_score': _uniform(u[4], 0.90, 0.98)
         }
     
     def _generate_data_recommendations(self, results: Dict) -> List[str]:
         """Generate data improvement recommendations."""
-        recommendations = [
-            "Implement real-time data quality monitoring",
-            "Enhance spatial data accuracy with GPS validation",
-            "Expand temporal coverage for trend analysis",
-            "Integrate additional external data sources",
-            "Implement automated anomaly detection",
-            "Enhance data freshness monitoring",
-            "Improve cross-source data reconciliation"
-        ]
-        
-        return np.random.choice(recommendations, size=np.random.randint(3, 6), replace=False).tolist()
+        count = _randint(self._draw(1)[0], 3, 6)
+        # Sample indices rather than strings so NumPy never builds an object array
+        indices = self._rng.choice(len(_DATA_RECOMMENDATIONS), size=count, replace=False)
+        return [_DATA_RECOMMENDATIONS[index] for index in indices]
@@ -1,19 +1,145 @@
 
 
+import copy
+import heapq
+import logging
+import threading
+from bisect import bisect_left, bisect_right
 import numpy as np
-import pandas as pd
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Tuple
-import json
-import time
-from ..tools.geocode import geocode
+from collections import OrderedDict
+from typing import Dict, List, Any, Tuple, Optional
+from .sampling import choice as _choice, randint as _randint, uniform as _uniform
+
+logger = logging.getLogger("kiyosaki.agent")
+
+
+# Coordinates are quantized to 4 decimal places (~11 m) so nearby queries share a cache entry.
+# Caches belong to an engine instance, so they only pay off for callers that reuse one engine.
+_CACHE_PRECISION = 4
+_MAX_CACHED_ANALYSES = 256
+
+# Engines may be shared by concurrent requests, so cache reads and writes are serialized
+_CACHE_LOCK = threading.Lock()
+
+# Themes sampled into each sentiment report
+_THEMES = (
+    'Infrastructure Development',
+    'Employment Growth',
+    'Retail Expansion',
+    'Transportation Improvements',
+    'School District Quality',
+    'Safety Improvements',
+    'Cultural Amenities'
+)
+
+# Segment classification fields that do not depend on the location
+_SEGMENT_STATIC = {
+    'primary_segment': 'Urban Core',
+    'secondary_segment': 'High-Density Residential',
+    'market_maturity': 'Established',
+    'demographic_profile': 'Young Professionals & Families',
+    'price_tier': 'Premium',
+    'development_stage': 'Mature with Selective Redevelopment'
+}
+
+# Fixed vocabularies shared by every result instead of rebuilt per call
+_LISTING_TRENDS = ('Rising', 'Stable', 'Declining')
+_TOP_DEVELOPERS = ('Developer A', 'Developer B', 'Developer C')
+_SENTIMENT_TRENDS = ('Improving', 'Stable', 'Declining')
+_RISK_TRENDS = ('Increasing', 'Stable', 'Decreasing')
+
+# Historical trend windows and their per-period vocabulary
+_TREND_PERIODS = ('1Y', '3Y', '5Y', '10Y')
+_VOLUME_TRENDS = ('Increasing', 'Stable', 'Decreasing')
+_PEAK_MONTHS = ('May', 'June', 'September')
+
+# Per-category risk playbooks
+_MITIGATION_STRATEGIES = {
+    'market_risk': ('Diversification', 'Hedging', 'Flexible exit strategies'),
+    'liquidity_risk': ('Market timing', 'Phased investment', 'Reserve funds'),
+    'regulatory_risk': ('Legal due diligence', 'Compliance monitoring', 'Government relations'),
+    'environmental_risk': ('Environmental assessment', 'Insurance coverage', 'Climate adaptation'),
+    'demographic_risk': ('Market research', 'Flexible property use', 'Community engagement'),
+    'economic_risk': ('Economic monitoring', 'Conservative leverage', 'Multiple scenarios')
+}
+_DEFAULT_MITIGATION_STRATEGIES = ('Standard risk management',)
+
+_MONITORING_INDICATORS = {
+    'market_risk': ('Price volatility', 'Volume trends', 'Inventory levels'),
+    'liquidity_risk': ('Days on market', 'Transaction volume', 'Financing availability'),
+    'regulatory_risk': ('Zoning changes', 'Tax policy', 'Development approvals'),
+    'environmental_risk': ('Climate data', 'Environmental violations', 'Insurance rates'),
+    'demographic_risk': ('Population trends', 'Income changes', 'Age distribution'),
+    'economic_risk': ('Employment rates', 'Interest rates', 'Economic growth')
+}
+_DEFAULT_MONITORING_INDICATORS = ('General market indicators',)
+_SEVERITIES = ('Low', 'Medium', 'High')
+_STRESS_SCENARIOS = ('recession', 'interest_rate_shock', 'local_economic_downturn')
+
+# Grade ladders as ascending cut points. A score strictly above the k-th threshold
+# climbs past it (bisect_left); the risk ladder steps up at each threshold (bisect_right).
+_INVESTMENT_GRADE_THRESHOLDS = (0.06, 0.08, 0.10, 0.12)
+_INVESTMENT_GRADES = ('C (Below Average)', 'B (Fair)', 'B+ (Good)', 'A (Strong)', 'A+ (Exceptional)')
+
+_SENTIMENT_THRESHOLDS = (-0.6, -0.2, 0.2, 0.6)
+_SENTIMENT_CLASSES = ('Very Negative', 'Negative', 'Neutral', 'Positive', 'Very Positive')
+
+_RISK_GRADE_THRESHOLDS = (0.2, 0.35, 0.5, 0.65)
+_RISK_GRADES = ('AAA (Minimal Risk)', 'AA (Low Risk)', 'A (Moderate Risk)', 'BBB (Elevated Risk)', 'BB (High Risk)')
+
+# Key schemas zipped with the sampled prediction values
+_FORECAST_HORIZONS = ('6_months', '12_months', '24_months', '60_months')
+_RISK_RETURN_FIELDS = ('downside_risk', 'upside_potential', 'risk_adjusted_return')
+
+# Sampling bounds for the market predictions: four price forecast horizons,
+# three risk/return figures and the cycle confidence
+_PREDICTION_LOW = np.array([0.02, 0.04, 0.08, 0.15, 0.1, 0.2, 0.06, 0.7])
+_PREDICTION_HIGH = np.array([0.08, 0.12, 0.20, 0.40, 0.3, 0.5, 0.15, 0.9])
+
+_INVESTMENT_TIMING = {
+    'optimal_entry_window': 'Next 6-12 months',
+    'hold_period_recommendation': '3-7 years',
+    'exit_strategy_timing': 'Monitor at 5 year mark'
+}
+
+
+def _location_key(lat: float, lon: float, *extra: Any) -> Tuple[Any, ...]:
+    """Build a cache key from quantized coordinates plus any extra inputs."""
+    return (round(lat, _CACHE_PRECISION), round(lon, _CACHE_PRECISION)) + extra
+
+
+def _cache_get(cache: OrderedDict, key: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+    """Return a copy of a cached analysis, marking it as most recently used."""
+    with _CACHE_LOCK:
+        result = cache.get(key)
+        if result is None:
+            return None
+        cache.move_to_end(key)
+    return copy.deepcopy(result)
+
+
+def _cache_put(cache: OrderedDict, key: Tuple[Any, ...], result: Dict[str, Any]) -> Dict[str, Any]:
+    """Store a copy of an analysis, evicting the least recently used entries beyond the cap.
+    
+    Callers own the returned dict and later hits get their own copies, so
+    mutating a result never leaks into the cache.
+    """
+    stored = copy.deepcopy(result)
+    with _CACHE_LOCK:
+        cache[key] = stored
+        while len(cache) > _MAX_CACHED_ANALYSES:
+            cache.popitem(last=False)
+    return result
 
 
 class MarketIntelligenceEngine:
     """Advanced market intelligence and trend analysis system."""
     
-    def __init__(self):
-        self.trend_cache = {}
+    __slots__ = ('_rng', 'trend_cache', 'sentiment_weights')
+    
+    def __init__(self, seed: Optional[int] = None):
+        self._rng = np.random.default_rng(seed)
+        self.trend_cache = OrderedDict()
         self.sentiment_weights = {
             'luxury_development': 0.25,
             'infrastructure_investment': 0.20,
@@ -22,37 +148,42 @@ class MarketIntelligenceEngine:
             'economic_indicators': 0.25
         }
         
-    def analyze_market_trends(self, lat: float, lon: float, radius_m: int) -> Dict[str, Any]:
-        """Perform comprehensive market trend analysis."""
-        print(f"🔍 Initializing Market Intelligence Engine...")
-        time.sleep(0.5)  # Simulate processing time
+    def analyze_market_trends(self, lat: float, lon: float, radius_m: int,
+                              force_refresh: bool = False) -> Dict[str, Any]:
+        """Perform comprehensive market trend analysis.
+        
+        The full result, scores included, is cached per location; pass
+        ``force_refresh`` to recompute it and replace the cached entry.
+        """
+        cache_key = _location_key(lat, lon, radius_m)
+        if not force_refresh:
+            cached = _cache_get(self.trend_cache, cache_key)
+            if cached is not None:
+                return cached
+        
+        logger.info("🔍 Initializing Market Intelligence Engine...")
         
         # Stage 1: Geographic Market Segmentation
-        print("📊 Stage 1/5: Geographic Market Segmentation")
+        logger.debug("📊 Stage 1/5: Geographic Market Segmentation")
         market_segment = self._determine_market_segment(lat, lon)
-        time.sleep(0.3)
         
         # Stage 2: Historical Trend Analysis
-        print("📈 Stage 2/5: Historical Trend Analysis")
+        logger.debug("📈 Stage 2/5: Historical Trend Analysis")
         historical_trends = self._analyze_historical_trends(lat, lon, radius_m)
-        time.sleep(0.4)
         
         # Stage 3: Competitive Landscape Mapping
-        print("🗺️  Stage 3/5: Competitive Landscape Mapping")
+        logger.debug("🗺️  Stage 3/5: Competitive Landscape Mapping")
         competitive_analysis = self._map_competitive_landscape(lat, lon, radius_m)
-        time.sleep(0.3)
         
         # Stage 4: Economic Factor Integration
-        print("💹 Stage 4/5: Economic Factor Integration")
+        logger.debug("💹 Stage 4/5: Economic Factor Integration")
         economic_factors = self._integrate_economic_factors(market_segment)
-        time.sleep(0.4)
         
         # Stage 5: Predictive Modeling
-        print("🔮 Stage 5/5: Predictive Modeling & Forecasting")
+        logger.debug("🔮 Stage 5/5: Predictive Modeling & Forecasting")
         predictions = self._generate_market_predictions(historical_trends, economic_factors)
-        time.sleep(0.5)
         
-        return {
+        return _cache_put(self.trend_cache, cache_key, {
             'market_segment': market_segment,
             'historical_trends': historical_trends,
             'competitive_analysis': competitive_analysis,
@@ -61,291 +192,277 @@ class MarketIntelligenceEngine:
             'confidence_score': self._calculate_confidence_score(historical_trends, economic_factors),
             'market_timing_score': self._calculate_timing_score(),
             'investment_grade': self._determine_investment_grade(predictions)
-        }
+        })
+    
+    def _draw(self, n: int) -> List[float]:
+        """Draw ``n`` unit-interval samples in a single vectorized call."""
+        return self._rng.random(n).tolist()
     
     def _determine_market_segment(self, lat: float, lon: float) -> Dict[str, Any]:
         """Classify the geographic area into market segments."""
-        segments = {
-            'primary_segment': 'Urban Core',
-            'secondary_segment': 'High-Density Residential',
-            'market_maturity': 'Established',
-            'gentrification_index': np.random.uniform(0.4, 0.8),
-            'luxury_penetration': np.random.uniform(0.2, 0.6),
-            'demographic_profile': 'Young Professionals & Families',
-            'price_tier': 'Premium',
-            'development_stage': 'Mature with Selective Redevelopment'
+        u = self._draw(2)
+        return {
+            **_SEGMENT_STATIC,
+            'gentrification_index': _uniform(u[0], 0.4, 0.8),
+            'luxury_penetration': _uniform(u[1], 0.2, 0.6)
         }
-        return segments
     
     def _analyze_historical_trends(self, lat: float, lon: float, radius_m: int) -> Dict[str, Any]:
         """Analyze historical market trends and patterns."""
-        # Simulate complex trend analysis
-        trend_periods = ['1Y', '3Y', '5Y', '10Y']
-        trends = {}
+        # One row of samples per field, one column per period
+        n = len(_TREND_PERIODS)
+        u = self._rng.random(5 * n + 2)
+        appreciation, volume, days, volatility, variance = u[:5 * n].reshape(5, n)
         
-        for period in trend_periods:
-            trends[period] = {
-                'price_appreciation': np.random.uniform(0.03, 0.12),
-                'volume_trend': np.random.choice(['Increasing', 'Stable', 'Decreasing']),
-                'days_on_market': np.random.randint(15, 90),
-                'price_volatility': np.random.uniform(0.05, 0.25),
+        trends = {
+            period: {
+                'price_appreciation': appr,
+                'volume_trend': _VOLUME_TRENDS[vt],
+                'days_on_market': dom,
+                'price_volatility': vol,
                 'seasonal_patterns': {
-                    'peak_months': ['May', 'June', 'September'],
-                    'seasonal_variance': np.random.uniform(0.1, 0.3)
+                    'peak_months': _PEAK_MONTHS,
+                    'seasonal_variance': seas
                 }
             }
+            for period, appr, vt, dom, vol, seas in zip(
+                _TREND_PERIODS,
+                (0.03 + 0.09 * appreciation).tolist(),
+                (volume * len(_VOLUME_TRENDS)).astype(np.intp).tolist(),
+                (15 + (75 * days).astype(np.intp)).tolist(),
+                (0.05 + 0.2 * volatility).tolist(),
+                (0.1 + 0.2 * variance).tolist()
+            )
+        }
         
         return {
             'trends_by_period': trends,
             'dominant_trend': 'Appreciation with Moderate Volatility',
             'cycle_position': 'Mid-Cycle Growth',
-            'market_momentum': np.random.uniform(0.6, 0.9),
-            'trend_reliability': np.random.uniform(0.7, 0.95)
+            'market_momentum': _uniform(float(u[-2]), 0.6, 0.9),
+            'trend_reliability': _uniform(float(u[-1]), 0.7, 0.95)
         }
     
     def _map_competitive_landscape(self, lat: float, lon: float, radius_m: int) -> Dict[str, Any]:
         """Map and analyze competitive market landscape."""
+        u = self._draw(8)
         return {
             'inventory_levels': {
-                'current_inventory': np.random.randint(50, 200),
-                'months_supply': np.random.uniform(2.5, 8.0),
-                'new_listings_trend': np.random.choice(['Rising', 'Stable', 'Declining'])
+                'current_inventory': _randint(u[0], 50, 200),
+                'months_supply': _uniform(u[1], 2.5, 8.0),
+                'new_listings_trend': _choice(u[2], _LISTING_TRENDS)
             },
             'price_positioning': {
-                'percentile_rank': np.random.uniform(0.4, 0.9),
-                'price_premium': np.random.uniform(-0.1, 0.3),
+                'percentile_rank': _uniform(u[3], 0.4, 0.9),
+                'price_premium': _uniform(u[4], -0.1, 0.3),
                 'value_proposition': 'Strong'
             },
             'developer_activity': {
-                'active_developers': np.random.randint(5, 15),
-                'pipeline_units': np.random.randint(100, 500),
+                'active_developers': _randint(u[5], 5, 15),
+                'pipeline_units': _randint(u[6], 100, 500),
                 'completion_timeline': '18-36 months'
             },
             'market_share_analysis': {
-                'top_3_developers': ['Developer A', 'Developer B', 'Developer C'],
-                'market_concentration': np.random.uniform(0.3, 0.7)
+                'top_3_developers': _TOP_DEVELOPERS,
+                'market_concentration': _uniform(u[7], 0.3, 0.7)
             }
         }
     
     def _integrate_economic_factors(self, market_segment: Dict[str, Any]) -> Dict[str, Any]:
         """Integrate macro and micro economic factors."""
+        u = self._draw(9)
         return {
-            'interest_rate_sensitivity': np.random.uniform(0.6, 0.9),
-            'employment_growth': np.random.uniform(0.02, 0.08),
-            'income_growth': np.random.uniform(0.03, 0.07),
-            'population_growth': np.random.uniform(0.01, 0.05),
-            'infrastructure_investment': np.random.uniform(0.5, 1.0),
+            'interest_rate_sensitivity': _uniform(u[0], 0.6, 0.9),
+            'employment_growth': _uniform(u[1], 0.02, 0.08),
+            'income_growth': _uniform(u[2], 0.03, 0.07),
+            'population_growth': _uniform(u[3], 0.01, 0.05),
+            'infrastructure_investment': _uniform(u[4], 0.5, 1.0),
             'regulatory_environment': {
-                'zoning_flexibility': np.random.uniform(0.3, 0.8),
-                'tax_burden': np.random.uniform(0.4, 0.9),
-                'development_incentives': np.random.uniform(0.2, 0.7)
+                'zoning_flexibility': _uniform(u[5], 0.3, 0.8),
+                'tax_burden': _uniform(u[6], 0.4, 0.9),
+                'development_incentives': _uniform(u[7], 0.2, 0.7)
             },
-            'economic_resilience': np.random.uniform(0.6, 0.95)
+            'economic_resilience': _uniform(u[8], 0.6, 0.95)
         }
     
     def _generate_market_predictions(self, trends: Dict, economic: Dict) -> Dict[str, Any]:
         """Generate sophisticated market predictions."""
+        v = (_PREDICTION_LOW + (_PREDICTION_HIGH - _PREDICTION_LOW) * self._rng.random(_PREDICTION_LOW.size)).tolist()
         return {
-            'price_forecast': {
-                '6_months': np.random.uniform(0.02, 0.08),
-                '12_months': np.random.uniform(0.04, 0.12),
-                '24_months': np.random.uniform(0.08, 0.20),
-                '60_months': np.random.uniform(0.15, 0.40)
-            },
-            'risk_assessment': {
-                'downside_risk': np.random.uniform(0.1, 0.3),
-                'upside_potential': np.random.uniform(0.2, 0.5),
-                'risk_adjusted_return': np.random.uniform(0.06, 0.15)
-            },
+            'price_forecast': dict(zip(_FORECAST_HORIZONS, v[:4])),
+            'risk_assessment': dict(zip(_RISK_RETURN_FIELDS, v[4:7])),
             'market_cycle_prediction': {
                 'current_phase': 'Growth',
                 'next_inflection_point': '18-24 months',
-                'cycle_confidence': np.random.uniform(0.7, 0.9)
+                'cycle_confidence': v[7]
             },
-            'investment_timing': {
-                'optimal_entry_window': 'Next 6-12 months',
-                'hold_period_recommendation': '3-7 years',
-                'exit_strategy_timing': 'Monitor at 5 year mark'
-            }
+            'investment_timing': dict(_INVESTMENT_TIMING)
         }
     
     def _calculate_confidence_score(self, trends: Dict, economic: Dict) -> float:
         """Calculate overall confidence score for predictions."""
-        base_confidence = np.random.uniform(0.7, 0.95)
+        base_confidence = _uniform(self._rng.random(), 0.7, 0.95)
         trend_reliability = trends.get('trend_reliability', 0.8)
         economic_stability = economic.get('economic_resilience', 0.8)
         
-        return np.mean([base_confidence, trend_reliability, economic_stability])
+        return (base_confidence + trend_reliability + economic_stability) / 3.0
     
     def _calculate_timing_score(self) -> float:
         """Calculate market timing score."""
-        return np.random.uniform(0.6, 0.9)
+        return _uniform(self._rng.random(), 0.6, 0.9)
     
     def _determine_investment_grade(self, predictions: Dict) -> str:
         """Determine investment grade based on predictions."""
         risk_return = predictions['risk_assessment']['risk_adjusted_return']
-        if risk_return > 0.12:
-            return 'A+ (Exceptional)'
-        elif risk_return > 0.10:
-            return 'A (Strong)'
-        elif risk_return > 0.08:
-            return 'B+ (Good)'
-        elif risk_return > 0.06:
-            return 'B (Fair)'
-        else:
-            return 'C (Below Average)'
+        return _INVESTMENT_GRADES[bisect_left(_INVESTMENT_GRADE_THRESHOLDS, risk_return)]
 
 
 class SentimentAnalysisEngine:
     """Advanced sentiment analysis for real estate markets."""
     
-    def __init__(self):
+    __slots__ = ('_rng', 'sentiment_sources', 'sentiment_cache')
+    
+    def __init__(self, seed: Optional[int] = None):
+        self._rng = np.random.default_rng(seed)
         self.sentiment_sources = [
             'news_articles', 'social_media', 'broker_reports', 
             'government_publications', 'economic_reports'
         ]
+        self.sentiment_cache = OrderedDict()
     
     def analyze_market_sentiment(self, lat: float, lon: float) -> Dict[str, Any]:
         """Perform comprehensive sentiment analysis."""
-        print("🎭 Analyzing Market Sentiment...")
-        time.sleep(0.4)
+        cache_key = _location_key(lat, lon)
+        cached = _cache_get(self.sentiment_cache, cache_key)
+        if cached is not None:
+            return cached
+        
+        logger.info("🎭 Analyzing Market Sentiment...")
         
         sentiment_scores = {}
-        for source in self.sentiment_sources:
+        u = self._draw(4 * len(self.sentiment_sources) + 2)
+        for i, source in enumerate(self.sentiment_sources):
+            v = u[4 * i:4 * i + 4]
             sentiment_scores[source] = {
-                'sentiment_score': np.random.uniform(-1.0, 1.0),
-                'confidence': np.random.uniform(0.6, 0.95),
-                'volume': np.random.randint(10, 100),
-                'trend': np.random.choice(['Improving', 'Stable', 'Declining'])
+                'sentiment_score': _uniform(v[0], -1.0, 1.0),
+                'confidence': _uniform(v[1], 0.6, 0.95),
+                'volume': _randint(v[2], 10, 100),
+                'trend': _choice(v[3], _SENTIMENT_TRENDS)
             }
         
-        overall_sentiment = np.mean([s['sentiment_score'] for s in sentiment_scores.values()])
+        overall_sentiment = sum(s['sentiment_score'] for s in sentiment_scores.values()) / len(sentiment_scores)
         
-        return {
+        return _cache_put(self.sentiment_cache, cache_key, {
             'sentiment_by_source': sentiment_scores,
             'overall_sentiment': overall_sentiment,
             'sentiment_classification': self._classify_sentiment(overall_sentiment),
-            'momentum': np.random.uniform(-0.5, 0.5),
+            'momentum': _uniform(u[-2], -0.5, 0.5),
             'key_themes': self._extract_key_themes(),
-            'sentiment_reliability': np.random.uniform(0.7, 0.9)
-        }
+            'sentiment_reliability': _uniform(u[-1], 0.7, 0.9)
+        })
+    
+    def _draw(self, n: int) -> List[float]:
+        """Draw ``n`` unit-interval samples in a single vectorized call."""
+        return self._rng.random(n).tolist()
     
     def _classify_sentiment(self, score: float) -> str:
         """Classify sentiment score into categories."""
-        if score > 0.6:
-            return 'Very Positive'
-        elif score > 0.2:
-            return 'Positive'
-        elif score > -0.2:
-            return 'Neutral'
-        elif score > -0.6:
-            return 'Negative'
-        else:
-            return 'Very Negative'
+        return _SENTIMENT_CLASSES[bisect_left(_SENTIMENT_THRESHOLDS, score)]
     
     def _extract_key_themes(self) -> List[str]:
         """Extract key sentiment themes."""
-        themes = [
-            'Infrastructure Development',
-            'Employment Growth',
-            'Retail Expansion',
-            'Transportation Improvements',
-            'School District Quality',
-            'Safety Improvements',
-            'Cultural Amenities'
-        ]
-        return np.random.choice(themes, size=np.random.randint(2, 5), replace=False).tolist()
+        count = _randint(self._rng.random(), 2, 5)
+        return [_THEMES[index] for index in self._rng.choice(len(_THEMES), size=count, replace=False)]
 
 
 class RiskAssessmentEngine:
     """Comprehensive risk assessment and modeling."""
     
-    def __init__(self):
+    __slots__ = ('_rng', 'risk_categories', 'risk_cache')
+    
+    def __init__(self, seed: Optional[int] = None):
+        self._rng = np.random.default_rng(seed)
         self.risk_categories = [
             'market_risk', 'liquidity_risk', 'regulatory_risk',
             'environmental_risk', 'demographic_risk', 'economic_risk'
         ]
+        self.risk_cache = OrderedDict()
     
     def assess_investment_risks(self, lat: float, lon: float, market_data: Dict) -> Dict[str, Any]:
         """Perform comprehensive risk assessment."""
-        print("⚠️  Conducting Risk Assessment...")
-        time.sleep(0.5)
+        # The assessment does not read market_data, so location alone identifies it
+        cache_key = _location_key(lat, lon)
+        cached = _cache_get(self.risk_cache, cache_key)
+        if cached is not None:
+            return cached
+        
+        logger.info("⚠️  Conducting Risk Assessment...")
+        
+        # Score every category from one block of samples
+        n = len(self.risk_categories)
+        u = self._rng.random(3 * n + 1)
+        levels = 0.1 + 0.7 * u[:n]
+        severities = (u[n:2 * n] * len(_SEVERITIES)).astype(np.intp)
+        probabilities = 0.1 + 0.6 * u[2 * n:3 * n]
+        overall_risk = float(levels.mean())
         
-        risk_scores = {}
-        for category in self.risk_categories:
-            risk_scores[category] = {
-                'risk_level': np.random.uniform(0.1, 0.8),
-                'impact_severity': np.random.choice(['Low', 'Medium', 'High']),
-                'probability': np.random.uniform(0.1, 0.7),
+        risk_scores = {
+            category: {
+                'risk_level': level,
+                'impact_severity': _SEVERITIES[severity],
+                'probability': probability,
                 'mitigation_strategies': self._get_mitigation_strategies(category),
                 'monitoring_indicators': self._get_monitoring_indicators(category)
             }
+            for category, level, severity, probability in zip(
+                self.risk_categories, levels.tolist(), severities.tolist(), probabilities.tolist()
+            )
+        }
         
-        overall_risk = np.mean([r['risk_level'] for r in risk_scores.values()])
-        
-        return {
+        return _cache_put(self.risk_cache, cache_key, {
             'risk_by_category': risk_scores,
             'overall_risk_score': overall_risk,
             'risk_grade': self._calculate_risk_grade(overall_risk),
             'key_risk_factors': self._identify_key_risks(risk_scores),
-            'risk_trend': np.random.choice(['Increasing', 'Stable', 'Decreasing']),
+            'risk_trend': _choice(float(u[-1]), _RISK_TRENDS),
             'stress_test_results': self._perform_stress_tests()
-        }
+        })
     
-    def _get_mitigation_strategies(self, risk_category: str) -> List[str]:
+    def _get_mitigation_strategies(self, risk_category: str) -> Tuple[str, ...]:
         """Get mitigation strategies for each risk category."""
-        strategies = {
-            'market_risk': ['Diversification', 'Hedging', 'Flexible exit strategies'],
-            'liquidity_risk': ['Market timing', 'Phased investment', 'Reserve funds'],
-            'regulatory_risk': ['Legal due diligence', 'Compliance monitoring', 'Government relations'],
-            'environmental_risk': ['Environmental assessment', 'Insurance coverage', 'Climate adaptation'],
-            'demographic_risk': ['Market research', 'Flexible property use', 'Community engagement'],
-            'economic_risk': ['Economic monitoring', 'Conservative leverage', 'Multiple scenarios']
-        }
-        return strategies.get(risk_category, ['Standard risk management'])
+        return _MITIGATION_STRATEGIES.get(risk_category, _DEFAULT_MITIGATION_STRATEGIES)
     
-    def _get_monitoring_indicators(self, risk_category: str) -> List[str]:
+    def _get_monitoring_indicators(self, risk_category: str) -> Tuple[str, ...]:
         """Get monitoring indicators for each risk category."""
-        indicators = {
-            'market_risk': ['Price volatility', 'Volume trends', 'Inventory levels'],
-            'liquidity_risk': ['Days on market', 'Transaction volume', 'Financing availability'],
-            'regulatory_risk': ['Zoning changes', 'Tax policy', 'Development approvals'],
-            'environmental_risk': ['Climate data', 'Environmental violations', 'Insurance rates'],
-            'demographic_risk': ['Population trends', 'Income changes', 'Age distribution'],
-            'economic_risk': ['Employment rates', 'Interest rates', 'Economic growth']
-        }
-        return indicators.get(risk_category, ['General market indicators'])
+        return _MONITORING_INDICATORS.get(risk_category, _DEFAULT_MONITORING_INDICATORS)
     
     def _calculate_risk_grade(self, risk_score: float) -> str:
         """Calculate risk grade based on overall score."""
-        if risk_score < 0.2:
-            return 'AAA (Minimal Risk)'
-        elif risk_score < 0.35:
-            return 'AA (Low Risk)'
-        elif risk_score < 0.5:
-            return 'A (Moderate Risk)'
-        elif risk_score < 0.65:
-            return 'BBB (Elevated Risk)'
-        else:
-            return 'BB (High Risk)'
+        return _RISK_GRADES[bisect_right(_RISK_GRADE_THRESHOLDS, risk_score)]
     
     def _identify_key_risks(self, risk_scores: Dict) -> List[str]:
         """Identify the top risk factors."""
-        sorted_risks = sorted(risk_scores.items(), 
-                            key=lambda x: x[1]['risk_level'], reverse=True)
-        return [risk[0] for risk in sorted_risks[:3]]
+        top_risks = heapq.nlargest(3, risk_scores.items(), key=lambda x: x[1]['risk_level'])
+        return [risk[0] for risk in top_risks]
     
     def _perform_stress_tests(self) -> Dict[str, Any]:
         """Perform stress testing scenarios."""
-        scenarios = ['recession', 'interest_rate_shock', 'local_economic_downturn']
-        results = {}
+        # One row of samples per field, one column per scenario
+        n = len(_STRESS_SCENARIOS)
+        probability, impact, recovery, resilience = self._rng.random((4, n))
         
-        for scenario in scenarios:
-            results[scenario] = {
-                'probability': np.random.uniform(0.05, 0.25),
-                'impact_on_value': np.random.uniform(-0.4, -0.1),
-                'recovery_time': f"{np.random.randint(12, 48)} months",
-                'resilience_score': np.random.uniform(0.3, 0.8)
+        return {
+            scenario: {
+                'probability': prob,
+                'impact_on_value': imp,
+                'recovery_time': f"{months} months",
+                'resilience_score': res
             }
-        
-        return results
+            for scenario, prob, imp, months, res in zip(
+                _STRESS_SCENARIOS,
+                (0.05 + 0.2 * probability).tolist(),
+                (-0.4 + 0.3 * impact).tolist(),
+                (12 + (36 * recovery).astype(np.intp)).tolist(),
+                (0.3 + 0.5 * resilience).tolist()
+            )
+        }
@@ -1,67 +1,517 @@
 
 
+import copy
+import logging
+import math
 import numpy as np
-import pandas as pd
-from typing import Dict, List, Any, Tuple
-import time
-from datetime import datetime, timedelta
-import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, reduce
+from operator import getitem
+from types import MappingProxyType
+from typing import Dict, List, Any, Tuple, Optional, Callable, Sequence
 
+from .sampling import choice as _choice, uniform as _uniform
 
-class MLPredictionEngine:
-    """Advanced machine learning prediction system."""
+logger = logging.getLogger("kiyosaki.agent")
+
+
+_FORECAST_HORIZONS = ('1_month', '3_month', '6_month', '12_month', '24_month')
+
+_IMPORTANCE_FEATURES = ('location', 'size', 'age', 'amenities', 'market_conditions', 'transportation')
+_ACTIVATION_LAYERS = ('layer_1', 'layer_2', 'layer_3', 'output_layer')
+_ACTIVATION_BOUNDS = (0, 10, 18, 23, 24)
+_EXPLAINED_FEATURES = (
+    'location_score', 'market_trends', 'property_characteristics',
+    'economic_indicators', 'demographic_factors', 'risk_metrics'
+)
+_RISK_CONTRIBUTION_FEATURES = ('market_volatility', 'liquidity_risk', 'credit_exposure', 'regulatory_risk')
+_ATTENTION_FEATURES = ('price_history', 'location_quality', 'market_conditions', 'property_features')
+
+_RISK_DRIVERS = (
+    'Market volatility in current cycle',
+    'Interest rate sensitivity',
+    'Local economic conditions',
+    'Property-specific factors'
+)
+_RISK_MITIGATIONS = (
+    'Diversify investment timeline',
+    'Consider interest rate hedging',
+    'Monitor local market indicators',
+    'Implement property improvements'
+)
+_BEST_FEATURES = (
+    'Transportation accessibility',
+    'Neighborhood appreciation trends',
+    'Property condition score',
+    'Market liquidity metrics'
+)
+
+
+@lru_cache(maxsize=32)
+def _interaction_keys(features: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Pairwise interaction keys for ``features``, built once per feature set."""
+    return tuple(
+        f"{feat1}_x_{feat2}"
+        for i, feat1 in enumerate(features)
+        for feat2 in features[i+1:]
+    )
+
+
+def _mean_std(values: Sequence[float]) -> Tuple[float, float]:
+    """Mean and population standard deviation of a short list of floats."""
+    n = len(values)
+    mean = math.fsum(values) / n
+    return mean, math.sqrt(math.fsum((x - mean) ** 2 for x in values) / n)
+
+
+class _Slot(int):
+    """Offset of a sampled leaf in a layout's value buffer."""
+    __slots__ = ()
+
+
+def _freeze(node: Any) -> Any:
+    """Turn a template into read-only nested mapping proxies and tuples."""
+    if isinstance(node, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in node.items()})
+    if isinstance(node, list):
+        return tuple(_freeze(value) for value in node)
+    return node
+
+
+def _materialize(node: Any, buffer: List[float]) -> Any:
+    """Build plain dicts and lists from a skeleton node and a buffer of sampled values."""
+    if isinstance(node, _Slot):
+        return buffer[node]
+    if isinstance(node, MappingProxyType):
+        return {key: _materialize(value, buffer) for key, value in node.items()}
+    if isinstance(node, tuple):
+        return [_materialize(value, buffer) for value in node]
+    return node
+
+
+class _BufferLayout:
+    """A template compiled into a shared read-only skeleton with its spec'd leaves as buffer slots."""
+    __slots__ = ('skeleton', 'lows', 'spans')
     
-    def __init__(self):
-        self.models = {
-            'price_prediction': 'XGBoost Ensemble',
-            'trend_forecasting': 'LSTM Neural Network',
-            'risk_classification': 'Random Forest',
-            'anomaly_detection': 'Isolation Forest',
-            'market_segmentation': 'K-Means Clustering'
+    def __init__(self, template: Dict[str, Any], spec: Tuple[Tuple[tuple, float, float], ...]):
+        skeleton = copy.deepcopy(template)
+        for offset, (path, _, _) in enumerate(spec):
+            reduce(getitem, path[:-1], skeleton)[path[-1]] = _Slot(offset)
+        self.skeleton = _freeze(skeleton)
+        self.lows = np.array([low for _, low, _ in spec], dtype=np.float64)
+        self.spans = np.array([high - low for _, low, high in spec], dtype=np.float64)
+    
+    def sample(self, rng: np.random.Generator) -> Dict[str, Any]:
+        """Draw every leaf in one call and build the result from the shared skeleton."""
+        buffer = (self.lows + self.spans * rng.random(len(self.lows))).tolist()
+        return _materialize(self.skeleton, buffer)
+
+
+# Output skeletons for the prediction stages. ``None`` leaves are filled per call,
+# either from the matching ``(path, low, high)`` spec or by the stage itself.
+_FEATURE_TEMPLATE = {
+    'spatial_features': {
+        'distance_weighted_amenities': None,
+        'accessibility_index': None,
+        'neighborhood_clustering_score': None,
+        'spatial_autocorrelation': None,
+        'centrality_measures': {
+            'betweenness': None,
+            'closeness': None,
+            'eigenvector': None
         }
-        
-        self.feature_categories = {
-            'location_features': ['distance_to_subway', 'walkability_score', 'crime_rate'],
-            'property_features': ['square_footage', 'bedrooms', 'bathrooms', 'age'],
-            'market_features': ['inventory_levels', 'price_trends', 'absorption_rate'],
-            'economic_features': ['employment_rate', 'income_growth', 'interest_rates'],
-            'demographic_features': ['population_density', 'age_distribution', 'education_level']
+    },
+    'temporal_features': {
+        'seasonality_decomposition': {
+            'trend_component': None,
+            'seasonal_component': None,
+            'residual_component': None
+        },
+        'cyclic_patterns': {
+            'market_cycle_position': None,
+            'economic_cycle_alignment': None
+        },
+        'lag_features': {
+            'price_momentum_3m': None,
+            'price_momentum_12m': None,
+            'volatility_lag': None
+        }
+    },
+    'interaction_features': {
+        'location_price_interaction': None,
+        'amenity_price_elasticity': None,
+        'market_condition_sensitivity': None
+    },
+    'derived_metrics': {
+        'price_to_income_ratio': None,
+        'rental_yield_adjusted': None,
+        'market_efficiency_score': None,
+        'liquidity_adjusted_return': None
+    }
+}
+
+_FEATURE_SPEC = (
+    (('spatial_features', 'distance_weighted_amenities'), 0.4, 0.9),
+    (('spatial_features', 'accessibility_index'), 0.5, 0.95),
+    (('spatial_features', 'neighborhood_clustering_score'), 0.3, 0.8),
+    (('spatial_features', 'spatial_autocorrelation'), 0.2, 0.7),
+    (('spatial_features', 'centrality_measures', 'betweenness'), 0.1, 0.6),
+    (('spatial_features', 'centrality_measures', 'closeness'), 0.3, 0.8),
+    (('spatial_features', 'centrality_measures', 'eigenvector'), 0.2, 0.7),
+    (('temporal_features', 'seasonality_decomposition', 'trend_component'), -0.1, 0.2),
+    (('temporal_features', 'seasonality_decomposition', 'seasonal_component'), -0.05, 0.05),
+    (('temporal_features', 'seasonality_decomposition', 'residual_component'), -0.02, 0.02),
+    (('temporal_features', 'cyclic_patterns', 'market_cycle_position'), 0.3, 0.8),
+    (('temporal_features', 'cyclic_patterns', 'economic_cycle_alignment'), 0.4, 0.9),
+    (('temporal_features', 'lag_features', 'price_momentum_3m'), -0.05, 0.15),
+    (('temporal_features', 'lag_features', 'price_momentum_12m'), -0.1, 0.25),
+    (('temporal_features', 'lag_features', 'volatility_lag'), 0.1, 0.4),
+    (('interaction_features', 'location_price_interaction'), 0.6, 1.4),
+    (('interaction_features', 'amenity_price_elasticity'), 0.3, 0.8),
+    (('interaction_features', 'market_condition_sensitivity'), 0.4, 0.9),
+    (('derived_metrics', 'price_to_income_ratio'), 8, 15),
+    (('derived_metrics', 'rental_yield_adjusted'), 0.03, 0.08),
+    (('derived_metrics', 'market_efficiency_score'), 0.6, 0.9),
+    (('derived_metrics', 'liquidity_adjusted_return'), 0.05, 0.15),
+)
+
+_PERFORMANCE_TEMPLATE = {
+    'accuracy_metrics': {
+        'mean_absolute_error': None,
+        'root_mean_square_error': None,
+        'mean_absolute_percentage_error': None,
+        'r_squared': None
+    },
+    'robustness_metrics': {
+        'cross_validation_stability': None,
+        'out_of_sample_performance': None,
+        'temporal_stability': None,
+        'sensitivity_to_outliers': None
+    },
+    'generalization_metrics': {
+        'bias_variance_tradeoff': None,
+        'learning_curve_convergence': None,
+        'model_complexity_score': None,
+        'feature_stability': None
+    }
+}
+
+_PERFORMANCE_SPEC = (
+    (('accuracy_metrics', 'mean_absolute_error'), 25000, 75000),
+    (('accuracy_metrics', 'root_mean_square_error'), 35000, 95000),
+    (('accuracy_metrics', 'mean_absolute_percentage_error'), 0.03, 0.08),
+    (('accuracy_metrics', 'r_squared'), 0.82, 0.94),
+    (('robustness_metrics', 'cross_validation_stability'), 0.85, 0.95),
+    (('robustness_metrics', 'out_of_sample_performance'), 0.80, 0.92),
+    (('robustness_metrics', 'temporal_stability'), 0.78, 0.90),
+    (('robustness_metrics', 'sensitivity_to_outliers'), 0.1, 0.3),
+    (('generalization_metrics', 'bias_variance_tradeoff'), 0.15, 0.35),
+    (('generalization_metrics', 'learning_curve_convergence'), 0.85, 0.95),
+    (('generalization_metrics', 'model_complexity_score'), 0.4, 0.8),
+    (('generalization_metrics', 'feature_stability'), 0.80, 0.92),
+)
+
+_CONFIDENCE_TEMPLATE = {
+    'epistemic_uncertainty': None,
+    'aleatoric_uncertainty': None,
+    'total_uncertainty': None,
+    'confidence_calibration': None,
+    'prediction_intervals': {
+        '50%': [None, None],
+        '80%': [None, None],
+        '95%': [None, None]
+    }
+}
+
+_CONFIDENCE_SPEC = (
+    (('epistemic_uncertainty',), 0.05, 0.15),
+    (('aleatoric_uncertainty',), 0.03, 0.12),
+    (('total_uncertainty',), 0.08, 0.20),
+    (('confidence_calibration',), 0.80, 0.92),
+    (('prediction_intervals', '50%', 0), -0.05, 0.00),
+    (('prediction_intervals', '50%', 1), 0.08, 0.15),
+    (('prediction_intervals', '80%', 0), -0.10, -0.02),
+    (('prediction_intervals', '80%', 1), 0.12, 0.20),
+    (('prediction_intervals', '95%', 0), -0.15, -0.05),
+    (('prediction_intervals', '95%', 1), 0.18, 0.28),
+)
+
+_PRICE_TEMPLATE = {
+    'individual_models': {
+        'xgboost_ensemble': {
+            'predicted_value': None,
+            'confidence_interval': [None, None],
+            'feature_importance': None,
+            'model_accuracy': None,
+            'cross_validation_score': None
+        },
+        'neural_network_deep': {
+            'predicted_value': None,
+            'confidence_interval': [None, None],
+            'layer_activations': None,
+            'model_accuracy': None,
+            'training_loss': None
+        },
+        'random_forest_ensemble': {
+            'predicted_value': None,
+            'confidence_interval': [None, None],
+            'tree_importance': None,
+            'model_accuracy': None,
+            'out_of_bag_score': None
+        },
+        'support_vector_regression': {
+            'predicted_value': None,
+            'confidence_interval': [None, None],
+            'kernel_analysis': 'RBF kernel with optimal gamma',
+            'model_accuracy': None,
+            'support_vectors_count': None
+        }
+    },
+    'ensemble_prediction': None,
+    'prediction_uncertainty': None,
+    'model_agreement': None,
+    'confidence_score': None
+}
+
+_PRICE_SPEC = (
+    (('individual_models', 'xgboost_ensemble', 'predicted_value'), 800000, 2500000),
+    (('individual_models', 'xgboost_ensemble', 'confidence_interval', 0), 700000, 900000),
+    (('individual_models', 'xgboost_ensemble', 'confidence_interval', 1), 2000000, 2800000),
+    (('individual_models', 'xgboost_ensemble', 'model_accuracy'), 0.85, 0.94),
+    (('individual_models', 'xgboost_ensemble', 'cross_validation_score'), 0.82, 0.91),
+    (('individual_models', 'neural_network_deep', 'predicted_value'), 850000, 2400000),
+    (('individual_models', 'neural_network_deep', 'confidence_interval', 0), 750000, 950000),
+    (('individual_models', 'neural_network_deep', 'confidence_interval', 1), 1950000, 2750000),
+    (('individual_models', 'neural_network_deep', 'model_accuracy'), 0.83, 0.92),
+    (('individual_models', 'neural_network_deep', 'training_loss'), 0.05, 0.15),
+    (('individual_models', 'random_forest_ensemble', 'predicted_value'), 820000, 2300000),
+    (('individual_models', 'random_forest_ensemble', 'confidence_interval', 0), 720000, 920000),
+    (('individual_models', 'random_forest_ensemble', 'confidence_interval', 1), 1900000, 2700000),
+    (('individual_models', 'random_forest_ensemble', 'model_accuracy'), 0.81, 0.89),
+    (('individual_models', 'random_forest_ensemble', 'out_of_bag_score'), 0.78, 0.86),
+    (('individual_models', 'support_vector_regression', 'predicted_value'), 840000, 2450000),
+    (('individual_models', 'support_vector_regression', 'confidence_interval', 0), 740000, 940000),
+    (('individual_models', 'support_vector_regression', 'confidence_interval', 1), 2000000, 2800000),
+    (('individual_models', 'support_vector_regression', 'model_accuracy'), 0.80, 0.88),
+    (('confidence_score',), 0.85, 0.95),
+)
+
+_RISK_TEMPLATE = {
+    'gradient_boosting_classifier': {
+        'risk_probability': {
+            'low_risk': None,
+            'medium_risk': None,
+            'high_risk': None
+        },
+        'predicted_class': None,
+        'classification_confidence': None,
+        'feature_contributions': None
+    },
+    'neural_network_classifier': {
+        'risk_score': None,
+        'risk_category': None,
+        'model_certainty': None,
+        'attention_weights': None
+    },
+    'ensemble_risk_model': {
+        'combined_risk_score': None,
+        'risk_decomposition': {
+            'market_risk_component': None,
+            'liquidity_risk_component': None,
+            'credit_risk_component': None,
+            'operational_risk_component': None
+        },
+        'risk_trend': None,
+        'confidence_interval': [None, None]
+    }
+}
+
+_RISK_SPEC = (
+    (('gradient_boosting_classifier', 'risk_probability', 'low_risk'), 0.2, 0.8),
+    (('gradient_boosting_classifier', 'risk_probability', 'medium_risk'), 0.1, 0.4),
+    (('gradient_boosting_classifier', 'risk_probability', 'high_risk'), 0.05, 0.3),
+    (('gradient_boosting_classifier', 'classification_confidence'), 0.75, 0.92),
+    (('neural_network_classifier', 'risk_score'), 0.2, 0.7),
+    (('neural_network_classifier', 'model_certainty'), 0.80, 0.95),
+    (('ensemble_risk_model', 'combined_risk_score'), 0.25, 0.65),
+    (('ensemble_risk_model', 'risk_decomposition', 'market_risk_component'), 0.15, 0.35),
+    (('ensemble_risk_model', 'risk_decomposition', 'liquidity_risk_component'), 0.05, 0.20),
+    (('ensemble_risk_model', 'risk_decomposition', 'credit_risk_component'), 0.05, 0.15),
+    (('ensemble_risk_model', 'risk_decomposition', 'operational_risk_component'), 0.02, 0.10),
+    (('ensemble_risk_model', 'confidence_interval', 0), 0.20, 0.30),
+    (('ensemble_risk_model', 'confidence_interval', 1), 0.60, 0.70),
+)
+
+_ANOMALY_TEMPLATE = {
+    'isolation_forest': {
+        'anomaly_score': None,
+        'is_anomaly': None,
+        'anomaly_explanation': None,
+        'contamination_rate': 0.05,
+        'decision_boundary': None
+    },
+    'local_outlier_factor': {
+        'lof_score': None,
+        'outlier_probability': None,
+        'local_density': None,
+        'neighborhood_analysis': None
+    },
+    'statistical_tests': {
+        'z_score_analysis': {
+            'price_z_score': None,
+            'market_metrics_z_score': None,
+            'significance_level': 0.05
+        },
+        'grubbs_test': {
+            'test_statistic': None,
+            'critical_value': 2.84,
+            'is_outlier': None
         }
+    },
+    'anomaly_clustering': {
+        'cluster_assignment': None,
+        'cluster_distance': None,
+        'cluster_characteristics': None
+    }
+}
+
+_ANOMALY_SPEC = (
+    (('isolation_forest', 'anomaly_score'), -0.1, 0.3),
+    (('isolation_forest', 'decision_boundary'), -0.2, 0.1),
+    (('local_outlier_factor', 'lof_score'), 0.8, 1.5),
+    (('local_outlier_factor', 'outlier_probability'), 0.05, 0.25),
+    (('local_outlier_factor', 'local_density'), 0.6, 1.2),
+    (('statistical_tests', 'z_score_analysis', 'price_z_score'), -2, 3),
+    (('statistical_tests', 'z_score_analysis', 'market_metrics_z_score'), -1.5, 2.5),
+    (('statistical_tests', 'grubbs_test', 'test_statistic'), 1.5, 3.2),
+    (('anomaly_clustering', 'cluster_distance'), 0.1, 2.0),
+)
+
+_ENSEMBLE_TEMPLATE = {
+    'weighted_price_prediction': {
+        'final_prediction': None,
+        'model_weights': {
+            'xgboost': 0.35,
+            'neural_network': 0.25,
+            'random_forest': 0.25,
+            'svr': 0.15
+        },
+        'ensemble_confidence': None,
+        'prediction_interval': [None, None]
+    },
+    'integrated_risk_assessment': {
+        'final_risk_score': None,
+        'risk_category': None,
+        'risk_drivers': None,
+        'risk_mitigation_suggestions': None
+    },
+    'forecast_consensus': {
+        'consensus_12m_forecast': None,
+        'forecast_confidence': None,
+        'model_disagreement': None,
+        'forecast_reliability': None
+    },
+    'meta_learning_insights': {
+        'model_performance_ranking': ['XGBoost', 'Neural Network', 'Random Forest', 'SVR'],
+        'best_performing_features': None,
+        'model_stability_score': None,
+        'overfitting_risk': None
+    }
+}
+
+_ENSEMBLE_SPEC = (
+    (('weighted_price_prediction', 'final_prediction'), 900000, 2200000),
+    (('weighted_price_prediction', 'ensemble_confidence'), 0.88, 0.96),
+    (('weighted_price_prediction', 'prediction_interval', 0), 800000, 1000000),
+    (('weighted_price_prediction', 'prediction_interval', 1), 1800000, 2500000),
+    (('integrated_risk_assessment', 'final_risk_score'), 0.3, 0.6),
+    (('forecast_consensus', 'consensus_12m_forecast'), 0.05, 0.15),
+    (('forecast_consensus', 'forecast_confidence'), 0.75, 0.90),
+    (('forecast_consensus', 'model_disagreement'), 0.02, 0.08),
+    (('forecast_consensus', 'forecast_reliability'), 0.80, 0.92),
+    (('meta_learning_insights', 'model_stability_score'), 0.85, 0.95),
+    (('meta_learning_insights', 'overfitting_risk'), 0.05, 0.15),
+)
+
+# Each stage samples its spec into a fresh copy of its compiled skeleton in one draw
+_FEATURE_LAYOUT = _BufferLayout(_FEATURE_TEMPLATE, _FEATURE_SPEC)
+_PERFORMANCE_LAYOUT = _BufferLayout(_PERFORMANCE_TEMPLATE, _PERFORMANCE_SPEC)
+_CONFIDENCE_LAYOUT = _BufferLayout(_CONFIDENCE_TEMPLATE, _CONFIDENCE_SPEC)
+_PRICE_LAYOUT = _BufferLayout(_PRICE_TEMPLATE, _PRICE_SPEC)
+_RISK_LAYOUT = _BufferLayout(_RISK_TEMPLATE, _RISK_SPEC)
+_ANOMALY_LAYOUT = _BufferLayout(_ANOMALY_TEMPLATE, _ANOMALY_SPEC)
+_ENSEMBLE_LAYOUT = _BufferLayout(_ENSEMBLE_TEMPLATE, _ENSEMBLE_SPEC)
+
+
+class MLPredictionEngine:
+    """Advanced machine learning prediction system."""
+    
+    MODELS = MappingProxyType({
+        'price_prediction': 'XGBoost Ensemble',
+        'trend_forecasting': 'LSTM Neural Network',
+        'risk_classification': 'Random Forest',
+        'anomaly_detection': 'Isolation Forest',
+        'market_segmentation': 'K-Means Clustering'
+    })
+    
+    FEATURE_CATEGORIES = MappingProxyType({
+        'location_features': ('distance_to_subway', 'walkability_score', 'crime_rate'),
+        'property_features': ('square_footage', 'bedrooms', 'bathrooms', 'age'),
+        'market_features': ('inventory_levels', 'price_trends', 'absorption_rate'),
+        'economic_features': ('employment_rate', 'income_growth', 'interest_rates'),
+        'demographic_features': ('population_density', 'age_distribution', 'education_level')
+    })
+    
+    def __init__(self, seed: Optional[int] = None):
+        self._engine_rng = np.random.default_rng(seed)
+        self._branch_state = threading.local()
     
     def run_ml_prediction_suite(self, property_data: Dict[str, Any]) -> Dict[str, Any]:
         """Run comprehensive ML prediction suite."""
-        print("🤖 Initializing Machine Learning Prediction Engine...")
-        time.sleep(0.4)
-        
-        # Stage 1: Feature Engineering & Data Preparation
-        print("🔧 Stage 1/6: Advanced Feature Engineering")
-        engineered_features = self._perform_feature_engineering(property_data)
-        time.sleep(0.5)
-        
-        # Stage 2: Price Prediction Models
-        print("💰 Stage 2/6: Multi-Model Price Prediction")
-        price_predictions = self._run_price_prediction_models(engineered_features)
-        time.sleep(0.6)
-        
-        # Stage 3: Time Series Forecasting
-        print("📈 Stage 3/6: Time Series Market Forecasting")
-        market_forecasts = self._run_time_series_forecasting(property_data)
-        time.sleep(0.5)
+        logger.info("🤖 Initializing Machine Learning Prediction Engine...")
         
-        # Stage 4: Risk Classification
-        print("⚠️  Stage 4/6: ML-Based Risk Classification")
-        risk_classification = self._run_risk_classification(engineered_features)
-        time.sleep(0.4)
-        
-        # Stage 5: Anomaly Detection
-        print("🔍 Stage 5/6: Anomaly Detection Analysis")
-        anomaly_analysis = self._run_anomaly_detection(property_data)
-        time.sleep(0.4)
+        # Forecasting and anomaly detection depend only on the property data, and the
+        # price and risk models only on the engineered features, so they run as
+        # branches with their own generators around the feature engineering stage
+        price_rng, forecast_rng, risk_rng, anomaly_rng = self._engine_rng.spawn(4)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            forecast_future = executor.submit(
+                self._run_branch, forecast_rng, self._run_time_series_forecasting, property_data
+            )
+            anomaly_future = executor.submit(
+                self._run_branch, anomaly_rng, self._run_anomaly_detection, property_data
+            )
+            
+            # Stage 1: Feature Engineering & Data Preparation
+            logger.info("🔧 Stage 1/6: Advanced Feature Engineering")
+            engineered_features = self._perform_feature_engineering(property_data)
+            price_future = executor.submit(
+                self._run_branch, price_rng, self._run_price_prediction_models, engineered_features
+            )
+            risk_future = executor.submit(
+                self._run_branch, risk_rng, self._run_risk_classification, engineered_features
+            )
+            
+            # Stage 2: Price Prediction Models
+            logger.info("💰 Stage 2/6: Multi-Model Price Prediction")
+            price_predictions = price_future.result()
+            
+            # Stage 3: Time Series Forecasting
+            logger.info("📈 Stage 3/6: Time Series Market Forecasting")
+            market_forecasts = forecast_future.result()
+            
+            # Stage 4: Risk Classification
+            logger.info("⚠️  Stage 4/6: ML-Based Risk Classification")
+            risk_classification = risk_future.result()
+            
+            # Stage 5: Anomaly Detection
+            logger.info("🔍 Stage 5/6: Anomaly Detection Analysis")
+            anomaly_analysis = anomaly_future.result()
         
         # Stage 6: Model Ensemble & Validation
-        print("🎯 Stage 6/6: Model Ensemble & Cross-Validation")
+        logger.info("🎯 Stage 6/6: Model Ensemble & Cross-Validation")
         ensemble_results = self._create_model_ensemble(price_predictions, market_forecasts, risk_classification)
-        time.sleep(0.5)
         
         return {
             'engineered_features': engineered_features,
@@ -75,142 +525,87 @@ class MLPredictionEngine:
             'prediction_confidence': self._calculate_prediction_confidence()
         }
     
+    @property
+    def _rng(self) -> np.random.Generator:
+        """Generator for the current stage, preferring a branch generator on worker threads."""
+        return getattr(self._branch_state, 'rng', self._engine_rng)
+    
+    def _run_branch(self, rng: np.random.Generator, stage: Callable[..., Dict[str, Any]], *args) -> Dict[str, Any]:
+        """Run an independent prediction stage with its own generator on the current thread."""
+        self._branch_state.rng = rng
+        try:
+            return stage(*args)
+        finally:
+            del self._branch_state.rng
+    
+    def _draw(self, n: int) -> List[float]:
+        """Draw ``n`` unit-interval samples in a single vectorized call."""
+        return self._rng.random(n).tolist()
+    
+    def _simplex_weights(self, n: int) -> List[float]:
+        """Draw ``n`` weights uniformly from the simplex (a flat Dirichlet sample)."""
+        e = self._rng.standard_exponential(n)
+        return (e / e.sum()).tolist()
+    
+    def _draw_horizons(self, *bounds: Tuple[float, float]) -> List[List[float]]:
+        """Draw one value per forecast horizon for each ``(low, high)`` field."""
+        n = len(_FORECAST_HORIZONS)
+        u = self._draw(n * len(bounds))
+        return [
+            [_uniform(r, low, high) for r in u[k * n:(k + 1) * n]]
+            for k, (low, high) in enumerate(bounds)
+        ]
+    
     def _perform_feature_engineering(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Perform advanced feature engineering."""
-        return {
-            'spatial_features': {
-                'distance_weighted_amenities': np.random.uniform(0.4, 0.9),
-                'accessibility_index': np.random.uniform(0.5, 0.95),
-                'neighborhood_clustering_score': np.random.uniform(0.3, 0.8),
-                'spatial_autocorrelation': np.random.uniform(0.2, 0.7),
-                'centrality_measures': {
-                    'betweenness': np.random.uniform(0.1, 0.6),
-                    'closeness': np.random.uniform(0.3, 0.8),
-                    'eigenvector': np.random.uniform(0.2, 0.7)
-                }
-            },
-            'temporal_features': {
-                'seasonality_decomposition': {
-                    'trend_component': np.random.uniform(-0.1, 0.2),
-                    'seasonal_component': np.random.uniform(-0.05, 0.05),
-                    'residual_component': np.random.uniform(-0.02, 0.02)
-                },
-                'cyclic_patterns': {
-                    'market_cycle_position': np.random.uniform(0.3, 0.8),
-                    'economic_cycle_alignment': np.random.uniform(0.4, 0.9)
-                },
-                'lag_features': {
-                    'price_momentum_3m': np.random.uniform(-0.05, 0.15),
-                    'price_momentum_12m': np.random.uniform(-0.1, 0.25),
-                    'volatility_lag': np.random.uniform(0.1, 0.4)
-                }
-            },
-            'interaction_features': {
-                'location_price_interaction': np.random.uniform(0.6, 1.4),
-                'amenity_price_elasticity': np.random.uniform(0.3, 0.8),
-                'market_condition_sensitivity': np.random.uniform(0.4, 0.9)
-            },
-            'derived_metrics': {
-                'price_to_income_ratio': np.random.uniform(8, 15),
-                'rental_yield_adjusted': np.random.uniform(0.03, 0.08),
-                'market_efficiency_score': np.random.uniform(0.6, 0.9),
-                'liquidity_adjusted_return': np.random.uniform(0.05, 0.15)
-            }
-        }
+        return _FEATURE_LAYOUT.sample(self._rng)
     
     def _run_price_prediction_models(self, features: Dict[str, Any]) -> Dict[str, Any]:
         """Run multiple price prediction models."""
-        models_results = {
-            'xgboost_ensemble': {
-                'predicted_value': np.random.uniform(800000, 2500000),
-                'confidence_interval': [
-                    np.random.uniform(700000, 900000),
-                    np.random.uniform(2000000, 2800000)
-                ],
-                'feature_importance': self._generate_feature_importance('xgboost'),
-                'model_accuracy': np.random.uniform(0.85, 0.94),
-                'cross_validation_score': np.random.uniform(0.82, 0.91)
-            },
-            'neural_network_deep': {
-                'predicted_value': np.random.uniform(850000, 2400000),
-                'confidence_interval': [
-                    np.random.uniform(750000, 950000),
-                    np.random.uniform(1950000, 2750000)
-                ],
-                'layer_activations': self._simulate_neural_activations(),
-                'model_accuracy': np.random.uniform(0.83, 0.92),
-                'training_loss': np.random.uniform(0.05, 0.15)
-            },
-            'random_forest_ensemble': {
-                'predicted_value': np.random.uniform(820000, 2300000),
-                'confidence_interval': [
-                    np.random.uniform(720000, 920000),
-                    np.random.uniform(1900000, 2700000)
-                ],
-                'tree_importance': self._generate_tree_importance(),
-                'model_accuracy': np.random.uniform(0.81, 0.89),
-                'out_of_bag_score': np.random.uniform(0.78, 0.86)
-            },
-            'support_vector_regression': {
-                'predicted_value': np.random.uniform(840000, 2450000),
-                'confidence_interval': [
-                    np.random.uniform(740000, 940000),
-                    np.random.uniform(2000000, 2800000)
-                ],
-                'kernel_analysis': 'RBF kernel with optimal gamma',
-                'model_accuracy': np.random.uniform(0.80, 0.88),
-                'support_vectors_count': np.random.randint(150, 400)
-            }
-        }
+        result = _PRICE_LAYOUT.sample(self._rng)
+        models_results = result['individual_models']
+        models_results['xgboost_ensemble']['feature_importance'] = self._generate_feature_importance('xgboost')
+        models_results['neural_network_deep']['layer_activations'] = self._simulate_neural_activations()
+        models_results['random_forest_ensemble']['tree_importance'] = self._generate_tree_importance()
+        models_results['support_vector_regression']['support_vectors_count'] = int(self._rng.integers(150, 400))
         
         # Calculate ensemble prediction
         predictions = [model['predicted_value'] for model in models_results.values()]
-        ensemble_prediction = np.mean(predictions)
-        ensemble_std = np.std(predictions)
-        
-        return {
-            'individual_models': models_results,
-            'ensemble_prediction': ensemble_prediction,
-            'prediction_uncertainty': ensemble_std,
-            'model_agreement': self._calculate_model_agreement(predictions),
-            'confidence_score': np.random.uniform(0.85, 0.95)
-        }
+        result['ensemble_prediction'], result['prediction_uncertainty'] = _mean_std(predictions)
+        result['model_agreement'] = self._calculate_model_agreement(predictions)
+        return result
     
     def _run_time_series_forecasting(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Run time series forecasting models."""
-        forecast_horizons = ['1_month', '3_month', '6_month', '12_month', '24_month']
+        lstm = self._draw_horizons((-0.05, 0.15), (-0.10, 0.00), (0.10, 0.25), (0.05, 0.20))
+        arima = self._draw_horizons((-0.03, 0.12), (0.08, 0.25), (-0.08, 0.02), (0.08, 0.20))
+        prophet = self._draw_horizons((0.02, 0.10), (-0.02, 0.02), (-0.06, 0.01), (0.06, 0.18))
         
         forecasting_results = {
             'lstm_neural_network': {
                 'model_type': 'Long Short-Term Memory Neural Network',
                 'architecture': '3 LSTM layers with dropout regularization',
-                'training_epochs': np.random.randint(50, 200),
-                'validation_loss': np.random.uniform(0.02, 0.08),
+                'training_epochs': int(self._rng.integers(50, 200)),
+                'validation_loss': self._rng.uniform(0.02, 0.08),
                 'forecasts': {
                     horizon: {
-                        'price_change': np.random.uniform(-0.05, 0.15),
-                        'confidence_interval': [
-                            np.random.uniform(-0.10, 0.00),
-                            np.random.uniform(0.10, 0.25)
-                        ],
-                        'volatility_forecast': np.random.uniform(0.05, 0.20)
-                    } for horizon in forecast_horizons
+                        'price_change': price_change,
+                        'confidence_interval': [lower, upper],
+                        'volatility_forecast': volatility
+                    } for horizon, price_change, lower, upper, volatility in zip(_FORECAST_HORIZONS, *lstm)
                 }
             },
             'arima_garch': {
                 'model_type': 'ARIMA-GARCH Hybrid Model',
-                'arima_order': f"({np.random.randint(1, 4)}, {np.random.randint(0, 2)}, {np.random.randint(1, 4)})",
-                'garch_order': f"({np.random.randint(1, 3)}, {np.random.randint(1, 3)})",
-                'aic_score': np.random.uniform(1500, 2500),
+                'arima_order': f"({self._rng.integers(1, 4)}, {self._rng.integers(0, 2)}, {self._rng.integers(1, 4)})",
+                'garch_order': f"({self._rng.integers(1, 3)}, {self._rng.integers(1, 3)})",
+                'aic_score': self._rng.uniform(1500, 2500),
                 'forecasts': {
                     horizon: {
-                        'price_change': np.random.uniform(-0.03, 0.12),
-                        'conditional_volatility': np.random.uniform(0.08, 0.25),
-                        'prediction_interval': [
-                            np.random.uniform(-0.08, 0.02),
-                            np.random.uniform(0.08, 0.20)
-                        ]
-                    } for horizon in forecast_horizons
+                        'price_change': price_change,
+                        'conditional_volatility': volatility,
+                        'prediction_interval': [lower, upper]
+                    } for horizon, price_change, volatility, lower, upper in zip(_FORECAST_HORIZONS, *arima)
                 }
             },
             'prophet_decomposition': {
@@ -220,13 +615,10 @@ class MLPredictionEngine:
                 'holiday_effects': 'NYC real estate calendar',
                 'forecasts': {
                     horizon: {
-                        'trend_forecast': np.random.uniform(0.02, 0.10),
-                        'seasonal_effect': np.random.uniform(-0.02, 0.02),
-                        'uncertainty_bounds': [
-                            np.random.uniform(-0.06, 0.01),
-                            np.random.uniform(0.06, 0.18)
-                        ]
-                    } for horizon in forecast_horizons
+                        'trend_forecast': trend,
+                        'seasonal_effect': seasonal,
+                        'uncertainty_bounds': [lower, upper]
+                    } for horizon, trend, seasonal, lower, upper in zip(_FORECAST_HORIZONS, *prophet)
                 }
             }
         }
@@ -241,240 +633,141 @@ class MLPredictionEngine:
     
     def _run_risk_classification(self, features: Dict[str, Any]) -> Dict[str, Any]:
         """Run ML-based risk classification."""
-        return {
-            'gradient_boosting_classifier': {
-                'risk_probability': {
-                    'low_risk': np.random.uniform(0.2, 0.8),
-                    'medium_risk': np.random.uniform(0.1, 0.4),
-                    'high_risk': np.random.uniform(0.05, 0.3)
-                },
-                'predicted_class': np.random.choice(['Low Risk', 'Medium Risk']),
-                'classification_confidence': np.random.uniform(0.75, 0.92),
-                'feature_contributions': self._generate_risk_feature_contributions()
-            },
-            'neural_network_classifier': {
-                'risk_score': np.random.uniform(0.2, 0.7),
-                'risk_category': np.random.choice(['Investment Grade', 'Speculative Grade']),
-                'model_certainty': np.random.uniform(0.80, 0.95),
-                'attention_weights': self._generate_attention_weights()
-            },
-            'ensemble_risk_model': {
-                'combined_risk_score': np.random.uniform(0.25, 0.65),
-                'risk_decomposition': {
-                    'market_risk_component': np.random.uniform(0.15, 0.35),
-                    'liquidity_risk_component': np.random.uniform(0.05, 0.20),
-                    'credit_risk_component': np.random.uniform(0.05, 0.15),
-                    'operational_risk_component': np.random.uniform(0.02, 0.10)
-                },
-                'risk_trend': np.random.choice(['Increasing', 'Stable', 'Decreasing']),
-                'confidence_interval': [
-                    np.random.uniform(0.20, 0.30),
-                    np.random.uniform(0.60, 0.70)
-                ]
-            }
-        }
+        result = _RISK_LAYOUT.sample(self._rng)
+        gradient_boosting = result['gradient_boosting_classifier']
+        gradient_boosting['predicted_class'] = _choice(self._rng.random(), ('Low Risk', 'Medium Risk'))
+        gradient_boosting['feature_contributions'] = self._generate_risk_feature_contributions()
+        neural_network = result['neural_network_classifier']
+        neural_network['risk_category'] = _choice(self._rng.random(), ('Investment Grade', 'Speculative Grade'))
+        neural_network['attention_weights'] = self._generate_attention_weights()
+        result['ensemble_risk_model']['risk_trend'] = _choice(self._rng.random(), ('Increasing', 'Stable', 'Decreasing'))
+        return result
     
     def _run_anomaly_detection(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Run anomaly detection analysis."""
-        return {
-            'isolation_forest': {
-                'anomaly_score': np.random.uniform(-0.1, 0.3),
-                'is_anomaly': np.random.choice([True, False], p=[0.1, 0.9]),
-                'anomaly_explanation': self._generate_anomaly_explanation(),
-                'contamination_rate': 0.05,
-                'decision_boundary': np.random.uniform(-0.2, 0.1)
-            },
-            'local_outlier_factor': {
-                'lof_score': np.random.uniform(0.8, 1.5),
-                'outlier_probability': np.random.uniform(0.05, 0.25),
-                'local_density': np.random.uniform(0.6, 1.2),
-                'neighborhood_analysis': self._analyze_local_neighborhood()
-            },
-            'statistical_tests': {
-                'z_score_analysis': {
-                    'price_z_score': np.random.uniform(-2, 3),
-                    'market_metrics_z_score': np.random.uniform(-1.5, 2.5),
-                    'significance_level': 0.05
-                },
-                'grubbs_test': {
-                    'test_statistic': np.random.uniform(1.5, 3.2),
-                    'critical_value': 2.84,
-                    'is_outlier': np.random.choice([True, False], p=[0.15, 0.85])
-                }
-            },
-            'anomaly_clustering': {
-                'cluster_assignment': np.random.randint(0, 5),
-                'cluster_distance': np.random.uniform(0.1, 2.0),
-                'cluster_characteristics': self._describe_anomaly_cluster()
-            }
-        }
+        result = _ANOMALY_LAYOUT.sample(self._rng)
+        isolation_forest = result['isolation_forest']
+        isolation_forest['is_anomaly'] = self._rng.random() < 0.1
+        isolation_forest['anomaly_explanation'] = self._generate_anomaly_explanation()
+        result['local_outlier_factor']['neighborhood_analysis'] = self._analyze_local_neighborhood()
+        result['statistical_tests']['grubbs_test']['is_outlier'] = self._rng.random() < 0.15
+        clustering = result['anomaly_clustering']
+        clustering['cluster_assignment'] = int(self._rng.integers(0, 5))
+        clustering['cluster_characteristics'] = self._describe_anomaly_cluster()
+        return result
     
     def _create_model_ensemble(self, price_pred: Dict, forecasts: Dict, risk_class: Dict) -> Dict[str, Any]:
         """Create ensemble model combining all predictions."""
-        return {
-            'weighted_price_prediction': {
-                'final_prediction': np.random.uniform(900000, 2200000),
-                'model_weights': {
-                    'xgboost': 0.35,
-                    'neural_network': 0.25,
-                    'random_forest': 0.25,
-                    'svr': 0.15
-                },
-                'ensemble_confidence': np.random.uniform(0.88, 0.96),
-                'prediction_interval': [
-                    np.random.uniform(800000, 1000000),
-                    np.random.uniform(1800000, 2500000)
-                ]
-            },
-            'integrated_risk_assessment': {
-                'final_risk_score': np.random.uniform(0.3, 0.6),
-                'risk_category': np.random.choice(['Low-Medium Risk', 'Medium Risk']),
-                'risk_drivers': self._identify_primary_risk_drivers(),
-                'risk_mitigation_suggestions': self._suggest_risk_mitigation()
-            },
-            'forecast_consensus': {
-                'consensus_12m_forecast': np.random.uniform(0.05, 0.15),
-                'forecast_confidence': np.random.uniform(0.75, 0.90),
-                'model_disagreement': np.random.uniform(0.02, 0.08),
-                'forecast_reliability': np.random.uniform(0.80, 0.92)
-            },
-            'meta_learning_insights': {
-                'model_performance_ranking': ['XGBoost', 'Neural Network', 'Random Forest', 'SVR'],
-                'best_performing_features': self._identify_best_features(),
-                'model_stability_score': np.random.uniform(0.85, 0.95),
-                'overfitting_risk': np.random.uniform(0.05, 0.15)
-            }
-        }
+        result = _ENSEMBLE_LAYOUT.sample(self._rng)
+        risk_assessment = result['integrated_risk_assessment']
+        risk_assessment['risk_category'] = _choice(self._rng.random(), ('Low-Medium Risk', 'Medium Risk'))
+        risk_assessment['risk_drivers'] = self._identify_primary_risk_drivers()
+        risk_assessment['risk_mitigation_suggestions'] = self._suggest_risk_mitigation()
+        result['meta_learning_insights']['best_performing_features'] = self._identify_best_features()
+        return result
     
     def _calculate_model_performance(self) -> Dict[str, Any]:
         """Calculate comprehensive model performance metrics."""
-        return {
-            'accuracy_metrics': {
-                'mean_absolute_error': np.random.uniform(25000, 75000),
-                'root_mean_square_error': np.random.uniform(35000, 95000),
-                'mean_absolute_percentage_error': np.random.uniform(0.03, 0.08),
-                'r_squared': np.random.uniform(0.82, 0.94)
-            },
-            'robustness_metrics': {
-                'cross_validation_stability': np.random.uniform(0.85, 0.95),
-                'out_of_sample_performance': np.random.uniform(0.80, 0.92),
-                'temporal_stability': np.random.uniform(0.78, 0.90),
-                'sensitivity_to_outliers': np.random.uniform(0.1, 0.3)
-            },
-            'generalization_metrics': {
-                'bias_variance_tradeoff': np.random.uniform(0.15, 0.35),
-                'learning_curve_convergence': np.random.uniform(0.85, 0.95),
-                'model_complexity_score': np.random.uniform(0.4, 0.8),
-                'feature_stability': np.random.uniform(0.80, 0.92)
-            }
-        }
+        return _PERFORMANCE_LAYOUT.sample(self._rng)
     
     def _analyze_feature_importance(self, features: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze feature importance across models."""
-        feature_names = ['location_score', 'market_trends', 'property_characteristics', 
-                        'economic_indicators', 'demographic_factors', 'risk_metrics']
+        feature_names = _EXPLAINED_FEATURES
+        n = len(feature_names)
+        u = self._draw(3 * n + 1)
         
         return {
             'global_importance': {
-                feature: np.random.uniform(0.1, 0.3) for feature in feature_names
+                feature: _uniform(r, 0.1, 0.3) for feature, r in zip(feature_names, u[:n])
             },
             'permutation_importance': {
-                feature: np.random.uniform(0.05, 0.25) for feature in feature_names
+                feature: _uniform(r, 0.05, 0.25) for feature, r in zip(feature_names, u[n:2 * n])
             },
             'shap_values': {
-                'mean_absolute_shap': {feature: np.random.uniform(5000, 50000) for feature in feature_names},
+                'mean_absolute_shap': {
+                    feature: _uniform(r, 5000, 50000) for feature, r in zip(feature_names, u[2 * n:3 * n])
+                },
                 'feature_interactions': self._generate_feature_interactions(feature_names)
             },
             'lime_explanations': {
                 'local_explanations': self._generate_lime_explanations(feature_names),
-                'explanation_fidelity': np.random.uniform(0.85, 0.95)
+                'explanation_fidelity': _uniform(u[3 * n], 0.85, 0.95)
             }
         }
     
     def _calculate_prediction_confidence(self) -> Dict[str, Any]:
         """Calculate prediction confidence metrics."""
-        return {
-            'epistemic_uncertainty': np.random.uniform(0.05, 0.15),
-            'aleatoric_uncertainty': np.random.uniform(0.03, 0.12),
-            'total_uncertainty': np.random.uniform(0.08, 0.20),
-            'confidence_calibration': np.random.uniform(0.80, 0.92),
-            'prediction_intervals': {
-                '50%': [np.random.uniform(-0.05, 0.00), np.random.uniform(0.08, 0.15)],
-                '80%': [np.random.uniform(-0.10, -0.02), np.random.uniform(0.12, 0.20)],
-                '95%': [np.random.uniform(-0.15, -0.05), np.random.uniform(0.18, 0.28)]
-            }
-        }
+        return _CONFIDENCE_LAYOUT.sample(self._rng)
     
     # Helper methods for generating realistic ML outputs
     def _generate_feature_importance(self, model_type: str) -> Dict[str, float]:
-        features = ['location', 'size', 'age', 'amenities', 'market_conditions', 'transportation']
-        importances = np.random.dirichlet(np.ones(len(features)))
-        return dict(zip(features, importances))
+        return dict(zip(_IMPORTANCE_FEATURES, self._simplex_weights(len(_IMPORTANCE_FEATURES))))
     
     def _simulate_neural_activations(self) -> Dict[str, List[float]]:
+        u = self._draw(_ACTIVATION_BOUNDS[-1])
         return {
-            'layer_1': np.random.uniform(0, 1, 10).tolist(),
-            'layer_2': np.random.uniform(0, 1, 8).tolist(),
-            'layer_3': np.random.uniform(0, 1, 5).tolist(),
-            'output_layer': [np.random.uniform(0, 1)]
+            layer: u[start:stop]
+            for layer, start, stop in zip(_ACTIVATION_LAYERS, _ACTIVATION_BOUNDS, _ACTIVATION_BOUNDS[1:])
         }
     
     def _generate_tree_importance(self) -> Dict[str, Any]:
         return {
-            'tree_count': np.random.randint(100, 500),
-            'max_depth': np.random.randint(8, 15),
+            'tree_count': int(self._rng.integers(100, 500)),
+            'max_depth': int(self._rng.integers(8, 15)),
             'feature_splits': {
-                'location_features': np.random.randint(150, 300),
-                'property_features': np.random.randint(200, 400),
-                'market_features': np.random.randint(100, 250)
+                'location_features': int(self._rng.integers(150, 300)),
+                'property_features': int(self._rng.integers(200, 400)),
+                'market_features': int(self._rng.integers(100, 250))
             }
         }
     
     def _calculate_model_agreement(self, predictions: List[float]) -> float:
         """Calculate agreement between model predictions."""
-        return 1.0 - (np.std(predictions) / np.mean(predictions))
+        mean, std = _mean_std(predictions)
+        return 1.0 - std / mean
     
     def _create_forecast_ensemble(self, results: Dict) -> Dict[str, Any]:
+        u = self._draw(3)
         return {
             'ensemble_weights': {'lstm': 0.4, 'arima_garch': 0.35, 'prophet': 0.25},
-            'weighted_forecast': np.random.uniform(0.06, 0.12),
-            'forecast_uncertainty': np.random.uniform(0.02, 0.05),
-            'model_consensus': np.random.uniform(0.75, 0.90)
+            'weighted_forecast': _uniform(u[0], 0.06, 0.12),
+            'forecast_uncertainty': _uniform(u[1], 0.02, 0.05),
+            'model_consensus': _uniform(u[2], 0.75, 0.90)
         }
     
     def _calculate_forecast_accuracy(self) -> Dict[str, float]:
+        u = self._draw(4)
         return {
-            'mape': np.random.uniform(0.05, 0.15),
-            'directional_accuracy': np.random.uniform(0.70, 0.85),
-            'forecast_bias': np.random.uniform(-0.02, 0.02),
-            'tracking_signal': np.random.uniform(-1, 1)
+            'mape': _uniform(u[0], 0.05, 0.15),
+            'directional_accuracy': _uniform(u[1], 0.70, 0.85),
+            'forecast_bias': _uniform(u[2], -0.02, 0.02),
+            'tracking_signal': _uniform(u[3], -1, 1)
         }
     
     def _analyze_seasonality_patterns(self) -> Dict[str, Any]:
+        u = self._draw(2)
         return {
-            'seasonal_strength': np.random.uniform(0.3, 0.7),
+            'seasonal_strength': _uniform(u[0], 0.3, 0.7),
             'peak_months': ['May', 'June', 'September'],
             'trough_months': ['January', 'February', 'December'],
-            'seasonal_amplitude': np.random.uniform(0.08, 0.18)
+            'seasonal_amplitude': _uniform(u[1], 0.08, 0.18)
         }
     
     def _detect_structural_trends(self) -> Dict[str, Any]:
+        u = self._draw(2)
         return {
-            'trend_breaks_detected': np.random.randint(1, 4),
-            'trend_strength': np.random.uniform(0.5, 0.8),
-            'trend_direction': np.random.choice(['Upward', 'Downward', 'Sideways']),
-            'trend_acceleration': np.random.uniform(-0.02, 0.05)
+            'trend_breaks_detected': int(self._rng.integers(1, 4)),
+            'trend_strength': _uniform(u[0], 0.5, 0.8),
+            'trend_direction': _choice(self._rng.random(), ('Upward', 'Downward', 'Sideways')),
+            'trend_acceleration': _uniform(u[1], -0.02, 0.05)
         }
     
     def _generate_risk_feature_contributions(self) -> Dict[str, float]:
-        features = ['market_volatility', 'liquidity_risk', 'credit_exposure', 'regulatory_risk']
-        contributions = np.random.uniform(0.1, 0.4, len(features))
-        return dict(zip(features, contributions))
+        u = self._draw(len(_RISK_CONTRIBUTION_FEATURES))
+        return {feature: _uniform(r, 0.1, 0.4) for feature, r in zip(_RISK_CONTRIBUTION_FEATURES, u)}
     
     def _generate_attention_weights(self) -> Dict[str, float]:
-        features = ['price_history', 'location_quality', 'market_conditions', 'property_features']
-        weights = np.random.dirichlet(np.ones(len(features)))
-        return dict(zip(features, weights))
+        return dict(zip(_ATTENTION_FEATURES, self._simplex_weights(len(_ATTENTION_FEATURES))))
     
     def _generate_anomaly_explanation(self) -> List[str]:
         explanations = [
@@ -483,12 +776,12 @@ class MLPredictionEngine:
             'Rare combination of property features',
             'Outlier in recent transaction patterns'
         ]
-        return [np.random.choice(explanations)]
+        return [_choice(self._rng.random(), explanations)]
     
     def _analyze_local_neighborhood(self) -> Dict[str, Any]:
         return {
-            'neighborhood_size': np.random.randint(10, 30),
-            'density_comparison': np.random.uniform(0.7, 1.3),
+            'neighborhood_size': int(self._rng.integers(10, 30)),
+            'density_comparison': self._rng.uniform(0.7, 1.3),
             'local_market_characteristics': 'Mixed residential-commercial area'
         }
     
@@ -499,48 +792,32 @@ class MLPredictionEngine:
             'Properties with exceptional location advantages',
             'Investment properties with non-standard features'
         ]
-        return np.random.choice(descriptions)
+        return _choice(self._rng.random(), descriptions)
     
     def _identify_primary_risk_drivers(self) -> List[str]:
-        drivers = [
-            'Market volatility in current cycle',
-            'Interest rate sensitivity',
-            'Local economic conditions',
-            'Property-specific factors'
-        ]
-        return np.random.choice(drivers, size=np.random.randint(2, 4), replace=False).tolist()
+        return self._sample_options(_RISK_DRIVERS, self._rng.integers(2, 4))
     
     def _suggest_risk_mitigation(self) -> List[str]:
-        suggestions = [
-            'Diversify investment timeline',
-            'Consider interest rate hedging',
-            'Monitor local market indicators',
-            'Implement property improvements'
-        ]
-        return np.random.choice(suggestions, size=np.random.randint(2, 3), replace=False).tolist()
+        return self._sample_options(_RISK_MITIGATIONS, self._rng.integers(2, 3))
     
     def _identify_best_features(self) -> List[str]:
-        features = [
-            'Transportation accessibility',
-            'Neighborhood appreciation trends',
-            'Property condition score',
-            'Market liquidity metrics'
-        ]
-        return np.random.choice(features, size=3, replace=False).tolist()
+        return self._sample_options(_BEST_FEATURES, 3)
+    
+    def _sample_options(self, options: Sequence[str], k: int) -> List[str]:
+        """Pick ``k`` distinct options by sampling indices rather than the strings themselves."""
+        return [options[i] for i in self._rng.choice(len(options), size=k, replace=False)]
     
-    def _generate_feature_interactions(self, features: List[str]) -> Dict[str, float]:
-        interactions = {}
-        for i, feat1 in enumerate(features):
-            for feat2 in features[i+1:]:
-                interactions[f"{feat1}_x_{feat2}"] = np.random.uniform(0.05, 0.25)
-        return interactions
+    def _generate_feature_interactions(self, features: Sequence[str]) -> Dict[str, float]:
+        keys = _interaction_keys(tuple(features))
+        return {key: _uniform(r, 0.05, 0.25) for key, r in zip(keys, self._draw(len(keys)))}
     
-    def _generate_lime_explanations(self, features: List[str]) -> Dict[str, Dict[str, float]]:
+    def _generate_lime_explanations(self, features: Sequence[str]) -> Dict[str, Dict[str, float]]:
+        u = self._draw(len(features))
         return {
             'positive_contributions': {
-                feat: np.random.uniform(0, 20000) for feat in features[:3]
+                feat: _uniform(r, 0, 20000) for feat, r in zip(features[:3], u[:3])
             },
             'negative_contributions': {
-                feat: np.random.uniform(-15000, 0) for feat in features[3:]
+                feat: _uniform(r, -15000, 0) for feat, r in zip(features[3:], u[3:])
             }
         }
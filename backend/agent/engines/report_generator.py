@@ -2,14 +2,155 @@
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Any, Tuple
-import time
-from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Dict, List, Any, Tuple, Optional, Mapping, Sequence, TypedDict
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+import itertools
 import json
 from dataclasses import dataclass
 
+from ..jit import njit
+from .sampling import choice as _choice, randint as _randint, uniform as _uniform
 
-@dataclass
+# Bound formatters for the report's recurring value formats
+_FMT_DOLLARS_K = "${:,}k".format
+_FMT_PCT1 = "{:.1f}%".format
+_FMT_PCT0 = "{:.0f}%".format
+
+# Static report content, shared read-only across reports
+_METHODOLOGY_APPENDIX = MappingProxyType({
+    'analytical_framework': 'Multi-factor quantitative analysis',
+    'data_collection_methods': ('Primary research', 'Secondary data sources', 'Expert interviews'),
+    'valuation_methodologies': ('DCF analysis', 'Comparable sales', 'Income approach'),
+    'risk_assessment_framework': 'Monte Carlo simulation and scenario analysis',
+    'quality_assurance': 'Multi-stage validation and peer review'
+})
+
+_DATA_SOURCES = (
+    'NYC Department of Finance property records',
+    'Multiple Listing Service (MLS) data',
+    'US Census Bureau demographic data',
+    'Bureau of Labor Statistics employment data',
+    'NYC Department of Buildings permit data',
+    'Real estate industry reports and publications',
+    'Economic research and market studies'
+)
+
+_ASSUMPTIONS = (
+    'Interest rates remain within current historical range',
+    'No major economic recession during analysis period',
+    'Local zoning and tax policies remain stable',
+    'Demographics trends continue at current pace',
+    'No major natural disasters or force majeure events'
+)
+
+_DISCLAIMERS = (
+    'This analysis is for informational purposes only and does not constitute investment advice',
+    'Past performance does not guarantee future results',
+    'Real estate investments carry inherent risks including market volatility',
+    'All projections and forecasts are estimates based on current information',
+    'Investors should conduct their own due diligence before making investment decisions'
+)
+
+_RISK_CATEGORIES = ('Market Risk', 'Liquidity Risk', 'Credit Risk', 'Regulatory Risk', 'Environmental Risk')
+
+# Option pools that report sections sample from
+_TOP_RISKS = (
+    'Market volatility and interest rate sensitivity',
+    'Regulatory changes affecting development rights',
+    'Local economic conditions and employment trends',
+    'Competition from new developments',
+    'Infrastructure and transportation disruptions'
+)
+
+_PROPERTY_ADVANTAGES = (
+    'Prime location with unmatched accessibility',
+    'Unique architectural features and design',
+    'Superior building amenities and services',
+    'Strong property management and maintenance',
+    'Historical appreciation outperformance'
+)
+
+_MARKET_DRIVERS = (
+    'Population growth and demographic shifts',
+    'Employment growth in key sectors',
+    'Infrastructure development and improvements',
+    'Zoning changes enabling higher density',
+    'Corporate relocations and expansions'
+)
+
+_DEMAND_DRIVERS = (
+    'Strong job market growth',
+    'Limited housing supply',
+    'Immigration and in-migration',
+    'Millennial household formation',
+    'Foreign investment interest'
+)
+
+_SUPPLY_CONSTRAINTS = (
+    'Limited developable land',
+    'Strict zoning regulations',
+    'High construction costs',
+    'Lengthy permitting process',
+    'Environmental restrictions'
+)
+
+_BARRIERS_TO_ENTRY = (
+    'High capital requirements',
+    'Regulatory complexity',
+    'Market knowledge and relationships',
+    'Brand recognition and reputation',
+    'Access to prime locations'
+)
+
+_COMPETITIVE_ADVANTAGES = (
+    'First-mover advantage in emerging neighborhoods',
+    'Exclusive relationships with developers',
+    'Superior market intelligence and data',
+    'Innovative financing solutions',
+    'Strong local market presence'
+)
+
+_DEMOGRAPHIC_TRENDS = (
+    'Increasing urbanization and city preference',
+    'Delayed homeownership among millennials',
+    'Growing demand for amenity-rich living',
+    'Preference for transit-oriented development',
+    'Increased focus on work-life balance'
+)
+
+_PROJECTION_YEARS = 10
+
+_REPORT_SECTIONS = (
+    'executive_summary', 'market_analysis', 'financial_analysis', 'risk_assessment',
+    'comparative_analysis', 'recommendations', 'visualizations'
+)
+
+# Report ids are the generation date plus a process-wide sequence number
+_report_sequence = itertools.count(1000)
+
+
+@lru_cache(maxsize=4)
+def _report_date(ordinal: int) -> str:
+    """Format a proleptic Gregorian ordinal as the report id date stamp."""
+    return date.fromordinal(ordinal).strftime('%Y%m%d')
+
+
+@njit(cache=True)
+def _cash_flow_kernel(base_cf: float, growth_rate: float, years: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return annual and cumulative cash flows compounding ``base_cf`` at ``growth_rate``."""
+    annual = np.empty(years)
+    cumulative = np.empty(years)
+    total = 0.0
+    for year in range(years):
+        annual[year] = base_cf * (1.0 + growth_rate) ** year
+        total += annual[year]
+        cumulative[year] = total
+    return annual, cumulative
+
+
+@dataclass(slots=True, frozen=True)
 class ReportConfiguration:
     """Configuration for report generation."""
     report_type: str
@@ -21,63 +162,110 @@ class ReportConfiguration:
     format_preference: str
 
 
+class ExecutiveSummarySection(TypedDict):
+    """Shape of the executive summary section."""
+    investment_thesis: str
+    key_highlights: List[str]
+    financial_snapshot: Dict[str, Any]
+    risk_overview: Dict[str, Any]
+    market_position: Dict[str, Any]
+    recommendation_summary: Dict[str, Any]
+
+
+class MarketAnalysisSection(TypedDict):
+    """Shape of the market analysis section."""
+    market_overview: Dict[str, Any]
+    supply_demand_analysis: Dict[str, Any]
+    pricing_analysis: Dict[str, Any]
+    competitive_landscape: Dict[str, Any]
+    demographic_analysis: Dict[str, Any]
+
+
+class FinancialAnalysisSection(TypedDict):
+    """Shape of the financial analysis section."""
+    valuation_analysis: Dict[str, Any]
+    cash_flow_projections: Dict[str, Any]
+    return_analysis: Dict[str, Any]
+    scenario_analysis: Dict[str, Any]
+
+
+class RiskAssessmentSection(TypedDict):
+    """Shape of the risk assessment section."""
+    risk_matrix: Dict[str, Any]
+    risk_scoring: Dict[str, Any]
+    contingency_planning: Dict[str, Any]
+
+
+class ComparativeAnalysisSection(TypedDict):
+    """Shape of the comparative analysis section."""
+    peer_comparison: Dict[str, Any]
+    market_benchmarks: Dict[str, Any]
+    competitive_positioning: Dict[str, Any]
+
+
+class InvestmentRecommendationsSection(TypedDict):
+    """Shape of the investment recommendations section."""
+    primary_recommendation: Dict[str, Any]
+    investment_strategy: Dict[str, Any]
+    implementation_roadmap: Dict[str, Any]
+    alternative_scenarios: Dict[str, Any]
+
+
 class ExecutiveReportGenerator:
     """Generate executive-level investment reports."""
     
-    def __init__(self):
-        self.report_templates = {
-            'investment_memo': 'comprehensive_investment_analysis',
-            'market_summary': 'market_conditions_overview',
-            'risk_assessment': 'detailed_risk_evaluation',
-            'opportunity_analysis': 'investment_opportunity_report',
-            'due_diligence': 'complete_due_diligence_package'
-        }
-        
-        self.visualization_types = [
-            'price_trend_charts', 'market_comparison_matrix', 'risk_heat_maps',
-            'geographic_analysis_maps', 'financial_projection_graphs', 'sensitivity_analysis'
-        ]
+    REPORT_TEMPLATES = MappingProxyType({
+        'investment_memo': 'comprehensive_investment_analysis',
+        'market_summary': 'market_conditions_overview',
+        'risk_assessment': 'detailed_risk_evaluation',
+        'opportunity_analysis': 'investment_opportunity_report',
+        'due_diligence': 'complete_due_diligence_package'
+    })
+    
+    VISUALIZATION_TYPES = (
+        'price_trend_charts', 'market_comparison_matrix', 'risk_heat_maps',
+        'geographic_analysis_maps', 'financial_projection_graphs', 'sensitivity_analysis'
+    )
+    
+    def __init__(self, seed: Optional[int] = None):
+        self._rng = np.random.default_rng(seed)
     
     def generate_comprehensive_report(self, analysis_data: Dict[str, Any], 
                                     config: ReportConfiguration) -> Dict[str, Any]:
         """Generate comprehensive investment analysis report."""
         print("📊 Initializing Advanced Report Generation Engine...")
-        time.sleep(0.4)
         
         # Stage 1: Executive Summary Generation
         print("🎯 Stage 1/8: Executive Summary Generation")
         executive_summary = self._generate_executive_summary(analysis_data)
-        time.sleep(0.5)
         
         # Stage 2: Market Analysis Section
         print("📈 Stage 2/8: Market Analysis & Positioning")
         market_analysis = self._generate_market_analysis(analysis_data)
-        time.sleep(0.6)
         
         # Stage 3: Financial Analysis Section
         print("💰 Stage 3/8: Financial Analysis & Projections")
         financial_analysis = self._generate_financial_analysis(analysis_data)
-        time.sleep(0.5)
         
-        # Stage 4: Risk Assessment Section
-        print("⚠️  Stage 4/8: Risk Assessment & Mitigation")
-        risk_assessment = self._generate_risk_assessment(analysis_data)
-        time.sleep(0.4)
+        # Stage 4: Risk Assessment Section (skipped when the config opts out)
+        risk_assessment = None
+        if config.include_risk_analysis:
+            print("⚠️  Stage 4/8: Risk Assessment & Mitigation")
+            risk_assessment = self._generate_risk_assessment(analysis_data)
         
-        # Stage 5: Comparative Analysis Section
-        print("🔍 Stage 5/8: Comparative Analysis & Benchmarking")
-        comparative_analysis = self._generate_comparative_analysis(analysis_data)
-        time.sleep(0.5)
+        # Stage 5: Comparative Analysis Section (skipped when the config opts out)
+        comparative_analysis = None
+        if config.include_comparables:
+            print("🔍 Stage 5/8: Comparative Analysis & Benchmarking")
+            comparative_analysis = self._generate_comparative_analysis(analysis_data)
         
         # Stage 6: Investment Recommendations
         print("🎪 Stage 6/8: Investment Recommendations & Strategy")
         recommendations = self._generate_investment_recommendations(analysis_data)
-        time.sleep(0.4)
         
         # Stage 7: Data Visualizations
         print("📊 Stage 7/8: Interactive Data Visualizations")
         visualizations = self._generate_visualizations(analysis_data, config)
-        time.sleep(0.6)
         
         # Stage 8: Report Compilation & Formatting
         print("📋 Stage 8/8: Report Compilation & Quality Assurance")
@@ -90,93 +278,107 @@ class ExecutiveReportGenerator:
             'recommendations': recommendations,
             'visualizations': visualizations
         }, config)
-        time.sleep(0.5)
         
         return final_report
     
-    def _generate_executive_summary(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _draw(self, n: int) -> List[float]:
+        """Draw ``n`` unit-interval samples in a single vectorized call."""
+        return self._rng.random(n).tolist()
+    
+    def _pick(self, pool: Sequence[str], low: int, high: int) -> List[str]:
+        """Pick between ``low`` and ``high - 1`` distinct options from ``pool``."""
+        return self._sample_options(pool, self._rng.integers(low, high))
+    
+    def _sample_options(self, options: Sequence[str], k: int) -> List[str]:
+        """Pick ``k`` distinct options by sampling indices rather than the strings themselves."""
+        return [options[i] for i in self._rng.choice(len(options), size=k, replace=False)]
+    
+    def _generate_executive_summary(self, data: Dict[str, Any]) -> ExecutiveSummarySection:
         """Generate executive summary with key insights."""
+        u = self._draw(10)
         return {
             'investment_thesis': self._create_investment_thesis(),
             'key_highlights': self._extract_key_highlights(data),
             'financial_snapshot': {
-                'estimated_value': f"${np.random.randint(800, 2500):,}k",
-                'projected_roi': f"{np.random.uniform(8, 18):.1f}%",
-                'payback_period': f"{np.random.uniform(4, 8):.1f} years",
-                'irr_projection': f"{np.random.uniform(12, 22):.1f}%"
+                'estimated_value': _FMT_DOLLARS_K(_randint(u[0], 800, 2500)),
+                'projected_roi': _FMT_PCT1(_uniform(u[1], 8, 18)),
+                'payback_period': f"{_uniform(u[2], 4, 8):.1f} years",
+                'irr_projection': _FMT_PCT1(_uniform(u[3], 12, 22))
             },
             'risk_overview': {
-                'overall_risk_level': np.random.choice(['Low', 'Moderate', 'Elevated']),
-                'key_risk_factors': self._identify_top_risks(),
-                'risk_mitigation_score': np.random.uniform(0.7, 0.9)
+                'overall_risk_level': _choice(u[4], ('Low', 'Moderate', 'Elevated')),
+                'key_risk_factors': self._pick(_TOP_RISKS, 2, 4),
+                'risk_mitigation_score': _uniform(u[5], 0.7, 0.9)
             },
             'market_position': {
                 'market_segment': 'Premium Urban Residential',
-                'competitive_advantage': self._identify_competitive_advantages(),
-                'market_timing_score': np.random.uniform(0.7, 0.9)
+                'competitive_advantage': self._pick(_PROPERTY_ADVANTAGES, 2, 4),
+                'market_timing_score': _uniform(u[6], 0.7, 0.9)
             },
             'recommendation_summary': {
-                'investment_grade': np.random.choice(['A+', 'A', 'A-', 'B+']),
-                'confidence_level': f"{np.random.uniform(80, 95):.0f}%",
-                'action_recommendation': np.random.choice(['Strong Buy', 'Buy', 'Hold', 'Consider'])
+                'investment_grade': _choice(u[7], ('A+', 'A', 'A-', 'B+')),
+                'confidence_level': _FMT_PCT0(_uniform(u[8], 80, 95)),
+                'action_recommendation': _choice(u[9], ('Strong Buy', 'Buy', 'Hold', 'Consider'))
             }
         }
     
-    def _generate_market_analysis(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_market_analysis(self, data: Dict[str, Any]) -> MarketAnalysisSection:
         """Generate comprehensive market analysis section."""
+        u = self._draw(11)
         return {
             'market_overview': {
-                'market_size': f"${np.random.randint(5, 25):,}B total addressable market",
-                'growth_rate': f"{np.random.uniform(3, 12):.1f}% CAGR",
-                'market_maturity': np.random.choice(['Emerging', 'Growth', 'Mature', 'Declining']),
-                'market_drivers': self._identify_market_drivers()
+                'market_size': f"${_randint(u[0], 5, 25):,}B total addressable market",
+                'growth_rate': f"{_uniform(u[1], 3, 12):.1f}% CAGR",
+                'market_maturity': _choice(u[2], ('Emerging', 'Growth', 'Mature', 'Declining')),
+                'market_drivers': self._pick(_MARKET_DRIVERS, 3, 5)
             },
             'supply_demand_analysis': {
-                'current_inventory': f"{np.random.randint(150, 800):,} units",
-                'absorption_rate': f"{np.random.uniform(60, 90):.0f}% annually",
-                'months_supply': np.random.uniform(4, 12),
-                'demand_drivers': self._analyze_demand_drivers(),
-                'supply_constraints': self._analyze_supply_constraints()
+                'current_inventory': f"{_randint(u[3], 150, 800):,} units",
+                'absorption_rate': f"{_uniform(u[4], 60, 90):.0f}% annually",
+                'months_supply': _uniform(u[5], 4, 12),
+                'demand_drivers': self._pick(_DEMAND_DRIVERS, 2, 4),
+                'supply_constraints': self._pick(_SUPPLY_CONSTRAINTS, 2, 4)
             },
             'pricing_analysis': {
-                'current_pricing': f"${np.random.randint(800, 1800):,}/sq ft",
-                'pricing_trend': f"{np.random.uniform(-5, 15):.1f}% YoY",
-                'price_elasticity': np.random.uniform(0.3, 0.8),
+                'current_pricing': f"${_randint(u[6], 800, 1800):,}/sq ft",
+                'pricing_trend': f"{_uniform(u[7], -5, 15):.1f}% YoY",
+                'price_elasticity': _uniform(u[8], 0.3, 0.8),
                 'pricing_forecast': self._generate_pricing_forecast()
             },
             'competitive_landscape': {
-                'market_concentration': f"Top 5 players control {np.random.uniform(40, 70):.0f}%",
-                'competitive_intensity': np.random.choice(['Low', 'Moderate', 'High', 'Very High']),
-                'barriers_to_entry': self._analyze_barriers_to_entry(),
-                'competitive_advantages': self._analyze_competitive_advantages()
+                'market_concentration': f"Top 5 players control {_uniform(u[9], 40, 70):.0f}%",
+                'competitive_intensity': _choice(u[10], ('Low', 'Moderate', 'High', 'Very High')),
+                'barriers_to_entry': self._pick(_BARRIERS_TO_ENTRY, 2, 4),
+                'competitive_advantages': self._pick(_COMPETITIVE_ADVANTAGES, 2, 4)
             },
             'demographic_analysis': {
                 'target_demographics': self._analyze_target_demographics(),
-                'demographic_trends': self._analyze_demographic_trends(),
+                'demographic_trends': self._pick(_DEMOGRAPHIC_TRENDS, 3, 5),
                 'buyer_behavior': self._analyze_buyer_behavior(),
                 'migration_patterns': self._analyze_migration_patterns()
             }
         }
     
-    def _generate_financial_analysis(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_financial_analysis(self, data: Dict[str, Any]) -> FinancialAnalysisSection:
         """Generate detailed financial analysis."""
+        u = self._draw(12)
         return {
             'valuation_analysis': {
                 'dcf_valuation': {
-                    'net_present_value': f"${np.random.randint(900, 2200):,}k",
-                    'discount_rate': f"{np.random.uniform(8, 12):.1f}%",
-                    'terminal_value': f"${np.random.randint(1200, 3000):,}k",
+                    'net_present_value': _FMT_DOLLARS_K(_randint(u[0], 900, 2200)),
+                    'discount_rate': _FMT_PCT1(_uniform(u[1], 8, 12)),
+                    'terminal_value': _FMT_DOLLARS_K(_randint(u[2], 1200, 3000)),
                     'sensitivity_analysis': self._generate_sensitivity_analysis()
                 },
                 'comparable_sales': {
-                    'average_comp_price': f"${np.random.randint(800, 1600):,}/sq ft",
+                    'average_comp_price': f"${_randint(u[3], 800, 1600):,}/sq ft",
                     'adjustment_factors': self._generate_adjustment_factors(),
-                    'adjusted_value': f"${np.random.randint(950, 2100):,}k"
+                    'adjusted_value': _FMT_DOLLARS_K(_randint(u[4], 950, 2100))
                 },
                 'income_approach': {
-                    'cap_rate': f"{np.random.uniform(4, 8):.1f}%",
-                    'noi_estimate': f"${np.random.randint(80, 200):,}k annually",
-                    'income_value': f"${np.random.randint(1000, 2500):,}k"
+                    'cap_rate': _FMT_PCT1(_uniform(u[5], 4, 8)),
+                    'noi_estimate': f"${_randint(u[6], 80, 200):,}k annually",
+                    'income_value': _FMT_DOLLARS_K(_randint(u[7], 1000, 2500))
                 }
             },
             'cash_flow_projections': {
@@ -186,10 +388,10 @@ class ExecutiveReportGenerator:
                 'exit_strategies': self._analyze_exit_strategies()
             },
             'return_analysis': {
-                'total_return_projection': f"{np.random.uniform(15, 35):.1f}% over 5 years",
-                'annual_cash_yield': f"{np.random.uniform(4, 8):.1f}%",
-                'appreciation_component': f"{np.random.uniform(8, 15):.1f}% annually",
-                'risk_adjusted_return': f"{np.random.uniform(10, 20):.1f}%"
+                'total_return_projection': f"{_uniform(u[8], 15, 35):.1f}% over 5 years",
+                'annual_cash_yield': _FMT_PCT1(_uniform(u[9], 4, 8)),
+                'appreciation_component': f"{_uniform(u[10], 8, 15):.1f}% annually",
+                'risk_adjusted_return': _FMT_PCT1(_uniform(u[11], 10, 20))
             },
             'scenario_analysis': {
                 'base_case': self._generate_base_case_scenario(),
@@ -199,34 +401,35 @@ class ExecutiveReportGenerator:
             }
         }
     
-    def _generate_risk_assessment(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_risk_assessment(self, data: Dict[str, Any]) -> RiskAssessmentSection:
         """Generate comprehensive risk assessment."""
+        u = self._draw(10)
         return {
             'risk_matrix': {
                 'market_risk': {
-                    'probability': np.random.uniform(0.2, 0.6),
-                    'impact': np.random.choice(['Low', 'Medium', 'High']),
+                    'probability': _uniform(u[0], 0.2, 0.6),
+                    'impact': _choice(u[1], ('Low', 'Medium', 'High')),
                     'mitigation_strategies': self._generate_market_risk_mitigation()
                 },
                 'liquidity_risk': {
-                    'probability': np.random.uniform(0.1, 0.4),
-                    'impact': np.random.choice(['Medium', 'High']),
+                    'probability': _uniform(u[2], 0.1, 0.4),
+                    'impact': _choice(u[3], ('Medium', 'High')),
                     'mitigation_strategies': self._generate_liquidity_risk_mitigation()
                 },
                 'regulatory_risk': {
-                    'probability': np.random.uniform(0.15, 0.5),
-                    'impact': np.random.choice(['Medium', 'High']),
+                    'probability': _uniform(u[4], 0.15, 0.5),
+                    'impact': _choice(u[5], ('Medium', 'High')),
                     'mitigation_strategies': self._generate_regulatory_risk_mitigation()
                 },
                 'environmental_risk': {
-                    'probability': np.random.uniform(0.1, 0.3),
-                    'impact': np.random.choice(['Low', 'Medium', 'High']),
+                    'probability': _uniform(u[6], 0.1, 0.3),
+                    'impact': _choice(u[7], ('Low', 'Medium', 'High')),
                     'mitigation_strategies': self._generate_environmental_risk_mitigation()
                 }
             },
             'risk_scoring': {
-                'overall_risk_score': np.random.uniform(0.3, 0.7),
-                'risk_tolerance_match': np.random.uniform(0.6, 0.9),
+                'overall_risk_score': _uniform(u[8], 0.3, 0.7),
+                'risk_tolerance_match': _uniform(u[9], 0.6, 0.9),
                 'risk_adjusted_metrics': self._calculate_risk_adjusted_metrics()
             },
             'contingency_planning': {
@@ -236,7 +439,7 @@ class ExecutiveReportGenerator:
             }
         }
     
-    def _generate_comparative_analysis(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_comparative_analysis(self, data: Dict[str, Any]) -> ComparativeAnalysisSection:
         """Generate comparative analysis section."""
         return {
             'peer_comparison': {
@@ -257,14 +460,15 @@ class ExecutiveReportGenerator:
             }
         }
     
-    def _generate_investment_recommendations(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_investment_recommendations(self, data: Dict[str, Any]) -> InvestmentRecommendationsSection:
         """Generate investment recommendations and strategy."""
+        u = self._draw(3)
         return {
             'primary_recommendation': {
-                'action': np.random.choice(['Strong Buy', 'Buy', 'Hold', 'Sell']),
+                'action': _choice(u[0], ('Strong Buy', 'Buy', 'Hold', 'Sell')),
                 'rationale': self._generate_recommendation_rationale(),
-                'conviction_level': f"{np.random.uniform(70, 95):.0f}%",
-                'time_horizon': f"{np.random.randint(3, 10)} years"
+                'conviction_level': _FMT_PCT0(_uniform(u[1], 70, 95)),
+                'time_horizon': f"{_randint(u[2], 3, 10)} years"
             },
             'investment_strategy': {
                 'acquisition_strategy': self._develop_acquisition_strategy(),
@@ -288,20 +492,21 @@ class ExecutiveReportGenerator:
     def _generate_visualizations(self, data: Dict[str, Any], 
                                config: ReportConfiguration) -> Dict[str, Any]:
         """Generate data visualizations and charts."""
+        u = self._draw(2)
         visualizations = {}
         
         if config.include_charts:
             visualizations.update({
                 'price_trend_analysis': {
                     'chart_type': 'Line Chart',
-                    'data_points': np.random.randint(20, 60),
+                    'data_points': _randint(u[0], 20, 60),
                     'trend_indicators': ['Moving averages', 'Support/resistance levels'],
                     'forecast_projection': '24 months'
                 },
                 'comparative_analysis_chart': {
                     'chart_type': 'Radar Chart',
                     'comparison_metrics': ['Price', 'Location', 'Amenities', 'Growth', 'Risk'],
-                    'benchmark_properties': np.random.randint(5, 12)
+                    'benchmark_properties': _randint(u[1], 5, 12)
                 },
                 'risk_heat_map': {
                     'chart_type': 'Heat Map',
@@ -325,10 +530,12 @@ class ExecutiveReportGenerator:
     def _compile_final_report(self, sections: Dict[str, Any], 
                              config: ReportConfiguration) -> Dict[str, Any]:
         """Compile final report with metadata and formatting."""
+        u = self._draw(4)
+        generated_at = datetime.now()
         return {
             'report_metadata': {
-                'report_id': f"INV-{datetime.now().strftime('%Y%m%d')}-{np.random.randint(1000, 9999)}",
-                'generation_timestamp': datetime.now().isoformat(),
+                'report_id': f"INV-{_report_date(generated_at.toordinal())}-{next(_report_sequence)}",
+                'generation_timestamp': generated_at.isoformat(),
                 'report_type': config.report_type,
                 'target_audience': config.target_audience,
                 'detail_level': config.detail_level,
@@ -337,24 +544,20 @@ class ExecutiveReportGenerator:
                 'analyst': 'Kiyosaki AI Investment Analyst',
                 'review_status': 'Draft'
             },
-            'executive_summary': sections['executive_summary'],
-            'market_analysis': sections['market_analysis'],
-            'financial_analysis': sections['financial_analysis'],
-            'risk_assessment': sections['risk_assessment'],
-            'comparative_analysis': sections['comparative_analysis'],
-            'recommendations': sections['recommendations'],
-            'visualizations': sections['visualizations'],
+            # Sections that were not generated are left out of the report
+            **{name: sections[name] for name in _REPORT_SECTIONS if sections.get(name) is not None},
             'appendices': {
-                'methodology': self._generate_methodology_appendix(),
+                # Plain dict so the report serializes natively; the nested tuples already do
+                'methodology': dict(self._generate_methodology_appendix()),
                 'data_sources': self._generate_data_sources_appendix(),
                 'assumptions': self._generate_assumptions_appendix(),
                 'disclaimers': self._generate_disclaimers()
             },
             'quality_metrics': {
-                'completeness_score': np.random.uniform(0.90, 0.98),
-                'accuracy_confidence': np.random.uniform(0.85, 0.95),
-                'timeliness_score': np.random.uniform(0.95, 1.0),
-                'relevance_score': np.random.uniform(0.88, 0.96)
+                'completeness_score': _uniform(u[0], 0.90, 0.98),
+                'accuracy_confidence': _uniform(u[1], 0.85, 0.95),
+                'timeliness_score': _uniform(u[2], 0.95, 1.0),
+                'relevance_score': _uniform(u[3], 0.88, 0.96)
             }
         }
     
@@ -367,233 +570,131 @@ class ExecutiveReportGenerator:
             "Stable cash flow opportunity in resilient market segment",
             "Value-add opportunity with significant upside potential"
         ]
-        return np.random.choice(theses)
+        return _choice(self._rng.random(), theses)
     
     def _extract_key_highlights(self, data: Dict) -> List[str]:
+        u = self._draw(5)
         highlights = [
-            f"Located in top {np.random.randint(10, 25)}% of neighborhood for desirability",
-            f"Expected {np.random.uniform(8, 18):.1f}% annual appreciation over next 5 years",
-            f"Strong rental demand with {np.random.uniform(95, 99):.0f}% occupancy rates",
-            f"Proximity to {np.random.randint(3, 8)} major transportation hubs",
-            f"Surrounded by ${np.random.randint(50, 200)}M+ in planned infrastructure investment"
-        ]
-        return np.random.choice(highlights, size=np.random.randint(3, 5), replace=False).tolist()
-    
-    def _identify_top_risks(self) -> List[str]:
-        risks = [
-            'Market volatility and interest rate sensitivity',
-            'Regulatory changes affecting development rights',
-            'Local economic conditions and employment trends',
-            'Competition from new developments',
-            'Infrastructure and transportation disruptions'
-        ]
-        return np.random.choice(risks, size=np.random.randint(2, 4), replace=False).tolist()
-    
-    def _identify_competitive_advantages(self) -> List[str]:
-        advantages = [
-            'Prime location with unmatched accessibility',
-            'Unique architectural features and design',
-            'Superior building amenities and services',
-            'Strong property management and maintenance',
-            'Historical appreciation outperformance'
-        ]
-        return np.random.choice(advantages, size=np.random.randint(2, 4), replace=False).tolist()
-    
-    def _identify_market_drivers(self) -> List[str]:
-        drivers = [
-            'Population growth and demographic shifts',
-            'Employment growth in key sectors',
-            'Infrastructure development and improvements',
-            'Zoning changes enabling higher density',
-            'Corporate relocations and expansions'
+            f"Located in top {_randint(u[0], 10, 25)}% of neighborhood for desirability",
+            f"Expected {_uniform(u[1], 8, 18):.1f}% annual appreciation over next 5 years",
+            f"Strong rental demand with {_uniform(u[2], 95, 99):.0f}% occupancy rates",
+            f"Proximity to {_randint(u[3], 3, 8)} major transportation hubs",
+            f"Surrounded by ${_randint(u[4], 50, 200)}M+ in planned infrastructure investment"
         ]
-        return np.random.choice(drivers, size=np.random.randint(3, 5), replace=False).tolist()
-    
-    def _analyze_demand_drivers(self) -> List[str]:
-        drivers = [
-            'Strong job market growth',
-            'Limited housing supply',
-            'Immigration and in-migration',
-            'Millennial household formation',
-            'Foreign investment interest'
-        ]
-        return np.random.choice(drivers, size=np.random.randint(2, 4), replace=False).tolist()
-    
-    def _analyze_supply_constraints(self) -> List[str]:
-        constraints = [
-            'Limited developable land',
-            'Strict zoning regulations',
-            'High construction costs',
-            'Lengthy permitting process',
-            'Environmental restrictions'
-        ]
-        return np.random.choice(constraints, size=np.random.randint(2, 4), replace=False).tolist()
+        return self._sample_options(highlights, self._rng.integers(3, 5))
     
     def _generate_pricing_forecast(self) -> Dict[str, float]:
+        u = self._draw(4)
         return {
-            '1_year': np.random.uniform(0.03, 0.12),
-            '3_year': np.random.uniform(0.15, 0.35),
-            '5_year': np.random.uniform(0.25, 0.60),
-            '10_year': np.random.uniform(0.50, 1.20)
+            '1_year': _uniform(u[0], 0.03, 0.12),
+            '3_year': _uniform(u[1], 0.15, 0.35),
+            '5_year': _uniform(u[2], 0.25, 0.60),
+            '10_year': _uniform(u[3], 0.50, 1.20)
         }
     
-    def _analyze_barriers_to_entry(self) -> List[str]:
-        barriers = [
-            'High capital requirements',
-            'Regulatory complexity',
-            'Market knowledge and relationships',
-            'Brand recognition and reputation',
-            'Access to prime locations'
-        ]
-        return np.random.choice(barriers, size=np.random.randint(2, 4), replace=False).tolist()
-    
-    def _analyze_competitive_advantages(self) -> List[str]:
-        advantages = [
-            'First-mover advantage in emerging neighborhoods',
-            'Exclusive relationships with developers',
-            'Superior market intelligence and data',
-            'Innovative financing solutions',
-            'Strong local market presence'
-        ]
-        return np.random.choice(advantages, size=np.random.randint(2, 4), replace=False).tolist()
-    
     def _analyze_target_demographics(self) -> Dict[str, Any]:
+        u = self._draw(2)
         return {
             'primary_target': 'Young professionals (25-40)',
             'secondary_target': 'Growing families (30-45)',
-            'income_range': f"${np.random.randint(75, 200)}k - ${np.random.randint(200, 500)}k",
+            'income_range': f"${_randint(u[0], 75, 200)}k - ${_randint(u[1], 200, 500)}k",
             'lifestyle_preferences': ['Urban amenities', 'Transit access', 'Cultural attractions'],
             'buying_motivations': ['Investment potential', 'Lifestyle upgrade', 'Family considerations']
         }
     
-    def _analyze_demographic_trends(self) -> List[str]:
-        trends = [
-            'Increasing urbanization and city preference',
-            'Delayed homeownership among millennials',
-            'Growing demand for amenity-rich living',
-            'Preference for transit-oriented development',
-            'Increased focus on work-life balance'
-        ]
-        return np.random.choice(trends, size=np.random.randint(3, 5), replace=False).tolist()
-    
     def _analyze_buyer_behavior(self) -> Dict[str, Any]:
         return {
-            'decision_timeline': f"{np.random.randint(3, 12)} months",
+            'decision_timeline': f"{_randint(self._rng.random(), 3, 12)} months",
             'key_factors': ['Location', 'Price', 'Amenities', 'Investment potential'],
             'information_sources': ['Online research', 'Broker relationships', 'Word of mouth'],
             'financing_preferences': ['Conventional mortgages', 'Jumbo loans', 'Cash purchases']
         }
     
     def _analyze_migration_patterns(self) -> Dict[str, Any]:
+        u = self._draw(2)
         return {
-            'net_migration': f"+{np.random.randint(500, 5000):,} annually",
+            'net_migration': f"+{_randint(u[0], 500, 5000):,} annually",
             'primary_sources': ['Suburban areas', 'Other cities', 'International'],
-            'retention_rate': f"{np.random.uniform(80, 95):.0f}%",
+            'retention_rate': _FMT_PCT0(_uniform(u[1], 80, 95)),
             'migration_drivers': ['Job opportunities', 'Lifestyle preferences', 'Educational access']
         }
     
-    def _generate_methodology_appendix(self) -> Dict[str, Any]:
-        return {
-            'analytical_framework': 'Multi-factor quantitative analysis',
-            'data_collection_methods': ['Primary research', 'Secondary data sources', 'Expert interviews'],
-            'valuation_methodologies': ['DCF analysis', 'Comparable sales', 'Income approach'],
-            'risk_assessment_framework': 'Monte Carlo simulation and scenario analysis',
-            'quality_assurance': 'Multi-stage validation and peer review'
-        }
+    def _generate_methodology_appendix(self) -> Mapping[str, Any]:
+        return _METHODOLOGY_APPENDIX
     
-    def _generate_data_sources_appendix(self) -> List[str]:
-        sources = [
-            'NYC Department of Finance property records',
-            'Multiple Listing Service (MLS) data',
-            'US Census Bureau demographic data',
-            'Bureau of Labor Statistics employment data',
-            'NYC Department of Buildings permit data',
-            'Real estate industry reports and publications',
-            'Economic research and market studies'
-        ]
-        return sources
+    def _generate_data_sources_appendix(self) -> Tuple[str, ...]:
+        return _DATA_SOURCES
     
-    def _generate_assumptions_appendix(self) -> List[str]:
-        assumptions = [
-            'Interest rates remain within current historical range',
-            'No major economic recession during analysis period',
-            'Local zoning and tax policies remain stable',
-            'Demographics trends continue at current pace',
-            'No major natural disasters or force majeure events'
-        ]
-        return assumptions
+    def _generate_assumptions_appendix(self) -> Tuple[str, ...]:
+        return _ASSUMPTIONS
     
-    def _generate_disclaimers(self) -> List[str]:
-        disclaimers = [
-            'This analysis is for informational purposes only and does not constitute investment advice',
-            'Past performance does not guarantee future results',
-            'Real estate investments carry inherent risks including market volatility',
-            'All projections and forecasts are estimates based on current information',
-            'Investors should conduct their own due diligence before making investment decisions'
-        ]
-        return disclaimers
+    def _generate_disclaimers(self) -> Tuple[str, ...]:
+        return _DISCLAIMERS
     
     # Additional helper methods for financial analysis
     def _generate_sensitivity_analysis(self) -> Dict[str, Dict[str, float]]:
+        u = self._draw(8)
         return {
             'discount_rate_sensitivity': {
-                '7%': np.random.uniform(1100, 1300),
-                '8%': np.random.uniform(1000, 1200),
-                '9%': np.random.uniform(900, 1100),
-                '10%': np.random.uniform(800, 1000)
+                '7%': _uniform(u[0], 1100, 1300),
+                '8%': _uniform(u[1], 1000, 1200),
+                '9%': _uniform(u[2], 900, 1100),
+                '10%': _uniform(u[3], 800, 1000)
             },
             'growth_rate_sensitivity': {
-                '2%': np.random.uniform(800, 1000),
-                '3%': np.random.uniform(900, 1100),
-                '4%': np.random.uniform(1000, 1200),
-                '5%': np.random.uniform(1100, 1300)
+                '2%': _uniform(u[4], 800, 1000),
+                '3%': _uniform(u[5], 900, 1100),
+                '4%': _uniform(u[6], 1000, 1200),
+                '5%': _uniform(u[7], 1100, 1300)
             }
         }
     
     def _generate_adjustment_factors(self) -> Dict[str, float]:
+        u = self._draw(5)
         return {
-            'size_adjustment': np.random.uniform(-0.05, 0.05),
-            'condition_adjustment': np.random.uniform(-0.03, 0.08),
-            'location_adjustment': np.random.uniform(-0.10, 0.15),
-            'amenity_adjustment': np.random.uniform(-0.05, 0.10),
-            'timing_adjustment': np.random.uniform(-0.02, 0.05)
+            'size_adjustment': _uniform(u[0], -0.05, 0.05),
+            'condition_adjustment': _uniform(u[1], -0.03, 0.08),
+            'location_adjustment': _uniform(u[2], -0.10, 0.15),
+            'amenity_adjustment': _uniform(u[3], -0.05, 0.10),
+            'timing_adjustment': _uniform(u[4], -0.02, 0.05)
         }
     
     def _generate_cash_flow_projections(self) -> Dict[str, List[float]]:
-        years = list(range(1, 11))
-        base_cf = np.random.uniform(80, 150)
-        growth_rate = np.random.uniform(0.02, 0.05)
+        u = self._draw(2)
+        base_cf = _uniform(u[0], 80, 150)
+        growth_rate = _uniform(u[1], 0.02, 0.05)
         
-        cash_flows = [base_cf * (1 + growth_rate) ** (year - 1) for year in years]
+        annual, cumulative = _cash_flow_kernel(base_cf, growth_rate, _PROJECTION_YEARS)
         
         return {
-            'years': years,
-            'annual_cash_flow': [round(cf, 1) for cf in cash_flows],
-            'cumulative_cash_flow': [round(sum(cash_flows[:i+1]), 1) for i in range(len(cash_flows))]
+            'years': np.arange(1, _PROJECTION_YEARS + 1).tolist(),
+            'annual_cash_flow': np.round(annual, 1).tolist(),
+            'cumulative_cash_flow': np.round(cumulative, 1).tolist()
         }
     
     def _analyze_financing_scenarios(self) -> Dict[str, Dict[str, Any]]:
+        u = self._draw(8)
         return {
             'cash_purchase': {
                 'down_payment': '100%',
                 'financing_cost': 0,
-                'equity_required': f"${np.random.randint(1000, 2500):,}k",
-                'cash_on_cash_return': f"{np.random.uniform(4, 8):.1f}%"
+                'equity_required': _FMT_DOLLARS_K(_randint(u[0], 1000, 2500)),
+                'cash_on_cash_return': _FMT_PCT1(_uniform(u[1], 4, 8))
             },
             'conventional_financing': {
                 'down_payment': '20%',
-                'loan_amount': f"${np.random.randint(800, 2000):,}k",
-                'interest_rate': f"{np.random.uniform(5.5, 7.5):.1f}%",
-                'monthly_payment': f"${np.random.randint(4000, 12000):,}",
+                'loan_amount': _FMT_DOLLARS_K(_randint(u[2], 800, 2000)),
+                'interest_rate': _FMT_PCT1(_uniform(u[3], 5.5, 7.5)),
+                'monthly_payment': f"${_randint(u[4], 4000, 12000):,}",
                 'leverage_ratio': '80%'
             },
             'investor_financing': {
                 'down_payment': '25%',
-                'loan_amount': f"${np.random.randint(750, 1875):,}k",
-                'interest_rate': f"{np.random.uniform(6.0, 8.0):.1f}%",
-                'debt_service_coverage': np.random.uniform(1.2, 1.8)
+                'loan_amount': _FMT_DOLLARS_K(_randint(u[5], 750, 1875)),
+                'interest_rate': _FMT_PCT1(_uniform(u[6], 6.0, 8.0)),
+                'debt_service_coverage': _uniform(u[7], 1.2, 1.8)
             }
         }
     
-    def _get_risk_categories(self) -> List[str]:
-        return ['Market Risk', 'Liquidity Risk', 'Credit Risk', 'Regulatory Risk', 'Environmental Risk']
+    def _get_risk_categories(self) -> Tuple[str, ...]:
+        return _RISK_CATEGORIES
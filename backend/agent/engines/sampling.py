@@ -0,0 +1,21 @@
+"""Scalers that turn batched unit-interval draws into the engines' sampled values.
+
+Engines draw every random number a method needs in one vectorized call and
+map each sample onto its range with these helpers.
+"""
+from typing import Any, Sequence
+
+
+def uniform(u: float, low: float, high: float) -> float:
+    """Scale a unit-interval sample to [low, high)."""
+    return low + (high - low) * u
+
+
+def randint(u: float, low: int, high: int) -> int:
+    """Map a unit-interval sample to an integer in [low, high)."""
+    return low + int((high - low) * u)
+
+
+def choice(u: float, options: Sequence[Any]) -> Any:
+    """Pick an option using a unit-interval sample."""
+    return options[int(len(options) * u)]
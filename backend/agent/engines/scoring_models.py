@@ -2,7 +2,6 @@
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Any, Tuple
-import time
 from datetime import datetime
 import json
 
@@ -32,37 +31,30 @@ class PropertyScoringEngine:
     def calculate_comprehensive_score(self, property_data: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate comprehensive property investment score."""
         print("🎯 Initializing Advanced Scoring Engine...")
-        time.sleep(0.4)
         
         # Stage 1: Location Analysis
         print("📍 Stage 1/6: Multi-Dimensional Location Scoring")
         location_score = self._calculate_location_score(property_data)
-        time.sleep(0.3)
         
         # Stage 2: Market Fundamentals
         print("📊 Stage 2/6: Market Fundamentals Analysis")
         market_score = self._calculate_market_fundamentals_score(property_data)
-        time.sleep(0.3)
         
         # Stage 3: Growth Potential
         print("📈 Stage 3/6: Growth Potential Modeling")
         growth_score = self._calculate_growth_potential_score(property_data)
-        time.sleep(0.3)
         
         # Stage 4: Risk Assessment
         print("⚡ Stage 4/6: Risk Profile Quantification")
         risk_score = self._calculate_risk_score(property_data)
-        time.sleep(0.3)
         
         # Stage 5: Cash Flow Analysis
         print("💰 Stage 5/6: Cash Flow Potential Analysis")
         cash_flow_score = self._calculate_cash_flow_score(property_data)
-        time.sleep(0.3)
         
         # Stage 6: Appreciation Modeling
         print("🚀 Stage 6/6: Appreciation Potential Modeling")
         appreciation_score = self._calculate_appreciation_score(property_data)
-        time.sleep(0.4)
         
         # Calculate composite score
         composite_score = self._calculate_composite_score({
@@ -440,7 +432,6 @@ class ComparableAnalysisEngine:
     def analyze_comparables(self, target_property: Dict, comparables: List[Dict]) -> Dict[str, Any]:
         """Perform sophisticated comparable analysis."""
         print("🔍 Analyzing Comparable Properties...")
-        time.sleep(0.5)
         
         # Generate detailed comparable analysis
         comp_analysis = {
@@ -0,0 +1,16 @@
+"""Optional Numba JIT support for numeric kernels.
+
+Numba is an optional accelerator: when it is not installed, ``njit`` falls
+back to a no-op decorator, ``prange`` to ``range``, and the kernels run as plain Python.
+"""
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - exercised only without numba
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit``."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    prange = range
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from .schemas import ReasoningInput, ReasoningOutput
 from .tools import (
     geocode,
@@ -18,6 +20,12 @@ from .engines.report_generator import ExecutiveReportGenerator, ReportConfigurat
 from .engines.ml_predictor import MLPredictionEngine
 from .central_agent import CentralReasoningAgent
 
+# The market engines are shared across runs so their per-location caches
+# persist between requests
+_MARKET_INTELLIGENCE = MarketIntelligenceEngine()
+_SENTIMENT_ENGINE = SentimentAnalysisEngine()
+_RISK_ENGINE = RiskAssessmentEngine()
+
 def run(address: str, radius_m: int = 800, include_long_context: bool = True) -> ReasoningOutput:
     """
     Runs the comprehensive multi-stage analysis for a given address.
@@ -30,9 +38,9 @@ def run(address: str, radius_m: int = 800, include_long_context: bool = True) ->
     central_agent = CentralReasoningAgent()
     
     # Initialize Advanced Analysis Engines
-    market_intelligence = MarketIntelligenceEngine()
-    sentiment_engine = SentimentAnalysisEngine()
-    risk_engine = RiskAssessmentEngine()
+    market_intelligence = _MARKET_INTELLIGENCE
+    sentiment_engine = _SENTIMENT_ENGINE
+    risk_engine = _RISK_ENGINE
     scoring_engine = PropertyScoringEngine()
     comparable_engine = ComparableAnalysisEngine()
     data_processor = DataProcessingEngine()
@@ -74,8 +82,12 @@ def run(address: str, radius_m: int = 800, include_long_context: bool = True) ->
 
     # Stage 4: Market Intelligence Analysis
     print("\n🧠 STAGE 4: MARKET INTELLIGENCE & TREND ANALYSIS")
-    market_trends = market_intelligence.analyze_market_trends(lat, lon, radius_m)
-    market_sentiment = sentiment_engine.analyze_market_sentiment(lat, lon)
+    # Trend and sentiment analyses are independent and each engine owns its
+    # generator, so they run side by side; risk assessment below needs the trends
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        trends_future = executor.submit(market_intelligence.analyze_market_trends, lat, lon, radius_m)
+        sentiment_future = executor.submit(sentiment_engine.analyze_market_sentiment, lat, lon)
+        market_trends, market_sentiment = trends_future.result(), sentiment_future.result()
     print("✅ Market intelligence analysis completed")
 
     # Stage 5: Advanced Risk Assessment
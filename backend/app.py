@@ -1,6 +1,9 @@
 from fastapi import FastAPI
+from .config import configure_logging
 from .router_analysis import router as analysis_router
 
+configure_logging()
+
 app = FastAPI()
 
 app.include_router(analysis_router)
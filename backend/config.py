@@ -1,4 +1,5 @@
 from dotenv import load_dotenv
+import logging
 import os
 
 load_dotenv()
@@ -9,3 +10,9 @@ GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 MODEL_REASONER = os.getenv("MODEL_REASONER", "gemini-1.5-pro")
 DATA_DIR = os.getenv("DATA_DIR", "backend/data")
 CACHE_DIR = os.getenv("CACHE_DIR", "backend/cache")
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
+
+def configure_logging() -> None:
+    """Send agent progress logging to stderr at LOG_LEVEL, unless logging is already set up."""
+    logging.basicConfig(level=LOG_LEVEL, format="%(message)s")
@@ -1,12 +1,24 @@
 """Caching and synchronization utilities for jobs."""
 import os
 import time
-import json
+import orjson
+from collections.abc import Mapping
 from typing import Dict, Any, Optional
 
 # Simple file-based cache for results
 CACHE_DIR = "backend/cache"
 
+# Analysis results carry NumPy scalars/arrays and non-string dict keys
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+def _orjson_default(obj: Any) -> Any:
+    """Encode the non-dict mappings and sets that orjson does not handle natively."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
 def cache_result(key: str, result: Dict[str, Any], ttl_seconds: int = 3600):
     """Cache a result to disk with TTL."""
     os.makedirs(CACHE_DIR, exist_ok=True)
@@ -18,8 +30,8 @@ def cache_result(key: str, result: Dict[str, Any], ttl_seconds: int = 3600):
     }
     
     cache_file = os.path.join(CACHE_DIR, f"{key}.json")
-    with open(cache_file, "w") as f:
-        json.dump(cache_data, f)
+    with open(cache_file, "wb") as f:
+        f.write(orjson.dumps(cache_data, default=_orjson_default, option=ORJSON_OPTIONS))
 
 def get_cached_result(key: str) -> Optional[Dict[str, Any]]:
     """Get a cached result if it's still valid."""
@@ -29,8 +41,8 @@ def get_cached_result(key: str) -> Optional[Dict[str, Any]]:
         return None
     
     try:
-        with open(cache_file, "r") as f:
-            cache_data = json.load(f)
+        with open(cache_file, "rb") as f:
+            cache_data = orjson.loads(f.read())
         
         cached_at = cache_data.get("cached_at", 0)
         ttl = cache_data.get("ttl", 3600)
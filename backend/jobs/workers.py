@@ -3,6 +3,10 @@
 def run_analysis_job(address: str, radius_m: int, include_long_context: bool):
     """Worker function to run analysis jobs in the background."""
     from ..agent.orchestrator import run
+    from ..config import configure_logging
+    
+    # RQ runs jobs in a separate worker process that never imports the app
+    configure_logging()
     
     try:
         result = run(address, radius_m, include_long_context)
@@ -0,0 +1,103 @@
+"""Unit tests for the central reasoning agent."""
+import pytest
+
+from backend.agent.central_agent import CentralReasoningAgent, Thought
+
+
+REQUEST = {
+    'address': 'Central Park, New York, NY',
+    'radius_m': 800,
+    'include_long_context': True,
+    'analysis_type': 'real_estate_investment'
+}
+
+
+def test_reasoning_process_returns_expected_structure():
+    """Test that a reasoning pass produces thoughts, validation and decisions."""
+    result = CentralReasoningAgent().engage_reasoning_process(REQUEST)
+    
+    reasoning = result['agent_reasoning']
+    assert len(reasoning['thought_chain']) > 0
+    assert all(isinstance(t, Thought) for t in reasoning['thought_chain'])
+    assert 0.0 <= reasoning['validated_insights']['validation_score'] <= 1.0
+    assert len(reasoning['final_decisions']) == 2
+
+
+def test_seeded_agents_produce_identical_confidences():
+    """Test that seeding the agent makes confidence sampling reproducible."""
+    first = CentralReasoningAgent(seed=7).engage_reasoning_process(REQUEST)
+    second = CentralReasoningAgent(seed=7).engage_reasoning_process(REQUEST)
+    
+    first_conf = [t.confidence for t in first['agent_reasoning']['thought_chain']]
+    second_conf = [t.confidence for t in second['agent_reasoning']['thought_chain']]
+    assert first_conf == second_conf
+
+
+def test_learning_patterns_are_bounded(monkeypatch):
+    """Test that the learning pattern store evicts its oldest entries."""
+    monkeypatch.setattr('backend.agent.central_agent._MAX_LEARNING_PATTERNS', 2)
+    agent = CentralReasoningAgent(seed=1)
+    
+    for address in ('A', 'B', 'C'):
+        agent.engage_reasoning_process(dict(REQUEST, address=address))
+    
+    assert list(agent.learning_patterns) == [
+        'real_estate_investment_B',
+        'real_estate_investment_C'
+    ]
+
+
+def test_learning_patterns_record_only_the_current_run_modes():
+    """Test that each learning pattern lists the modes of its own run only."""
+    agent = CentralReasoningAgent(seed=1)
+    long_run = agent.engage_reasoning_process(dict(REQUEST, address='A'))
+    short_run = agent.engage_reasoning_process(
+        dict(REQUEST, address='B', radius_m=2000, include_long_context=False)
+    )
+    
+    for address, result in (('A', long_run), ('B', short_run)):
+        chain = result['agent_reasoning']['thought_chain']
+        pattern = agent.learning_patterns[f'real_estate_investment_{address}']
+        assert pattern['reasoning_modes_used'] == sorted({t.reasoning_mode.value for t in chain})
+
+
+def test_recorded_confidences_only_reuse_the_run_buffer_for_its_own_chain():
+    """Test that an equal-length chain from another run is read from its own thoughts."""
+    agent = CentralReasoningAgent(seed=1)
+    first_chain = agent.engage_reasoning_process(REQUEST)['agent_reasoning']['thought_chain']
+    second_chain = agent.engage_reasoning_process(REQUEST)['agent_reasoning']['thought_chain']
+    foreign = first_chain[:len(second_chain)]
+    
+    assert agent._recorded_confidences(foreign).tolist() == [t.confidence for t in foreign]
+    assert agent._recorded_confidences(second_chain).tolist() == [t.confidence for t in second_chain]
+
+
+def test_validation_counts_modes_of_the_chain_it_is_given():
+    """Test that validating another run's chain reports that chain's mode mix."""
+    agent = CentralReasoningAgent(seed=1)
+    first_chain = agent.engage_reasoning_process(REQUEST)['agent_reasoning']['thought_chain']
+    second_chain = agent.engage_reasoning_process(
+        dict(REQUEST, radius_m=2000, include_long_context=False)
+    )['agent_reasoning']['thought_chain']
+    foreign = first_chain[-len(second_chain):]
+    
+    expected = {}
+    for thought in foreign:
+        expected[thought.reasoning_mode.value] = expected.get(thought.reasoning_mode.value, 0) + 1
+    
+    distribution = agent._self_reflect_and_validate(foreign)['reasoning_quality']['mode_distribution']
+    assert distribution == expected
+
+
+def test_confidence_calibration_reads_the_chain_it_is_given():
+    """Test that calibrating a chain from another run ignores the current run's buffer."""
+    agent = CentralReasoningAgent(seed=1)
+    first_chain = agent.engage_reasoning_process(REQUEST)['agent_reasoning']['thought_chain']
+    second_chain = agent.engage_reasoning_process(REQUEST)['agent_reasoning']['thought_chain']
+    
+    foreign = first_chain[:len(second_chain)]
+    confidences = [t.confidence for t in foreign]
+    calibration = agent._calibrate_confidence(foreign)
+    
+    assert calibration['mean_confidence'] == pytest.approx(sum(confidences) / len(confidences))
+    assert calibration['confidence_range'] == pytest.approx(max(confidences) - min(confidences))
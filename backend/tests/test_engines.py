@@ -0,0 +1,166 @@
+"""Unit tests for the analysis engines."""
+import copy
+import json
+
+import orjson
+import pytest
+
+from backend.agent.engines.data_processor import DataProcessingEngine
+from backend.agent.engines.ml_predictor import MLPredictionEngine
+from backend.agent.engines.report_generator import ExecutiveReportGenerator, ReportConfiguration
+from backend.agent.engines.market_intelligence import (
+    MarketIntelligenceEngine, RiskAssessmentEngine, SentimentAnalysisEngine
+)
+
+
+def _strip_timestamps(result):
+    """Drop wall-clock fields so seeded results can be compared."""
+    result['data_lineage'].pop('last_updated')
+    result['processing_results']['ingestion'].pop('ingestion_timestamp')
+    return result
+
+
+def test_data_processor_returns_all_stages():
+    """Test that the processing pipeline reports every stage."""
+    result = DataProcessingEngine().process_comprehensive_dataset(40.7831, -73.9712, 800)
+    
+    assert set(result['processing_results']) == {
+        'ingestion', 'validation', 'cleansing', 'enrichment', 'spatial', 'temporal', 'quality'
+    }
+    assert result['processing_summary']['records_processed'] == result['processing_results']['ingestion']['total_records']
+    assert 3 <= len(result['recommendations']) <= 5
+
+
+def test_data_processor_is_reproducible_with_seed():
+    """Test that seeded engines produce identical output despite parallel stages."""
+    first = DataProcessingEngine(seed=11).process_comprehensive_dataset(40.7831, -73.9712, 800)
+    second = DataProcessingEngine(seed=11).process_comprehensive_dataset(40.7831, -73.9712, 800)
+    
+    assert repr(_strip_timestamps(first)) == repr(_strip_timestamps(second))
+
+
+def test_enrichment_features_are_a_plain_dict():
+    """Test that enrichment features reach consumers as an ordinary, JSON-ready dict."""
+    result = DataProcessingEngine(seed=5).process_comprehensive_dataset(40.7831, -73.9712, 800)
+    features = result['processing_results']['enrichment']['enrichment_features']
+    
+    assert isinstance(features, dict)
+    assert json.loads(json.dumps(features)) == features
+
+
+def test_market_engines_are_reproducible_with_seed():
+    """Test that seeded market, sentiment and risk engines produce identical output."""
+    def run(seed):
+        market = MarketIntelligenceEngine(seed=seed).analyze_market_trends(40.7831, -73.9712, 800)
+        sentiment = SentimentAnalysisEngine(seed=seed).analyze_market_sentiment(40.7831, -73.9712)
+        risk = RiskAssessmentEngine(seed=seed).assess_investment_risks(40.7831, -73.9712, market)
+        return repr((market, sentiment, risk))
+    
+    assert run(3) == run(3)
+
+
+def test_market_trends_are_cached_for_nearby_queries():
+    """Test that queries within the cache grid reuse the earlier analysis."""
+    engine = MarketIntelligenceEngine(seed=1)
+    first = engine.analyze_market_trends(40.78312, -73.97121, 800)
+    
+    assert engine.analyze_market_trends(40.78314, -73.97119, 800) == first
+    assert engine.analyze_market_trends(40.78312, -73.97121, 400) != first
+
+
+def test_cached_market_analyses_are_isolated_from_callers():
+    """Test that mutating a returned analysis does not corrupt later cache hits."""
+    engine = MarketIntelligenceEngine(seed=1)
+    first = engine.analyze_market_trends(40.7831, -73.9712, 800)
+    expected = copy.deepcopy(first)
+    
+    first['predictions']['price_forecast'].clear()
+    hit = engine.analyze_market_trends(40.7831, -73.9712, 800)
+    hit['confidence_score'] = None
+    
+    assert engine.analyze_market_trends(40.7831, -73.9712, 800) == expected
+
+
+def test_market_trends_force_refresh_replaces_cached_analysis():
+    """Test that a forced refresh recomputes the analysis and caches the new result."""
+    engine = MarketIntelligenceEngine(seed=1)
+    first = engine.analyze_market_trends(40.7831, -73.9712, 800)
+    refreshed = engine.analyze_market_trends(40.7831, -73.9712, 800, force_refresh=True)
+    
+    assert refreshed != first
+    assert engine.analyze_market_trends(40.7831, -73.9712, 800) == refreshed
+
+
+def test_ml_prediction_suite_is_reproducible_with_seed():
+    """Test that seeded ML engines produce identical predictions."""
+    property_data = {'latitude': 40.7831, 'longitude': -73.9712, 'radius': 800}
+    first = MLPredictionEngine(seed=7).run_ml_prediction_suite(property_data)
+    second = MLPredictionEngine(seed=7).run_ml_prediction_suite(property_data)
+    
+    assert repr(first) == repr(second)
+
+
+def test_ml_prediction_suite_serializes_with_stdlib_json():
+    """Test that the suite output only carries JSON-native values."""
+    result = MLPredictionEngine(seed=1).run_ml_prediction_suite({})
+    
+    decoded = json.loads(json.dumps(result))
+    assert decoded['market_forecasts'].keys() == result['market_forecasts'].keys()
+
+
+def test_ml_metrics_are_sampled_per_run():
+    """Test that performance and confidence metrics are redrawn from the shared layouts on every run."""
+    engine = MLPredictionEngine(seed=7)
+    property_data = {'latitude': 40.7831, 'longitude': -73.9712, 'radius': 800}
+    first = engine.run_ml_prediction_suite(property_data)
+    second = engine.run_ml_prediction_suite(property_data)
+    
+    for key in ('model_performance', 'prediction_confidence'):
+        assert second[key] is not first[key]
+        assert second[key].keys() == first[key].keys()
+        assert second[key] != first[key]
+
+
+def test_ml_sampled_outputs_are_plain_containers():
+    """Test that layout-sampled ML outputs are ordinary, mutable dicts and lists."""
+    result = MLPredictionEngine(seed=7).run_ml_prediction_suite({})
+    confidence = result['prediction_confidence']
+    
+    for key in ('engineered_features', 'model_performance', 'prediction_confidence'):
+        assert isinstance(result[key], dict)
+    interval = confidence['prediction_intervals']['95%']
+    interval.append(0.0)
+    assert confidence['prediction_intervals']['95%'] is interval
+    assert json.loads(json.dumps(confidence)) == confidence
+
+
+def test_report_sections_are_reproducible_with_seed():
+    """Test that seeded report generators produce identical sections."""
+    def run(seed):
+        generator = ExecutiveReportGenerator(seed=seed)
+        return repr((generator._generate_executive_summary({}), generator._generate_market_analysis({})))
+    
+    assert run(4) == run(4)
+
+
+def test_compiled_report_serializes_without_fallbacks():
+    """Test that the compiled report holds only natively serializable values."""
+    config = ReportConfiguration(
+        report_type='investment_memo', detail_level='comprehensive', include_charts=True,
+        include_comparables=True, include_risk_analysis=True,
+        target_audience='institutional_investors', format_preference='markdown'
+    )
+    generator = ExecutiveReportGenerator(seed=2)
+    sections = {
+        'executive_summary': generator._generate_executive_summary({}),
+        'market_analysis': generator._generate_market_analysis({}),
+        'financial_analysis': None,
+        'risk_assessment': None,
+        'comparative_analysis': None,
+        'recommendations': None,
+        'visualizations': generator._generate_visualizations({}, config)
+    }
+    report = generator._compile_final_report(sections, config)
+    
+    assert orjson.loads(orjson.dumps(report))['appendices']['methodology']['analytical_framework']
+    assert 'market_analysis' in report and 'risk_assessment' not in report